@@ -0,0 +1,52 @@
+"""In-memory ports used by the benchmark scripts (no broker, deterministic data)."""
+
+from __future__ import annotations
+
+import sys
+import pathlib
+from datetime import datetime
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from tycherion.domain.portfolio.entities import PortfolioSnapshot, Position  # noqa: E402
+
+
+def symbols(n: int) -> list[str]:
+    return [f"SYM{i:05d}" for i in range(n)]
+
+
+class FakeMarketData:
+    """Random-walk OHLCV bars, seeded per symbol so runs are reproducible."""
+
+    def __init__(self, bars: int = 300, freq: str = "h") -> None:
+        self._bars = bars
+        self._freq = freq
+
+    def get_bars(self, symbol: str, timeframe: str, start: datetime, end: datetime):
+        import numpy as np
+        import pandas as pd
+
+        rng = np.random.default_rng(sum(map(ord, symbol)))
+        n = self._bars
+        close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+        return pd.DataFrame(
+            {
+                "time": pd.date_range(end=pd.Timestamp(end).floor("h"), periods=n, freq=self._freq),
+                "open": close + rng.normal(0.0, 0.2, n),
+                "high": close + rng.random(n),
+                "low": close - rng.random(n),
+                "close": close,
+                "tick_volume": rng.integers(1, 1000, n),
+                "spread": rng.integers(1, 5, n),
+                "real_volume": np.zeros(n, dtype=np.int64),
+            }
+        )
+
+
+def portfolio(held: list[str], equity: float = 100_000.0) -> PortfolioSnapshot:
+    return PortfolioSnapshot(
+        equity=equity,
+        positions={s: Position(symbol=s, quantity=10.0, price=100.0) for s in held},
+    )
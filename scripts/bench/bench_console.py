@@ -0,0 +1,85 @@
+"""Console renderer throughput: unbuffered vs buffered, in lines/second.
+
+Usage:
+    python scripts/bench/bench_console.py [--lines 50000] [--target devnull|file]
+
+Writes realistic audit/log, span-event and span-lifecycle lines through
+`ConsoleRenderer` with stdout redirected to the target. The sink is opened
+line-buffered, like stdout attached to a terminal or a runner's log pipe, so
+every unbuffered line costs one write syscall.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import _fakes  # noqa: F401  (puts src/ on sys.path)
+
+from tycherion.adapters.observability.otel.console_dev import ConsoleConfig, ConsoleRenderer
+from tycherion.ports.observability.types import Severity
+
+TRACE = "4bf92f3577b34da6a3ce929d0e0e4736"
+SPAN = "00f067aa0ba902b7"
+
+
+def _drive(renderer: ConsoleRenderer, lines: int) -> None:
+    # Mix roughly matching a pipeline cycle: mostly audit logs, some events and span lifecycle.
+    for i in range(lines // 4):
+        attrs = {"tycherion.channel": "audit", "symbol": f"SYM{i % 500:05d}", "stage": "trend_following", "score": 0.4213}
+        renderer.log(body="model.decided", severity=Severity.INFO, attributes=attrs, trace_id=TRACE, span_id=SPAN)
+        renderer.log(body="pipeline.signal_emitted", severity=Severity.INFO, attributes=attrs, trace_id=TRACE, span_id=SPAN)
+        renderer.span_event(name="tycherion.pipeline.stage_completed", attributes={"stage": "trend_following"}, trace_id=TRACE, span_id=SPAN)
+        if i % 2:
+            renderer.span_started(name="tycherion.allocator", attributes=None, trace_id=TRACE, span_id=SPAN)
+        else:
+            renderer.span_ended(name="tycherion.allocator", status="OK", duration_ms=1.2, trace_id=TRACE, span_id=SPAN, error=False)
+    renderer.flush()
+
+
+def run(buffered: bool, lines: int, path: str, repeat: int) -> float:
+    best = float("inf")
+    real_stdout = sys.stdout
+    for _ in range(repeat):
+        renderer = ConsoleRenderer(ConsoleConfig(enabled=True, buffered=buffered))
+        with open(path, "w", encoding="utf-8", buffering=1) as sink:
+            sys.stdout = sink
+            try:
+                t0 = time.perf_counter()
+                _drive(renderer, lines)
+                best = min(best, time.perf_counter() - t0)
+            finally:
+                sys.stdout = real_stdout
+    return lines / best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--lines", type=int, default=50_000)
+    ap.add_argument("--target", choices=("devnull", "file"), default="file")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    if args.target == "devnull":
+        path = os.devnull
+    else:
+        fd, path = tempfile.mkstemp(suffix=".log")
+        os.close(fd)
+
+    try:
+        before = run(False, args.lines, path, args.repeat)
+        after = run(True, args.lines, path, args.repeat)
+    finally:
+        if args.target == "file":
+            os.unlink(path)
+
+    print(f"unbuffered: {before:>12,.0f} lines/s")
+    print(f"buffered:   {after:>12,.0f} lines/s  ({after / before:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
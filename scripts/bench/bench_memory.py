@@ -0,0 +1,131 @@
+"""Memory/GC benchmark for hot-path domain value objects.
+
+Usage:
+    python scripts/bench/bench_memory.py [--symbols 10000]
+
+Builds one cycle's worth of per-symbol objects (3 indicator outputs, 2 model
+decisions and stage results, 1 signal) with the current slotted/frozen types
+and fixed-schema feature records, and with equivalent plain dataclasses and
+dict features (the previous layout). Reports traced memory, allocation
+count and a full `gc.collect()` time for each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict
+
+import _fakes
+
+from tycherion.domain.portfolio.entities import Signal
+from tycherion.domain.signals.entities import IndicatorOutput, ModelDecision, ModelStageResult
+from tycherion.domain.signals.features import StretchFeatures, TrendFeatures, VolatilityFeatures
+
+
+# Previous layout, for comparison.
+@dataclass
+class _IndicatorOutput:
+    score: float
+    features: Dict[str, float]
+
+
+@dataclass
+class _ModelDecision:
+    side: str
+    weight: float
+    confidence: float
+
+
+@dataclass
+class _ModelStageResult:
+    model_name: str
+    score: float
+
+
+@dataclass
+class _Signal:
+    symbol: str
+    signed: float
+    confidence: float = 1.0
+
+
+def build_slotted(symbols: list[str]) -> list[Any]:
+    out: list[Any] = []
+    for i, sym in enumerate(symbols):
+        x = (i % 97) / 97.0
+        out.append(
+            (
+                {
+                    "trend": IndicatorOutput(x, TrendFeatures(upper=1.0 + x, lower=1.0 - x)),
+                    "stretch": IndicatorOutput(-x, StretchFeatures(z=3.0 * x)),
+                    "volatility": IndicatorOutput(x / 2, VolatilityFeatures(atr=x)),
+                },
+                [ModelDecision("BUY", x, 0.7), ModelDecision("HOLD", 0.0, 0.4)],
+                [ModelStageResult("trend_following", x), ModelStageResult("mean_reversion", 0.0)],
+                Signal(sym, x, x),
+            )
+        )
+    return out
+
+
+def build_legacy(symbols: list[str]) -> list[Any]:
+    out: list[Any] = []
+    for i, sym in enumerate(symbols):
+        x = (i % 97) / 97.0
+        out.append(
+            (
+                {
+                    "trend": _IndicatorOutput(x, {"upper": 1.0 + x, "lower": 1.0 - x}),
+                    "stretch": _IndicatorOutput(-x, {"z": 3.0 * x}),
+                    "volatility": _IndicatorOutput(x / 2, {"atr": x}),
+                },
+                [_ModelDecision("BUY", x, 0.7), _ModelDecision("HOLD", 0.0, 0.4)],
+                [_ModelStageResult("trend_following", x), _ModelStageResult("mean_reversion", 0.0)],
+                _Signal(sym, x, x),
+            )
+        )
+    return out
+
+
+def measure(build: Callable[[list[str]], list[Any]], symbols: list[str]) -> tuple[int, int, float, float]:
+    # Construction time without tracemalloc overhead.
+    gc.collect()
+    t0 = time.perf_counter()
+    build(symbols)
+    build_s = time.perf_counter() - t0
+
+    gc.collect()
+    tracemalloc.start()
+    objs = build(symbols)
+    snap = tracemalloc.take_snapshot()
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = sum(stat.count for stat in snap.statistics("filename"))
+
+    t0 = time.perf_counter()
+    gc.collect()
+    gc_s = time.perf_counter() - t0
+    del objs
+    return size, count, build_s, gc_s
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--symbols", type=int, default=10_000)
+    args = ap.parse_args()
+
+    symbols = _fakes.symbols(args.symbols)
+    print(f"{args.symbols} symbols x 3 indicators")
+    print(f"{'layout':<10} {'traced MiB':>11} {'blocks':>10} {'build ms':>9} {'gc ms':>7}")
+    for label, build in (("legacy", build_legacy), ("slotted", build_slotted)):
+        size, count, build_s, gc_s = measure(build, symbols)
+        print(f"{label:<10} {size / 2**20:>11.2f} {count:>10,} {build_s * 1000:>9.1f} {gc_s * 1000:>7.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+"""Replay benchmark: re-run a recorded cycle (no broker) and time it.
+
+Usage:
+    python scripts/bench/bench_replay.py [--snapshot PATH] [--config PATH] [--repeat 20] [--symbols 200]
+
+With `--snapshot`, replays a cycle recorded by a live run with
+`application.snapshot.enabled: true` (use `--config` for the same config
+file). Without it, records a synthetic cycle over in-memory bars first.
+Reports snapshot load time and per-replay time (pipeline, allocator,
+balancer and order planning) over `--repeat` runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import _fakes
+
+from tycherion.adapters.observability.noop.noop_observability import NoopObservability
+from tycherion.application.plugins import registry
+from tycherion.application.pipeline.config import build_pipeline_config
+from tycherion.application.pipeline.service import ModelPipelineService
+from tycherion.application.replay.snapshot import CycleSnapshot, RecordingMarketData, SnapshotMarketData
+from tycherion.application.runmodes.replay import run_replay
+from tycherion.application.services.order_planner import build_orders
+from tycherion.shared.config import AppConfig, load_config
+
+
+def default_config() -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "timeframe": "H1",
+            "lookback_days": 15,
+            "application": {"models": {"pipeline": ["trend_following", "mean_reversion"]}},
+        }
+    )
+
+
+def record_synthetic(cfg: AppConfig, n_symbols: int, path: str, obs: NoopObservability) -> None:
+    syms = _fakes.symbols(n_symbols)
+    snapshot = CycleSnapshot(as_of=datetime.now(timezone.utc), timeframe=cfg.timeframe, lookback_days=cfg.lookback_days)
+    snapshot.coverage = syms
+    snapshot.universe_symbols = syms
+    snapshot.portfolio = _fakes.portfolio(syms[:3])
+    service = ModelPipelineService(
+        market_data=RecordingMarketData(_fakes.FakeMarketData(), snapshot),
+        model_registry=registry.MODELS,
+        indicator_picker=registry.pick_indicator_for,
+        timeframe=cfg.timeframe,
+        lookback_days=cfg.lookback_days,
+        playbook=cfg.application.playbook,
+    )
+    result = service.run(
+        universe_symbols=syms,
+        portfolio_snapshot=snapshot.portfolio,
+        pipeline_config=build_pipeline_config(cfg),
+        observability=obs,
+        as_of=snapshot.as_of,
+    )
+    target = registry.ALLOCATORS[cfg.application.portfolio.allocator].allocate(result.signals_by_symbol)
+    plan = registry.BALANCERS[cfg.application.portfolio.balancer].plan(
+        portfolio=snapshot.portfolio, target=target, threshold=cfg.application.portfolio.threshold_weight
+    )
+    build_orders(snapshot.portfolio, plan, cfg.trading, min_volume_fn=snapshot.record_min_volume(lambda s: 0.01))
+    snapshot.save(path)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--snapshot", default=None)
+    ap.add_argument("--config", default=None)
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--symbols", type=int, default=200, help="synthetic cycle size (without --snapshot)")
+    args = ap.parse_args()
+
+    obs = NoopObservability()
+    registry.auto_discover(observability=obs)
+    cfg = load_config(args.config) if args.config else default_config()
+
+    path = args.snapshot
+    if path is None:
+        path = tempfile.mkdtemp(prefix="tycherion-replay-") + "/cycle.npz"
+        record_synthetic(cfg, args.symbols, path, obs)
+        print(f"recorded synthetic cycle: {args.symbols} symbols -> {path}")
+
+    t0 = time.perf_counter()
+    snapshot = CycleSnapshot.load(path)
+    load_ms = (time.perf_counter() - t0) * 1000
+    service = ModelPipelineService(
+        market_data=SnapshotMarketData(snapshot),
+        model_registry=registry.MODELS,
+        indicator_picker=registry.pick_indicator_for,
+        timeframe=snapshot.timeframe,
+        lookback_days=snapshot.lookback_days,
+        playbook=cfg.application.playbook,
+    )
+
+    times: list[float] = []
+    orders = []
+    for _ in range(max(1, args.repeat)):
+        t0 = time.perf_counter()
+        orders = run_replay(cfg, snapshot, service, observability=obs)
+        times.append((time.perf_counter() - t0) * 1000)
+
+    print(f"snapshot: {len(snapshot.universe_symbols)} symbols, {len(snapshot.bars)} bar slices, as_of {snapshot.as_of.isoformat()}")
+    print(f"load: {load_ms:.1f} ms")
+    print(f"replay x{len(times)}: min {min(times):.1f} ms, median {statistics.median(times):.1f} ms, orders {len(orders)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,156 @@
+"""Startup benchmark: per-module import-time report and time-to-first-cycle.
+
+Usage:
+    python scripts/bench/bench_startup.py [--top 15] [--budget-ms 1500] [--discovery eager|lazy]
+
+The time-to-first-cycle probe runs in a fresh interpreter: imports, plugin
+discovery, one pipeline run over in-memory bars, allocation and balancing.
+Order planning is skipped because it needs the broker for volume limits.
+Exits with status 1 when the measured time exceeds the budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+IMPORT_TARGETS = (
+    "tycherion.bootstrap.main",
+    "tycherion.application.runmodes.live_multimodel",
+    "tycherion.domain.signals.entities",
+)
+HEAVY_PREFIXES = ("pandas", "numpy", "pydantic", "yaml", "MetaTrader5", "opentelemetry")
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    return env
+
+
+def import_report(module: str, top: int) -> None:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=_env(),
+    )
+    rows: list[tuple[int, int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        rows.append((int(parts[1]), int(parts[0]), parts[2].strip()))
+
+    if proc.returncode != 0:
+        print(f"\n== {module}: import failed ==\n{proc.stderr.strip().splitlines()[-1] if proc.stderr else ''}")
+        return
+
+    total = next((cum for cum, _, name in rows if name == module), 0)
+    heavy = sorted({name.split(".")[0] for _, _, name in rows if name.startswith(HEAVY_PREFIXES)})
+    print(f"\n== {module}: {total / 1000:.1f} ms, heavy deps loaded: {', '.join(heavy) or 'none'} ==")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cum, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cum / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+
+
+def first_cycle_child(discovery: str, n_symbols: int) -> None:
+    t0 = time.perf_counter()
+    sys.path.insert(0, str(ROOT / "scripts" / "bench"))
+    import _fakes
+
+    from tycherion.adapters.observability.noop.noop_observability import NoopObservability
+    from tycherion.application.plugins import registry
+    from tycherion.application.pipeline.config import PipelineConfig, PipelineStageConfig
+    from tycherion.application.pipeline.service import ModelPipelineService
+
+    t_import = time.perf_counter()
+    obs = NoopObservability()
+    stages = ["trend_following", "mean_reversion"]
+    if discovery == "lazy":
+        registry.discover_lazy(models=stages, allocators=["proportional"], balancers=["threshold"], observability=obs)
+    else:
+        registry.auto_discover(observability=obs)
+    t_discover = time.perf_counter()
+
+    syms = _fakes.symbols(n_symbols)
+    portfolio = _fakes.portfolio(syms[:3])
+    service = ModelPipelineService(
+        market_data=_fakes.FakeMarketData(),
+        model_registry=registry.MODELS,
+        indicator_picker=registry.pick_indicator_for,
+        timeframe="H1",
+        lookback_days=15,
+        playbook="default",
+    )
+    result = service.run(
+        universe_symbols=syms,
+        portfolio_snapshot=portfolio,
+        pipeline_config=PipelineConfig(stages=[PipelineStageConfig(name=s) for s in stages]),
+        observability=obs,
+    )
+    target = registry.ALLOCATORS["proportional"].allocate(result.signals_by_symbol)
+    registry.BALANCERS["threshold"].plan(portfolio=portfolio, target=target, threshold=0.25)
+    t_cycle = time.perf_counter()
+
+    print(
+        json.dumps(
+            {
+                "import_ms": (t_import - t0) * 1000,
+                "discover_ms": (t_discover - t_import) * 1000,
+                "cycle_ms": (t_cycle - t_discover) * 1000,
+            }
+        )
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--top", type=int, default=15)
+    ap.add_argument("--budget-ms", type=float, default=1500.0, help="time-to-first-cycle budget")
+    ap.add_argument("--discovery", choices=("eager", "lazy"), default="lazy")
+    ap.add_argument("--symbols", type=int, default=20)
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        first_cycle_child(args.discovery, args.symbols)
+        return 0
+
+    for module in IMPORT_TARGETS:
+        import_report(module, args.top)
+
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, __file__, "--child", "--discovery", args.discovery, "--symbols", str(args.symbols)],
+        capture_output=True,
+        text=True,
+        env=_env(),
+    )
+    wall_ms = (time.perf_counter() - t0) * 1000
+    if proc.returncode != 0:
+        print(proc.stderr)
+        return proc.returncode
+
+    phases = json.loads(proc.stdout.strip().splitlines()[-1])
+    print(f"\n== time-to-first-cycle ({args.discovery} discovery, {args.symbols} symbols) ==")
+    print(f"process wall: {wall_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    for k, v in phases.items():
+        print(f"  {k}: {v:.1f}")
+    if wall_ms > args.budget_ms:
+        print("OVER BUDGET")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
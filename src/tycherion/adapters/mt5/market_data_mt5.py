@@ -1,32 +1,72 @@
 from __future__ import annotations
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict
+from typing import Dict, List
 import pandas as pd
 import MetaTrader5 as mt5
+from tycherion.domain.market.columns import BarColumns
+from tycherion.domain.market.resampling import TIMEFRAME_MINUTES
 from tycherion.ports.market_data import MarketDataPort
 
-_TF_MAP: Dict[str, int] = {
-    "M1": mt5.TIMEFRAME_M1,
-    "M5": mt5.TIMEFRAME_M5,
-    "M15": mt5.TIMEFRAME_M15,
-    "M30": mt5.TIMEFRAME_M30,
-    "H1": mt5.TIMEFRAME_H1,
-    "H4": mt5.TIMEFRAME_H4,
-    "D1": mt5.TIMEFRAME_D1,
-}
+# Supported timeframes come from the domain table (the cache, the sanity
+# checks and shared-bar sizing read bar sizes there); MT5 names its
+# constants after them.
+_TF_MAP: Dict[str, int] = {tf: getattr(mt5, f"TIMEFRAME_{tf}") for tf in TIMEFRAME_MINUTES}
+
+_COLUMNS = ["time", "open", "high", "low", "close", "tick_volume", "spread", "real_volume"]
+
+# The MetaTrader5 module is not safe for concurrent calls; bars fetch threads
+# (`schedule.fetch_workers`) take turns.
+_MT5_LOCK = threading.Lock()
+
+
+@contextmanager
+def _mt5_session(timeout: float | None, symbol: str):
+    """Hold `_MT5_LOCK`, giving up after `timeout` seconds with `TimeoutError`
+    (a hung call holds it; callers queued behind it report a timeout)."""
+    if not _MT5_LOCK.acquire(timeout=-1 if timeout is None else timeout):
+        raise TimeoutError(f"MT5 session busy for {timeout}s ({symbol})")
+    try:
+        yield
+    finally:
+        _MT5_LOCK.release()
+
 
 class MT5MarketData(MarketDataPort):
-    def get_bars(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame:
+    def __init__(self, lock_timeout: float | None = None) -> None:
+        # Longest wait for the MT5 session (`schedule.fetch_timeout_seconds`).
+        self.lock_timeout = lock_timeout
+
+    def warm(self, symbols: List[str], timeframe: str) -> None:
+        """Select newly covered symbols so the terminal starts syncing their history."""
+        _ = timeframe
+        with _mt5_session(self.lock_timeout, "warm"):
+            for symbol in symbols:
+                mt5.symbol_select(symbol, True)
+
+    def _rates(self, symbol: str, timeframe: str, start: datetime, end: datetime):
         tf = _TF_MAP.get(timeframe.upper())
         if tf is None:
             raise ValueError(f"Unsupported timeframe: {timeframe}")
-        rates = mt5.copy_rates_range(
-            symbol, tf,
-            start.astimezone(timezone.utc),
-            end.astimezone(timezone.utc)
-        )
+        with _mt5_session(self.lock_timeout, symbol):
+            return mt5.copy_rates_range(
+                symbol, tf,
+                start.astimezone(timezone.utc),
+                end.astimezone(timezone.utc)
+            )
+
+    def get_bar_columns(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> BarColumns:
+        """Bars as views over the `copy_rates_range` array (time: epoch seconds)."""
+        rates = self._rates(symbol, timeframe, start, end)
+        if rates is None or len(rates) == 0:
+            return BarColumns.empty_like()
+        return BarColumns(rates)
+
+    def get_bars(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame:
+        rates = self._rates(symbol, timeframe, start, end)
         if rates is None or len(rates) == 0:
-            return pd.DataFrame(columns=["time","open","high","low","close","tick_volume","spread","real_volume"])
+            return pd.DataFrame(columns=_COLUMNS)
         df = pd.DataFrame(rates)
         df["time"] = pd.to_datetime(df["time"], unit="s", utc=True)
         return df
\ No newline at end of file
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import atexit
 from dataclasses import dataclass
-from datetime import datetime
 import sys
+import threading
+import time
 from typing import Any, Mapping
 
 from tycherion.ports.observability.types import Severity
@@ -13,11 +15,25 @@ class ConsoleConfig:
     enabled: bool = True
     min_severity: Severity = Severity.INFO
     show_span_lifecycle: bool = True
+    # Buffered mode: lines are batched and written with a single stdout write
+    # when the flush interval elapses, the batch is full, or a root span ends.
+    buffered: bool = False
+    flush_interval_s: float = 0.5
+    max_batch_lines: int = 512
 
 
 class ConsoleRenderer:
     def __init__(self, cfg: ConsoleConfig) -> None:
         self._cfg = cfg
+        self._ts_sec = -1
+        self._ts_str = ""
+        self._lines: list[str] = []
+        self._lock = threading.Lock()
+        # Held across the stdout write so concurrent flushes keep batch order.
+        self._write_lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+        if cfg.buffered:
+            atexit.register(self.flush)
         self._rank = {
             Severity.TRACE: 0,
             Severity.DEBUG: 10,
@@ -38,7 +54,53 @@ class ConsoleRenderer:
         return hex_id[:8]
 
     def _ts(self) -> str:
-        return datetime.now().strftime("%H:%M:%S")
+        # Second resolution: format once per second, not once per line.
+        sec = int(time.time())
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        return self._ts_str
+
+    def write_line(self, line: str) -> None:
+        """Write one output line, directly or through the batch buffer."""
+        if not self._cfg.buffered:
+            print(line, file=sys.stdout)
+            return
+        with self._lock:
+            self._lines.append(line)
+            full = len(self._lines) >= self._cfg.max_batch_lines
+        if self._flusher is None:
+            self._start_flusher()
+        if full:
+            self.flush()
+
+    def _start_flusher(self) -> None:
+        # One daemon thread for the renderer's lifetime; a Timer per batch costs
+        # more than the writes it saves.
+        interval = max(0.01, float(self._cfg.flush_interval_s))
+
+        def _loop() -> None:
+            while True:
+                time.sleep(interval)
+                self.flush()
+
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=_loop, name="tycherion-console-flush", daemon=True)
+            self._flusher.start()
+
+    def flush(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                lines, self._lines = self._lines, []
+            if not lines:
+                return
+            try:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+            except Exception:
+                pass
 
     def _fmt_kv(self, attrs: Mapping[str, Any] | None) -> str:
         if not attrs:
@@ -61,8 +123,7 @@ class ConsoleRenderer:
         meta_s = (" | " + " ".join(meta)) if meta else ""
         attrs_s = self._fmt_kv(attributes)
         attrs_s = (attrs_s + " ") if attrs_s else ""
-        line = f"{self._ts()} [{severity.value}] {attrs_s}{body}{meta_s}"
-        print(line, file=sys.stdout)
+        self.write_line(f"{self._ts()} [{severity.value}] {attrs_s}{body}{meta_s}")
 
     def span_started(self, *, name: str, attributes: Mapping[str, Any] | None, trace_id: str, span_id: str) -> None:
         if not (self._cfg.enabled and self._cfg.show_span_lifecycle):
@@ -70,16 +131,31 @@ class ConsoleRenderer:
         meta = f"trace={self._short(trace_id)} span={self._short(span_id)}"
         attrs_s = self._fmt_kv(attributes)
         attrs_s = (attrs_s + " ") if attrs_s else ""
-        print(f"{self._ts()} [SPAN] {attrs_s}{name} started | {meta}", file=sys.stdout)
+        self.write_line(f"{self._ts()} [SPAN] {attrs_s}{name} started | {meta}")
 
-    def span_ended(self, *, name: str, status: str, duration_ms: float | None, trace_id: str, span_id: str, error: bool) -> None:
+    def span_ended(
+        self,
+        *,
+        name: str,
+        status: str,
+        duration_ms: float | None,
+        trace_id: str,
+        span_id: str,
+        error: bool,
+        dropped_events: int = 0,
+        root: bool = False,
+    ) -> None:
         if not (self._cfg.enabled and self._cfg.show_span_lifecycle):
             return
         dur = f"{duration_ms:.1f}ms" if duration_ms is not None else "?"
         # If error, print full trace_id to make backend lookup easy.
         trace_meta = trace_id if error else self._short(trace_id)
         meta = f"trace={trace_meta} span={self._short(span_id)}"
-        print(f"{self._ts()} [SPAN] {name} ended status={status} dur={dur} | {meta}", file=sys.stdout)
+        dropped = f" dropped_events={dropped_events}" if dropped_events else ""
+        self.write_line(f"{self._ts()} [SPAN] {name} ended status={status} dur={dur}{dropped} | {meta}")
+        if root and self._cfg.buffered:
+            # End of a cycle: make its output visible without waiting for the timer.
+            self.flush()
 
     def span_event(self, *, name: str, attributes: Mapping[str, Any] | None, trace_id: str | None, span_id: str | None) -> None:
         # Span events are usually info-ish, but we still respect min_severity (INFO).
@@ -94,4 +170,4 @@ class ConsoleRenderer:
         meta_s = (" | " + " ".join(meta)) if meta else ""
         attrs_s = self._fmt_kv(attributes)
         attrs_s = (attrs_s + " ") if attrs_s else ""
-        print(f"{self._ts()} [EVT] {attrs_s}{name}{meta_s}", file=sys.stdout)
+        self.write_line(f"{self._ts()} [EVT] {attrs_s}{name}{meta_s}")
@@ -83,7 +83,7 @@ class OtelLogger(LoggerPort):
             try:
                 import json
 
-                print(json.dumps(payload, ensure_ascii=False))
+                self._console.write_line(json.dumps(payload, ensure_ascii=False))
             except Exception:
                 # fallback to console if JSON fails
                 self._console.log(
@@ -6,6 +6,11 @@ from typing import Any
 from tycherion.adapters.observability.otel.console_dev import ConsoleConfig, ConsoleRenderer
 from tycherion.adapters.observability.otel.otel_export import build_metric_reader, build_span_exporter
 from tycherion.adapters.observability.otel.otel_resource import build_resource
+from tycherion.adapters.observability.otel.otel_sampling import (
+    TailSamplingSpanProcessor,
+    build_sampler,
+    tail_sampling_enabled,
+)
 from tycherion.adapters.observability.otel.otel_logs import OtelLoggerProvider
 from tycherion.adapters.observability.otel.otel_metrics import OtelMeterProvider
 from tycherion.adapters.observability.otel.otel_traces import OtelTracerProvider
@@ -30,6 +35,8 @@ class OtelObservabilityConfig:
     console_show_span_lifecycle: bool = True
     log_format: str = "pretty"  # pretty | json
     console_channels: set[str] | None = None
+    console_buffered: bool = False
+    console_flush_interval_ms: int = 500
 
     # OTLP (Collector/Alloy)
     otlp_enabled: bool = False
@@ -38,6 +45,12 @@ class OtelObservabilityConfig:
     otlp_headers: dict[str, str] | str | None = None
     otlp_insecure: bool | None = None  # None => infer from scheme (http->True, https->False)
 
+    # Trace sampling / span budget
+    trace_sample_ratio: float = 1.0
+    trace_keep_errors: bool = True  # tail rule: always export traces with errors
+    trace_keep_slow_ms: float | None = None  # tail rule: always export root spans slower than this
+    span_max_events: int | None = 128  # None => unlimited
+
 
 class OtelObservability(ObservabilityPort):
     def __init__(self, cfg: OtelObservabilityConfig) -> None:
@@ -48,6 +61,8 @@ class OtelObservability(ObservabilityPort):
                 enabled=bool(cfg.console_enabled),
                 min_severity=cfg.console_min_severity,
                 show_span_lifecycle=bool(cfg.console_show_span_lifecycle),
+                buffered=bool(cfg.console_buffered),
+                flush_interval_s=max(0.01, float(cfg.console_flush_interval_ms) / 1000.0),
             )
         )
         allowed_channels = set(cfg.console_channels) if cfg.console_channels else None
@@ -55,7 +70,7 @@ class OtelObservability(ObservabilityPort):
         try:
             from opentelemetry import metrics as otel_metrics_api  # type: ignore
             from opentelemetry import trace as otel_trace  # type: ignore
-            from opentelemetry.sdk.trace import TracerProvider  # type: ignore
+            from opentelemetry.sdk.trace import SpanLimits, TracerProvider  # type: ignore
             from opentelemetry.sdk.trace.export import BatchSpanProcessor  # type: ignore
             from opentelemetry.sdk.metrics import MeterProvider  # type: ignore
         except Exception as e:
@@ -71,12 +86,28 @@ class OtelObservability(ObservabilityPort):
             deployment_env=cfg.deployment_env,
         )
 
-        tracer_provider = TracerProvider(resource=resource)
+        tail_sampling = tail_sampling_enabled(
+            cfg.trace_sample_ratio, cfg.trace_keep_errors, cfg.trace_keep_slow_ms
+        )
+        max_events = int(cfg.span_max_events) if cfg.span_max_events is not None else None
+        tracer_provider = TracerProvider(
+            resource=resource,
+            sampler=build_sampler(cfg.trace_sample_ratio, tail_sampling=tail_sampling),
+            span_limits=SpanLimits(max_events=max_events if max_events is not None else SpanLimits.UNSET),
+        )
 
         if cfg.otlp_enabled:
             span_exporter = build_span_exporter(cfg.otlp_endpoint, cfg.otlp_protocol, cfg.otlp_headers, cfg.otlp_insecure)
             if span_exporter is not None:
-                tracer_provider.add_span_processor(BatchSpanProcessor(span_exporter))
+                processor: Any = BatchSpanProcessor(span_exporter)
+                if tail_sampling:
+                    processor = TailSamplingSpanProcessor(
+                        processor,
+                        ratio=cfg.trace_sample_ratio,
+                        keep_errors=cfg.trace_keep_errors,
+                        keep_slow_ms=cfg.trace_keep_slow_ms,
+                    )
+                tracer_provider.add_span_processor(processor)
 
         try:
             otel_trace.set_tracer_provider(tracer_provider)
@@ -88,6 +119,7 @@ class OtelObservability(ObservabilityPort):
             tracer_provider,
             schema_version=cfg.schema_version,
             console=self._console,
+            max_span_events=max_events,
         )
 
         metric_reader = None
@@ -133,6 +165,7 @@ class OtelObservability(ObservabilityPort):
         return self._metrics
 
     def force_flush(self) -> None:
+        self._console.flush()
         try:
             self._sdk_tracer_provider.force_flush()
         except Exception:
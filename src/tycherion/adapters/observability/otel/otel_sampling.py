@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+# Same bound used by the SDK's TraceIdRatioBased sampler, so head and tail
+# decisions agree on which trace ids fall inside the ratio.
+_TRACE_ID_LIMIT = (1 << 64) - 1
+
+
+def _ratio_bound(ratio: float) -> int:
+    return round(max(0.0, min(1.0, float(ratio))) * (_TRACE_ID_LIMIT + 1))
+
+
+def tail_sampling_enabled(ratio: float, keep_errors: bool, keep_slow_ms: float | None) -> bool:
+    """Tail rules only matter when the ratio would otherwise drop traces."""
+    if float(ratio) >= 1.0:
+        return False
+    return bool(keep_errors) or keep_slow_ms is not None
+
+
+def build_sampler(ratio: float, *, tail_sampling: bool):
+    """Build the head sampler installed on the SDK TracerProvider.
+
+    With tail sampling enabled every span must be recorded, because the keep/drop
+    decision is only known when the root span ends. Without it, plain ratio
+    sampling is cheaper: unsampled spans are non-recording from the start.
+    """
+
+    from opentelemetry.sdk.trace.sampling import (  # type: ignore
+        ALWAYS_ON,
+        ParentBased,
+        TraceIdRatioBased,
+    )
+
+    ratio = max(0.0, min(1.0, float(ratio)))
+    if tail_sampling or ratio >= 1.0:
+        return ParentBased(ALWAYS_ON)
+    return ParentBased(TraceIdRatioBased(ratio))
+
+
+class TailSamplingSpanProcessor:
+    """Buffer finished spans per trace and forward whole traces downstream.
+
+    The decision is taken when the local root span ends (one run cycle, in
+    practice). A trace is kept when any of the rules match:
+
+    - the trace id falls inside `ratio`;
+    - `keep_errors` is on and a span has ERROR status or recorded an exception;
+    - `keep_slow_ms` is set and the root span lasted at least that long.
+
+    Duck-types the SDK `SpanProcessor` interface so this module stays importable
+    without `opentelemetry-sdk`.
+    """
+
+    def __init__(
+        self,
+        delegate: Any,
+        *,
+        ratio: float,
+        keep_errors: bool = True,
+        keep_slow_ms: float | None = None,
+        max_pending_traces: int = 512,
+    ) -> None:
+        self._delegate = delegate
+        self._bound = _ratio_bound(ratio)
+        self._keep_errors = bool(keep_errors)
+        self._keep_slow_ns = int(float(keep_slow_ms) * 1_000_000) if keep_slow_ms is not None else None
+        self._max_pending = max(1, int(max_pending_traces))
+        self._pending: OrderedDict[int, list[Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.kept_traces = 0
+        self.dropped_traces = 0
+        self.evicted_traces = 0
+
+    def on_start(self, span: Any, parent_context: Any = None) -> None:
+        self._delegate.on_start(span, parent_context=parent_context)
+
+    def _on_ending(self, span: Any) -> None:
+        return None
+
+    def on_end(self, span: Any) -> None:
+        try:
+            trace_id = int(span.context.trace_id)
+        except Exception:
+            return None
+
+        parent = getattr(span, "parent", None)
+        is_root = parent is None or bool(getattr(parent, "is_remote", False))
+
+        with self._lock:
+            spans = self._pending.get(trace_id)
+            if spans is None:
+                spans = []
+                self._pending[trace_id] = spans
+            spans.append(span)
+
+            if not is_root:
+                # Bound memory if roots never end (crashed cycle, leaked context).
+                while len(self._pending) > self._max_pending:
+                    self._pending.popitem(last=False)
+                    self.evicted_traces += 1
+                return None
+
+            del self._pending[trace_id]
+
+        if self._should_keep(trace_id, span, spans):
+            self.kept_traces += 1
+            for s in spans:
+                self._delegate.on_end(s)
+        else:
+            self.dropped_traces += 1
+
+    def _should_keep(self, trace_id: int, root: Any, spans: list[Any]) -> bool:
+        if (trace_id & _TRACE_ID_LIMIT) < self._bound:
+            return True
+
+        if self._keep_slow_ns is not None:
+            start = getattr(root, "start_time", None)
+            end = getattr(root, "end_time", None)
+            if start is not None and end is not None and (end - start) >= self._keep_slow_ns:
+                return True
+
+        if self._keep_errors:
+            for s in spans:
+                status = getattr(s, "status", None)
+                code = getattr(getattr(status, "status_code", None), "name", None)
+                if code == "ERROR":
+                    return True
+                if any(getattr(e, "name", None) == "exception" for e in (getattr(s, "events", None) or ())):
+                    return True
+
+        return False
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._pending.clear()
+        self._delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        # Pending (root not ended) traces are not decided yet; only flush downstream.
+        return bool(self._delegate.force_flush(timeout_millis))
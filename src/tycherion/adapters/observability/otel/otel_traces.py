@@ -40,10 +40,14 @@ class OtelSpan(SpanPort):
         *,
         schema_version: str,
         console: ConsoleRenderer,
+        max_events: int | None = None,
     ) -> None:
         self._span = span
         self._schema_version = schema_version
         self._console = console
+        self._max_events = max_events
+        self._events_count = 0
+        self._dropped_events = 0
 
         self._trace_id_hex = _hex_trace_id(span) or None
         self._span_id_hex = _hex_span_id(span) or None
@@ -66,6 +70,10 @@ class OtelSpan(SpanPort):
     def start_ns(self) -> int:
         return self._start_ns
 
+    @property
+    def dropped_events(self) -> int:
+        return self._dropped_events
+
     def set_attribute(self, key: str, value: object) -> None:
         try:
             self._span.set_attribute(key, value)
@@ -82,6 +90,12 @@ class OtelSpan(SpanPort):
         return attrs
 
     def add_event(self, name: str, attributes: Attributes | None = None) -> None:
+        # Per-span event budget: once exhausted, events are only counted.
+        if self._max_events is not None and self._events_count >= self._max_events:
+            self._dropped_events += 1
+            return None
+        self._events_count += 1
+
         attrs = self._decorate_event_attrs(attributes)
 
         try:
@@ -130,10 +144,12 @@ class OtelTracer(TracerPort):
         *,
         schema_version: str,
         console: ConsoleRenderer,
+        max_span_events: int | None = None,
     ) -> None:
         self._tracer = tracer
         self._schema_version = schema_version
         self._console = console
+        self._max_span_events = max_span_events
 
     def _decorate_span_attrs(self, attributes: Attributes | None) -> dict[str, Any]:
         attrs: dict[str, Any] = dict(attributes or {})
@@ -144,6 +160,10 @@ class OtelTracer(TracerPort):
     def start_as_current_span(self, name: str, attributes: Attributes | None = None):
         attrs = self._decorate_span_attrs(attributes)
 
+        # Root by the parent context, not the span object: spans that are not
+        # sampled (NonRecordingSpan) have no `parent` attribute.
+        root = not otel_trace.get_current_span().get_span_context().is_valid
+
         start_ns = time.time_ns()
         with self._tracer.start_as_current_span(name, attributes=attrs) as span:
             trace_id_hex = _hex_trace_id(span) or ""
@@ -153,6 +173,7 @@ class OtelTracer(TracerPort):
                 span,
                 schema_version=self._schema_version,
                 console=self._console,
+                max_events=self._max_span_events,
             )
             self._console.span_started(
                 name=name,
@@ -166,6 +187,9 @@ class OtelTracer(TracerPort):
                 end_ns = time.time_ns()
                 duration_ms = (end_ns - start_ns) / 1_000_000
                 error = wrapped.status == "ERROR"
+                dropped = wrapped.dropped_events
+                if dropped:
+                    wrapped.set_attribute(semconv.ATTR_SPAN_DROPPED_EVENTS, int(dropped))
                 self._console.span_ended(
                     name=name,
                     status=wrapped.status,
@@ -173,6 +197,8 @@ class OtelTracer(TracerPort):
                     trace_id=trace_id_hex,
                     span_id=span_id_hex,
                     error=error,
+                    dropped_events=dropped,
+                    root=root,
                 )
 
 
@@ -183,10 +209,12 @@ class OtelTracerProvider(TracerProviderPort):
         *,
         schema_version: str,
         console: ConsoleRenderer,
+        max_span_events: int | None = None,
     ) -> None:
         self._provider = provider
         self._schema_version = schema_version
         self._console = console
+        self._max_span_events = max_span_events
 
     def get_tracer(self, name: str, version: str | None = None) -> TracerPort:
         tracer = self._provider.get_tracer(name, version)
@@ -194,4 +222,5 @@ class OtelTracerProvider(TracerProviderPort):
             tracer,
             schema_version=self._schema_version,
             console=self._console,
+            max_span_events=self._max_span_events,
         )
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tycherion.ports.market_data import MarketDataPort
+
+# Column layout of every slot (time in epoch seconds, all float64).
+COLUMNS: Tuple[str, ...] = ("time", "open", "high", "low", "close", "tick_volume", "spread", "real_volume")
+
+# Header (int64): seqlock version, slots, capacity, columns, used slots
+# (high-water mark), index JSON length, then (rows, generation) per slot.
+# The index is a JSON list of [symbol, timeframe] per slot; null marks a
+# freed slot, reused by the next new key.
+_H_VERSION, _H_SLOTS, _H_CAPACITY, _H_COLS, _H_USED, _H_INDEX_LEN = range(6)
+_H_FIXED = 8
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # Readers are spawned from the creator and share its resource tracker, so
+    # the attach-time registration is the creator's own and `unlink` clears it.
+    return shared_memory.SharedMemory(name=name)
+
+
+def _index_bytes(slots: int) -> int:
+    return 256 + 96 * slots
+
+
+class SharedBarStore:
+    """Bars for many (symbol, timeframe) pairs in shared memory.
+
+    Two segments: a header (seqlock version, per-slot row count and
+    generation, JSON index of slot keys) and a data block of fixed-layout
+    float64 slots, `len(COLUMNS) x capacity` each. One process creates and
+    writes the store (`create`); any number attach read-only (`attach`) and
+    get NumPy views into the block without copying.
+
+    Consistency: writes bump the header version to odd and back to even;
+    readers retry until they see the same even version before and after
+    reading. Appends only write past a slot's published row count, so views
+    taken earlier stay valid. Replacing, compacting or freeing a slot bumps
+    its generation; views from an older generation must not be reused.
+    """
+
+    __slots__ = ("name", "slots", "capacity", "_owner", "_hdr_shm", "_data_shm", "_hdr", "_data", "_index", "_index_version")
+
+    def __init__(self, name: str, hdr: shared_memory.SharedMemory, data: shared_memory.SharedMemory, owner: bool) -> None:
+        self.name = name
+        self._owner = owner
+        self._hdr_shm = hdr
+        self._data_shm = data
+        head = np.ndarray((_H_FIXED,), dtype=np.int64, buffer=hdr.buf)
+        self.slots = int(head[_H_SLOTS])
+        self.capacity = int(head[_H_CAPACITY])
+        self._hdr = np.ndarray((_H_FIXED + 2 * self.slots,), dtype=np.int64, buffer=hdr.buf)
+        self._data = np.ndarray((self.slots, len(COLUMNS), self.capacity), dtype=np.float64, buffer=data.buf)
+        self._index: Dict[Tuple[str, str], int] = {}
+        self._index_version = -1
+
+    @classmethod
+    def create(cls, slots: int, capacity: int, name: str | None = None) -> "SharedBarStore":
+        name = name or f"tyb-{uuid.uuid4().hex[:12]}"
+        hdr_size = 8 * (_H_FIXED + 2 * slots) + _index_bytes(slots)
+        hdr = shared_memory.SharedMemory(name=f"{name}-h", create=True, size=hdr_size)
+        data = shared_memory.SharedMemory(name=f"{name}-d", create=True, size=8 * slots * len(COLUMNS) * capacity)
+        head = np.ndarray((_H_FIXED + 2 * slots,), dtype=np.int64, buffer=hdr.buf)
+        head[:] = 0
+        head[_H_SLOTS], head[_H_CAPACITY], head[_H_COLS] = slots, capacity, len(COLUMNS)
+        return cls(name, hdr, data, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedBarStore":
+        return cls(name, _attach(f"{name}-h"), _attach(f"{name}-d"), owner=False)
+
+    # -- reading -----------------------------------------------------------
+
+    @property
+    def version(self) -> int:
+        return int(self._hdr[_H_VERSION])
+
+    def keys(self) -> List[Tuple[str, str]]:
+        self._refresh_index()
+        return list(self._index)
+
+    def read(self, symbol: str, timeframe: str) -> Tuple[np.ndarray, int] | None:
+        """(`len(COLUMNS) x rows` view, generation) for a slot, or None.
+
+        The view shares memory with the store: do not write to it.
+        """
+        key = (symbol, timeframe.upper())
+        while True:
+            v1 = self.version
+            if v1 & 1:
+                time.sleep(0)
+                continue
+            self._refresh_index()
+            slot = self._index.get(key)
+            if slot is None:
+                out = None
+            else:
+                rows = int(self._hdr[_H_FIXED + 2 * slot])
+                gen = int(self._hdr[_H_FIXED + 2 * slot + 1])
+                view = self._data[slot, :, :rows]
+                view.flags.writeable = False
+                out = (view, gen)
+            if self.version == v1:
+                return out
+
+    def _refresh_index(self) -> None:
+        v = self.version
+        if v == self._index_version:
+            return
+        n = int(self._hdr[_H_INDEX_LEN])
+        start = 8 * (_H_FIXED + 2 * self.slots)
+        raw = bytes(self._hdr_shm.buf[start:start + n])
+        if self.version != v or v & 1:
+            return  # writer mid-update; caller retries
+        self._index = {(k[0], k[1]): i for i, k in enumerate(json.loads(raw or b"[]")) if k is not None}
+        self._index_version = v
+
+    # -- writing (creator only) ----------------------------------------------
+
+    def write(self, symbol: str, timeframe: str, df: pd.DataFrame, *, append: bool = False) -> None:
+        """Store `df` bars for a key: replace the slot, or with `append` add
+        bars newer than the last stored one (the last stored bar is rewritten
+        when `df` has it again, since it may still have been forming).
+        """
+        if not self._owner:
+            raise PermissionError("SharedBarStore attached read-only")
+        block = _to_block(df)
+        key = (symbol, timeframe.upper())
+        self._refresh_index()
+        slot = self._index.get(key)
+
+        self._begin()
+        try:
+            if slot is None:
+                slot = self._add_slot(key)
+            base = _H_FIXED + 2 * slot
+            rows = int(self._hdr[base])
+            data = self._data[slot]
+            if append and rows:
+                last = data[0, rows - 1]
+                first_new = int(np.searchsorted(block[0], last, side="left"))
+                block = block[:, first_new:]
+                # Drop stored bars the new data overlaps (at most the forming one).
+                rows = int(np.searchsorted(data[0, :rows], block[0, 0], side="left")) if block.shape[1] else rows
+            else:
+                rows = 0
+                self._hdr[base + 1] += 1
+
+            n = block.shape[1]
+            if n > self.capacity:
+                block, n = block[:, -self.capacity:], self.capacity
+            if rows + n > self.capacity:
+                # Full: keep the newest bars at the front (invalidates old views).
+                keep = self.capacity - n
+                data[:, :keep] = data[:, rows - keep:rows]
+                rows = keep
+                self._hdr[base + 1] += 1
+            data[:, rows:rows + n] = block
+            self._hdr[base] = rows + n
+        finally:
+            self._end()
+
+    def remove(self, keys: Iterable[Tuple[str, str]]) -> int:
+        """Free the slots of `keys` for reuse; returns how many were held."""
+        if not self._owner:
+            raise PermissionError("SharedBarStore attached read-only")
+        self._refresh_index()
+        gone = [k for k in {(s, tf.upper()) for s, tf in keys} if k in self._index]
+        if not gone:
+            return 0
+        self._begin()
+        try:
+            for key in gone:
+                base = _H_FIXED + 2 * self._index.pop(key)
+                self._hdr[base] = 0
+                self._hdr[base + 1] += 1
+            self._write_index(int(self._hdr[_H_USED]))
+        finally:
+            self._end()
+        return len(gone)
+
+    def _add_slot(self, key: Tuple[str, str]) -> int:
+        used = int(self._hdr[_H_USED])
+        taken = set(self._index.values())
+        slot = next((i for i in range(used) if i not in taken), used)
+        if slot >= self.slots:
+            raise MemoryError(f"SharedBarStore full ({self.slots} slots)")
+        self._index[key] = slot
+        self._write_index(max(used, slot + 1))
+        return slot
+
+    def _write_index(self, used: int) -> None:
+        keys: List[List[str] | None] = [None] * used
+        for k, i in self._index.items():
+            keys[i] = list(k)
+        raw = json.dumps(keys).encode("utf-8")
+        if len(raw) > _index_bytes(self.slots):
+            raise MemoryError("SharedBarStore index region full")
+        start = 8 * (_H_FIXED + 2 * self.slots)
+        self._hdr_shm.buf[start:start + len(raw)] = raw
+        self._hdr[_H_INDEX_LEN] = len(raw)
+        self._hdr[_H_USED] = used
+
+    def _begin(self) -> None:
+        self._hdr[_H_VERSION] += 1  # odd: write in progress
+
+    def _end(self) -> None:
+        self._hdr[_H_VERSION] += 1
+        self._index_version = int(self._hdr[_H_VERSION])
+
+    def refresh(
+        self,
+        source: MarketDataPort,
+        symbols: Iterable[str],
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        """Load bars for `symbols` from `source`: the full window for new
+        keys, only bars since the last stored one for known keys.
+
+        Keys of `timeframe` for symbols not in `symbols` are freed, so the
+        store follows coverage churn. A symbol whose fetch fails is dropped
+        from the store: readers then fetch it themselves instead of reading
+        the previous cycle's bars as current.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        tf = timeframe.upper()
+        wanted = set(symbols)
+        self.remove([k for k in self.keys() if k[1] == tf and k[0] not in wanted])
+        for symbol in symbols:
+            got = self.read(symbol, timeframe)
+            since = start
+            if got is not None and got[0].shape[1]:
+                last = float(got[0][0, -1])
+                since = max(start, pd.Timestamp(last, unit="s", tz="UTC").to_pydatetime())
+            try:
+                df = source.get_bars(symbol, timeframe, since, end)
+            except Exception:
+                self.remove([(symbol, timeframe)])
+                continue
+            self.write(symbol, timeframe, df, append=got is not None)
+
+    def close(self) -> None:
+        self._hdr = self._data = None  # type: ignore[assignment]
+        for shm in (self._hdr_shm, self._data_shm):
+            shm.close()
+            if self._owner:
+                try:
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
+
+
+def _to_block(df: pd.DataFrame) -> np.ndarray:
+    n = len(df)
+    block = np.empty((len(COLUMNS), n), dtype=np.float64)
+    if not n:
+        return block
+    times = pd.DatetimeIndex(df["time"])
+    if times.tz is not None:
+        times = times.tz_convert("UTC").tz_localize(None)
+    block[0] = times.values.astype("datetime64[s]").astype(np.int64)
+    for c, col in enumerate(COLUMNS[1:], start=1):
+        block[c] = df[col].to_numpy(dtype=np.float64) if col in df.columns else 0.0
+    return block
+
+
+class SharedBarReader(MarketDataPort):
+    """Market data port over an attached `SharedBarStore`.
+
+    `get_bars` slices the stored bars to `[start, end]` without copying the
+    price/volume columns. Keys the store does not hold go to `fallback`.
+    """
+
+    def __init__(self, store: SharedBarStore, fallback: MarketDataPort | None = None) -> None:
+        self.store = store
+        self.fallback = fallback
+
+    def get_bars(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame:
+        got = self.store.read(symbol, timeframe)
+        if got is None:
+            if self.fallback is None:
+                raise LookupError(f"No shared bars for {symbol} {timeframe}")
+            return self.fallback.get_bars(symbol, timeframe, start, end)
+        block, _ = got
+        lo = int(np.searchsorted(block[0], pd.Timestamp(start).timestamp(), side="left"))
+        hi = int(np.searchsorted(block[0], pd.Timestamp(end).timestamp(), side="right"))
+        view = block[:, lo:hi]
+        out: Dict[str, object] = {"time": pd.to_datetime(view[0].astype(np.int64), unit="s", utc=True)}
+        for c, col in enumerate(COLUMNS[1:], start=1):
+            out[col] = view[c]
+        return pd.DataFrame(out, copy=False)
+
+
+def slots_for(symbols: int) -> int:
+    """Slot count with headroom for coverage growth."""
+    return max(16, int(symbols * 1.5) + 1)
+
+
+def capacity_for(lookback_days: int, timeframe_minutes: int) -> int:
+    """Rows per slot: the lookback window plus a quarter for appends."""
+    rows = int(timedelta(days=lookback_days).total_seconds() // 60 // max(1, timeframe_minutes))
+    return max(64, int(rows * 1.25) + 1)
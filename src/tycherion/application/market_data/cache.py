@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tycherion.domain.market.columns import BarColumns, as_frame, bar_times_ns
+from tycherion.domain.market.resampling import TIMEFRAME_MINUTES
+from tycherion.ports.market_data import MarketDataPort
+
+# Half-open [lo, hi) ranges of epoch nanoseconds.
+Interval = Tuple[int, int]
+_US = 1_000
+
+
+def _ns(t: datetime | pd.Timestamp) -> int:
+    ts = pd.Timestamp(t)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return int(ts.value)
+
+
+Bars = pd.DataFrame | BarColumns
+
+
+def _take(bars: Bars, rows: np.ndarray | slice) -> Bars:
+    if isinstance(bars, BarColumns):
+        return BarColumns(bars.data[rows])
+    return bars.iloc[rows].reset_index(drop=True)
+
+
+def _concat(a: Bars, b: Bars) -> Bars:
+    if isinstance(a, BarColumns) and isinstance(b, BarColumns) and a.data.dtype == b.data.dtype:
+        return BarColumns(np.concatenate([a.data, b.data]))
+    return pd.concat([as_frame(a), as_frame(b)], ignore_index=True)
+
+
+def add_interval(intervals: Sequence[Interval], lo: int, hi: int) -> List[Interval]:
+    """`intervals` (sorted, disjoint) with [lo, hi) merged in."""
+    if hi <= lo:
+        return list(intervals)
+    out: List[Interval] = []
+    for a, b in intervals:
+        if b < lo or a > hi:
+            out.append((a, b))
+        else:
+            lo, hi = min(a, lo), max(b, hi)
+    out.append((lo, hi))
+    out.sort()
+    return out
+
+
+def subtract_intervals(lo: int, hi: int, intervals: Sequence[Interval]) -> List[Interval]:
+    """Parts of [lo, hi) not covered by `intervals` (sorted, disjoint)."""
+    out: List[Interval] = []
+    cur = lo
+    for a, b in intervals:
+        if b <= cur:
+            continue
+        if a >= hi:
+            break
+        if a > cur:
+            out.append((cur, a))
+        cur = max(cur, b)
+    if cur < hi:
+        out.append((cur, hi))
+    return out
+
+
+def clip_intervals(intervals: Sequence[Interval], lo: int) -> List[Interval]:
+    return [(max(a, lo), b) for a, b in intervals if b > lo]
+
+
+@dataclass(slots=True)
+class _Series:
+    """Cached bars of one (symbol, timeframe), with what is known about them."""
+
+    # Stored as the port answered: a DataFrame or `BarColumns`.
+    frame: Bars | None = None
+    times: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    # Fetched and answered (the forming bar is never covered).
+    covered: List[Interval] = field(default_factory=list)
+    # Holes fetched again without bars: closed sessions, not retried.
+    closed: List[Interval] = field(default_factory=list)
+    # Last empty answer while no bars are stored (keeps the port's columns).
+    empty: Bars | None = None
+    # Held while the series is read or changed (fetch threads share the cache).
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class CachingMarketData(MarketDataPort):
+    """Market data port that keeps fetched bars and fetches only what is missing.
+
+    Per (symbol, timeframe) it keeps the bars and the time ranges already
+    fetched (`covered`). A request fetches only the uncovered parts of its
+    window; the newest stored bar is never covered, since it may still be
+    forming, so it is fetched again on the next request.
+
+    Holes in the series (steps longer than one bar) are fetched once more,
+    up to `max_gap_repairs` per request: the terminal may not have synced
+    them yet. A hole that stays empty is recorded as closed (a session
+    break) and not retried. With `repair_gaps=False` holes are left as is.
+
+    `get_bar_columns` fetches through the inner port's `get_bar_columns`
+    (when it has one) and keeps the `BarColumns` arrays, so the pipeline's
+    columnar path stays on behind the cache; `get_bars` answers DataFrames.
+
+    Timeframes outside `TIMEFRAME_MINUTES` are passed through uncached.
+    """
+
+    def __init__(self, inner: MarketDataPort, *, repair_gaps: bool = True, max_gap_repairs: int = 8) -> None:
+        self.inner = inner
+        self.repair_gaps = bool(repair_gaps)
+        self.max_gap_repairs = max(0, int(max_gap_repairs))
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def get_bars(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame:
+        return as_frame(self._bars(self.inner.get_bars, symbol, timeframe, start, end))
+
+    def get_bar_columns(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> Bars:
+        fetch = getattr(self.inner, "get_bar_columns", None) or self.inner.get_bars
+        return self._bars(fetch, symbol, timeframe, start, end)
+
+    def _bars(self, fetch: Callable[..., Bars], symbol: str, timeframe: str, start: datetime, end: datetime) -> Bars:
+        tf = timeframe.upper()
+        minutes = TIMEFRAME_MINUTES.get(tf)
+        if minutes is None:
+            return fetch(symbol, timeframe, start, end)
+        bar_ns = minutes * 60 * 1_000_000_000
+        lo, hi = _ns(start), _ns(end)
+
+        with self._lock:
+            series = self._series.setdefault((symbol, tf), _Series())
+        with series.lock:
+            return self._get(series, fetch, symbol, timeframe, lo, hi, bar_ns)
+
+    def _get(
+        self, series: _Series, fetch: Callable[..., Bars], symbol: str, timeframe: str, lo: int, hi: int, bar_ns: int
+    ) -> Bars:
+        self._trim(series, lo)
+
+        # Intervals are half-open; datetimes resolve to microseconds.
+        for a, b in subtract_intervals(lo, hi + _US, series.covered):
+            self._fetch(series, fetch, symbol, timeframe, a, b)
+
+        if self.repair_gaps and self.max_gap_repairs:
+            for a, b in self._holes(series, lo, hi, bar_ns)[: self.max_gap_repairs]:
+                got = self._fetch(series, fetch, symbol, timeframe, a, b, cover=False)
+                if not ((got >= a) & (got < b)).any():
+                    series.closed = add_interval(series.closed, a, b)
+
+        if series.frame is None:
+            # Nothing stored: answer empty rather than asking the port again.
+            return series.empty if series.empty is not None else pd.DataFrame(columns=["time"])
+        i = int(np.searchsorted(series.times, lo, side="left"))
+        j = int(np.searchsorted(series.times, hi, side="right"))
+        return _take(series.frame, slice(i, j))
+
+    def warm(self, symbols: List[str], timeframe: str) -> None:
+        warm = getattr(self.inner, "warm", None)
+        if warm is not None:
+            warm(symbols, timeframe)
+
+    def evict(self, symbols: List[str]) -> None:
+        gone = set(symbols)
+        with self._lock:
+            for key in [k for k in self._series if k[0] in gone]:
+                del self._series[key]
+        evict = getattr(self.inner, "evict", None)
+        if evict is not None:
+            evict(symbols)
+
+    def _fetch(
+        self,
+        series: _Series,
+        fetch: Callable[..., Bars],
+        symbol: str,
+        timeframe: str,
+        lo: int,
+        hi: int,
+        *,
+        cover: bool = True,
+    ) -> np.ndarray:
+        """Fetch [lo, hi) into `series`; returns the fetched bar times."""
+        df = fetch(
+            symbol,
+            timeframe,
+            pd.Timestamp(lo, tz="UTC").to_pydatetime(),
+            pd.Timestamp(hi - _US, tz="UTC").to_pydatetime(),
+        )
+        if df is None or df.empty:
+            if df is not None and series.frame is None:
+                series.empty = df
+            return np.empty(0, dtype=np.int64)
+        times = bar_times_ns(df)
+        self._merge(series, df, times)
+        if cover:
+            # Up to, not including, the newest bar (it may still be forming).
+            series.covered = add_interval(series.covered, lo, min(hi, int(series.times[-1])))
+        return times
+
+    @staticmethod
+    def _merge(series: _Series, df: Bars, times: np.ndarray) -> None:
+        if series.frame is None:
+            order = np.argsort(times, kind="stable")
+            series.frame = _take(df, order)
+            series.times = times[order]
+            return
+        # Fetched bars replace stored ones with the same open time.
+        keep = ~np.isin(series.times, times)
+        frame = _concat(_take(series.frame, np.flatnonzero(keep)), df)
+        all_times = np.concatenate([series.times[keep], times])
+        order = np.argsort(all_times, kind="stable")
+        series.frame = _take(frame, order)
+        series.times = all_times[order]
+
+    @staticmethod
+    def _holes(series: _Series, lo: int, hi: int, bar_ns: int) -> List[Interval]:
+        t = series.times
+        if t.size < 2:
+            return []
+        t = t[(t >= lo) & (t <= hi)]
+        steps = np.diff(t)
+        holes: List[Interval] = []
+        for k in np.flatnonzero(steps > bar_ns + bar_ns // 2):
+            a, b = int(t[k]) + bar_ns, int(t[k + 1])
+            if not subtract_intervals(a, b, series.closed):
+                continue
+            holes.append((a, b))
+        return holes
+
+    @staticmethod
+    def _trim(series: _Series, lo: int) -> None:
+        """Drop bars and ranges before `lo` (the window only moves forward)."""
+        if series.frame is None or not series.times.size or series.times[0] >= lo:
+            return
+        first = int(np.searchsorted(series.times, lo, side="left"))
+        series.frame = _take(series.frame, slice(first, None))
+        series.times = series.times[first:]
+        series.covered = clip_intervals(series.covered, lo)
+        series.closed = clip_intervals(series.closed, lo)
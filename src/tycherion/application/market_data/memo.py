@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Set, Tuple
+
+from tycherion.ports.market_data import MarketDataPort
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from tycherion.domain.market.columns import BarColumns
+
+# (symbol, timeframe, start, end, columnar) of one fetch.
+_Key = Tuple[str, str, datetime, datetime, bool]
+
+
+class CycleBarsMemo(MarketDataPort):
+    """Market data port that answers a repeated request from memory.
+
+    Lives for one cycle: the primary pipeline fetches through it, and the
+    shadow pipelines run after it get the same bars (or the same error)
+    without calling the broker again. Requests it has not seen pass through
+    until `freeze`; after that they raise `LookupError`.
+    """
+
+    def __init__(self, inner: MarketDataPort) -> None:
+        self.inner = inner
+        self._answers: Dict[_Key, pd.DataFrame | BarColumns | BaseException] = {}
+        self._discarded: Set[Tuple[str, str]] = set()
+        self._frozen = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._answers)
+
+    def get_bars(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame:
+        return self._get((symbol, timeframe.upper(), start, end, False), self.inner.get_bars)
+
+    def get_bar_columns(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame | BarColumns:
+        fetch = getattr(self.inner, "get_bar_columns", None) or self.inner.get_bars
+        return self._get((symbol, timeframe.upper(), start, end, True), fetch)
+
+    def freeze(self) -> None:
+        """Serve only what was already answered: no further broker calls."""
+        self._frozen = True
+
+    def discard(self, symbol: str, timeframe: str) -> None:
+        """Forget answers for a fetch the pipeline did not use (and do not
+        keep one that arrives later); later readers ask `inner` again.
+        Passed on to `inner` when it supports it."""
+        tf = timeframe.upper()
+        with self._lock:
+            self._discarded.add((symbol, tf))
+            for key in [k for k in self._answers if k[0] == symbol and k[1] == tf]:
+                del self._answers[key]
+        discard = getattr(self.inner, "discard", None)
+        if discard is not None:
+            discard(symbol, timeframe)
+
+    def _get(self, key: _Key, fetch) -> pd.DataFrame | BarColumns:
+        with self._lock:
+            answer = self._answers.get(key)
+        if answer is None:
+            symbol, _, start, end, _ = key
+            if self._frozen:
+                raise LookupError(f"No bars fetched this cycle for {symbol} {key[1]}")
+            try:
+                answer = fetch(symbol, timeframe=key[1], start=start, end=end)
+            except Exception as e:
+                answer = e
+            with self._lock:
+                if key[:2] not in self._discarded:
+                    self._answers[key] = answer
+        if isinstance(answer, BaseException):
+            raise answer
+        return answer
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Callable, Dict, Iterable
+
+import pandas as pd
+
+from tycherion.domain.market.columns import BarColumns, as_frame, bars_fingerprint
+from tycherion.domain.market.resampling import (
+    TIMEFRAME_MINUTES,
+    can_resample,
+    finest_timeframe,
+    resample_ohlcv,
+)
+from tycherion.domain.signals.indicators.series import SeriesContext
+
+
+def fetch_timeframe(default: str, wanted: Iterable[str]) -> str:
+    """Timeframe to fetch so that `wanted` can be derived from one fetch.
+
+    The finest known timeframe in `wanted`; `default` when there is none.
+    Timeframes that cannot be derived from it are fetched on their own.
+    """
+
+    known = [tf.upper() for tf in wanted if tf.upper() in TIMEFRAME_MINUTES]
+    return finest_timeframe(known) if known else default.upper()
+
+
+class SymbolBars:
+    """One symbol's bars, fetched once, with derived timeframes cached.
+
+    `frame` holds the bars at `timeframe` (the finest timeframe the run's
+    indicators need), as a DataFrame or `BarColumns`. `context(tf)` returns
+    the `SeriesContext` for `tf`: derived from `frame` by OHLCV resampling
+    when `tf` is a whole multiple, fetched through `fetch` otherwise. Each
+    timeframe is built once; so is its `fingerprint(tf)`.
+    """
+
+    __slots__ = ("frame", "timeframe", "start", "_fetch", "_contexts", "_fingerprints")
+
+    def __init__(
+        self,
+        frame: pd.DataFrame | BarColumns,
+        timeframe: str,
+        *,
+        start: datetime | None = None,
+        fetch: Callable[[str], pd.DataFrame] | None = None,
+    ) -> None:
+        self.frame = frame
+        self.timeframe = timeframe.upper()
+        self.start = start
+        self._fetch = fetch
+        self._contexts: Dict[str, SeriesContext] = {}
+        self._fingerprints: Dict[str, bytes] = {}
+
+    def context(self, timeframe: str | None = None) -> SeriesContext:
+        tf = (timeframe or self.timeframe).upper()
+        ctx = self._contexts.get(tf)
+        if ctx is None:
+            ctx = SeriesContext(self._frame_for(tf))
+            self._contexts[tf] = ctx
+        return ctx
+
+    def fingerprint(self, timeframe: str | None = None) -> bytes:
+        """Digest of the bars behind `context(timeframe)`."""
+        tf = (timeframe or self.timeframe).upper()
+        fp = self._fingerprints.get(tf)
+        if fp is None:
+            fp = bars_fingerprint(self.context(tf).bars)
+            self._fingerprints[tf] = fp
+        return fp
+
+    def _frame_for(self, tf: str) -> pd.DataFrame | BarColumns:
+        if tf == self.timeframe:
+            return self.frame
+        if can_resample(self.timeframe, tf):
+            return resample_ohlcv(as_frame(self.frame), tf, start=self.start)
+        if self._fetch is None:
+            raise ValueError(f"Timeframe {tf} cannot be derived from {self.timeframe}")
+        return self._fetch(tf)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Iterable, List, Tuple
 
-from tycherion.shared.config import AppConfig, PipelineStageCfg
+if TYPE_CHECKING:
+    from tycherion.shared.config import AppConfig, PipelineStageCfg
 
 
 @dataclass(frozen=True, slots=True)
@@ -14,6 +15,17 @@ class PipelineStageConfig:
     drop_threshold: float | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class SanityConfig:
+    """Thresholds of the data-quality pre-filter (None: check disabled)."""
+
+    min_bars: int | None = None
+    min_mean_tick_volume: float | None = None
+    max_zero_volume_ratio: float | None = None
+    max_gap_ratio: float | None = None
+    max_mean_spread: float | None = None
+
+
 @dataclass(frozen=True, slots=True)
 class PipelineConfig:
     """Internal normalized pipeline configuration.
@@ -23,6 +35,19 @@ class PipelineConfig:
     """
 
     stages: List[PipelineStageConfig]
+    # symbol_major: all stages' indicators per symbol up front.
+    # stage_major: each stage's indicators only for symbols still alive.
+    execution: str = "symbol_major"
+    # Cycle budget (None: unbounded). Past the deadline non-held symbols are
+    # skipped; fetches run on `fetch_workers` threads when a budget is set.
+    cycle_deadline_seconds: float | None = None
+    fetch_timeout_seconds: float | None = None
+    fetch_workers: int = 1
+    # Data-quality pre-filter before any indicator runs (None: off).
+    sanity: SanityConfig | None = None
+
+
+EXECUTION_MODES = ("symbol_major", "stage_major")
 
 
 def build_pipeline_config(cfg: AppConfig) -> PipelineConfig:
@@ -31,17 +56,84 @@ def build_pipeline_config(cfg: AppConfig) -> PipelineConfig:
     The AppConfig is created by YAML/adapters, but the rest of the application
     should not read YAML-derived structures directly.
     """
-    stages_in: Iterable[PipelineStageCfg] = cfg.application.models.pipeline or []
-    stages: list[PipelineStageConfig] = []
-    for st in stages_in:
-        stages.append(
-            PipelineStageConfig(
-                name=str(st.name),
-                drop_threshold=(float(st.drop_threshold) if st.drop_threshold is not None else None),
-            )
-        )
+    stages = _build_stages(cfg.application.models.pipeline or [])
     if not stages:
         raise RuntimeError(
             "No model pipeline configured. Please set application.models.pipeline in your YAML."
         )
-    return PipelineConfig(stages=stages)
+    execution = _execution_mode(cfg.application.models.execution, "application.models.execution")
+    schedule = cfg.application.schedule
+    sanity_cfg = cfg.application.models.sanity
+    sanity = (
+        SanityConfig(
+            min_bars=sanity_cfg.min_bars,
+            min_mean_tick_volume=sanity_cfg.min_mean_tick_volume,
+            max_zero_volume_ratio=sanity_cfg.max_zero_volume_ratio,
+            max_gap_ratio=sanity_cfg.max_gap_ratio,
+            max_mean_spread=sanity_cfg.max_mean_spread,
+        )
+        if sanity_cfg.enabled
+        else None
+    )
+    return PipelineConfig(
+        stages=stages,
+        execution=execution,
+        cycle_deadline_seconds=_positive_or_none(schedule.cycle_deadline_seconds),
+        fetch_timeout_seconds=_positive_or_none(schedule.fetch_timeout_seconds),
+        fetch_workers=max(1, int(schedule.fetch_workers or 1)),
+        sanity=sanity,
+    )
+
+
+def build_shadow_pipeline_configs(cfg: AppConfig) -> List[Tuple[str, PipelineConfig]]:
+    """`(name, PipelineConfig)` per `application.models.shadow` entry.
+
+    Shadows inherit the primary's settings (sanity, fetch workers) except
+    stages and execution, and run without a cycle deadline: they are
+    evaluated after the primary's orders are placed.
+    """
+    primary = build_pipeline_config(cfg)
+    out: List[Tuple[str, PipelineConfig]] = []
+    seen: set[str] = set()
+    for i, sh in enumerate(cfg.application.models.shadow or []):
+        name = str(sh.name).strip()
+        if not name or name in seen:
+            raise RuntimeError(f"application.models.shadow[{i}]: name must be unique and non-empty, got {sh.name!r}")
+        seen.add(name)
+        stages = _build_stages(sh.pipeline or [])
+        if not stages:
+            raise RuntimeError(f"application.models.shadow[{i}] ({name}): pipeline is empty")
+        execution = (
+            _execution_mode(sh.execution, f"application.models.shadow[{i}].execution")
+            if sh.execution is not None
+            else primary.execution
+        )
+        out.append(
+            (name, replace(primary, stages=stages, execution=execution, cycle_deadline_seconds=None))
+        )
+    return out
+
+
+def _build_stages(stages_in: Iterable[PipelineStageCfg]) -> list[PipelineStageConfig]:
+    return [
+        PipelineStageConfig(
+            name=str(st.name),
+            drop_threshold=(float(st.drop_threshold) if st.drop_threshold is not None else None),
+        )
+        for st in stages_in
+    ]
+
+
+def _execution_mode(value: str | None, path: str) -> str:
+    execution = str(value or "symbol_major").strip().lower()
+    if execution not in EXECUTION_MODES:
+        raise RuntimeError(
+            f"Invalid {path}: {execution!r}. Expected one of: {', '.join(EXECUTION_MODES)}"
+        )
+    return execution
+
+
+def _positive_or_none(value: float | None) -> float | None:
+    if value is None or float(value) <= 0:
+        return None
+    return float(value)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterator, Sequence, Tuple
+
+import pandas as pd
+
+from tycherion.domain.market.columns import BarColumns
+
+# FetchOutcome.status values.
+FETCH_OK = "ok"
+FETCH_ERROR = "error"
+FETCH_TIMEOUT = "timeout"
+FETCH_SKIPPED = "skipped"
+
+
+@dataclass(frozen=True, slots=True)
+class FetchOutcome:
+    row: int
+    symbol: str
+    status: str
+    frame: pd.DataFrame | BarColumns | None = None
+    error: BaseException | None = None
+
+
+class BarFetchQueue:
+    """Fetch bars for `(row, symbol, held)` items in order, under a time budget.
+
+    With `workers=0` fetches run inline on the caller's thread (no timeouts).
+    Otherwise they run on a small thread pool, up to `prefetch` items ahead of
+    the consumer, so fetching overlaps indicator work:
+
+    - `fetch_timeout` (seconds) bounds the wait for any one symbol;
+    - past `deadline` (a `time.monotonic()` value) non-held symbols are
+      skipped without waiting; held symbols are always fetched.
+
+    A fetch that raises `TimeoutError` (e.g. a busy broker session) counts
+    as timed out. A fetch that times out cannot be interrupted: the symbol is
+    reported and its result discarded. Once the queue is done (or closed),
+    calls still in flight are waited for until the deadline, or for
+    `fetch_timeout` without one; calls still running after that are left
+    behind and counted in `abandoned`. `drained_at` is the `clock()` value
+    when the queue finished.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], pd.DataFrame | BarColumns],
+        items: Sequence[Tuple[int, str, bool]],
+        *,
+        workers: int = 0,
+        fetch_timeout: float | None = None,
+        deadline: float | None = None,
+        prefetch: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch
+        self._items = list(items)
+        self._workers = max(0, int(workers))
+        self._fetch_timeout = fetch_timeout
+        self._deadline = deadline
+        self._prefetch = max(1, int(prefetch if prefetch is not None else 2 * max(1, self._workers)))
+        self._clock = clock
+        self.abandoned = 0
+        self.drained_at: float | None = None
+
+    def expired(self) -> bool:
+        return self._deadline is not None and self._clock() >= self._deadline
+
+    def __iter__(self) -> Iterator[FetchOutcome]:
+        if self._workers == 0:
+            yield from self._iter_inline()
+            return
+
+        pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="tycherion-fetch")
+        pending: Deque[Tuple[int, str, bool, Future | None]] = deque()
+        items = iter(self._items)
+
+        submitted: list[Future] = []
+
+        def fill() -> None:
+            while len(pending) < self._prefetch:
+                item = next(items, None)
+                if item is None:
+                    return
+                row, symbol, held = item
+                # Past the deadline, only held symbols are still worth a fetch.
+                fut = None if (self.expired() and not held) else pool.submit(self._fetch, symbol)
+                if fut is not None:
+                    submitted.append(fut)
+                pending.append((row, symbol, held, fut))
+
+        try:
+            fill()
+            while pending:
+                row, symbol, held, fut = pending.popleft()
+                yield self._wait(row, symbol, held, fut)
+                fill()
+        finally:
+            # Drop what has not started; give calls in flight until the
+            # deadline (or one fetch timeout) to return.
+            pool.shutdown(wait=False, cancel_futures=True)
+            if self._deadline is not None:
+                budget = max(0.0, self._deadline - self._clock())
+            else:
+                budget = self._fetch_timeout
+            _, running = wait([f for f in submitted if not f.done()], timeout=budget)
+            self.abandoned = len(running)
+            self.drained_at = self._clock()
+
+    def _iter_inline(self) -> Iterator[FetchOutcome]:
+        for row, symbol, held in self._items:
+            if self.expired() and not held:
+                yield FetchOutcome(row, symbol, FETCH_SKIPPED)
+                continue
+            try:
+                frame = self._fetch(symbol)
+            except TimeoutError as e:
+                yield FetchOutcome(row, symbol, FETCH_TIMEOUT, error=e)
+            except Exception as e:
+                yield FetchOutcome(row, symbol, FETCH_ERROR, error=e)
+            else:
+                yield FetchOutcome(row, symbol, FETCH_OK, frame=frame)
+        self.drained_at = self._clock()
+
+    def _wait(self, row: int, symbol: str, held: bool, fut: Future | None) -> FetchOutcome:
+        if fut is None:
+            return FetchOutcome(row, symbol, FETCH_SKIPPED)
+
+        timeout = self._fetch_timeout
+        by_deadline = False
+        if not held and self._deadline is not None:
+            remaining = max(0.0, self._deadline - self._clock())
+            if timeout is None or remaining < timeout:
+                timeout, by_deadline = remaining, True
+
+        try:
+            return FetchOutcome(row, symbol, FETCH_OK, frame=fut.result(timeout=timeout))
+        except FutureTimeout as e:
+            if fut.done():
+                # The fetch itself timed out (`FutureTimeout` is `TimeoutError`).
+                return FetchOutcome(row, symbol, FETCH_TIMEOUT, error=e)
+            fut.cancel()
+            return FetchOutcome(row, symbol, FETCH_SKIPPED if by_deadline else FETCH_TIMEOUT)
+        except Exception as e:
+            return FetchOutcome(row, symbol, FETCH_ERROR, error=e)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, Hashable, Tuple
+
+from tycherion.domain.signals.entities import IndicatorOutput
+
+# (symbol, timeframe, indicator key, indicator method, bars fingerprint)
+ResultKey = Tuple[str, str, str, str, bytes]
+
+
+class IndicatorResultStore:
+    """Indicator outputs shared by the pipeline services of one process.
+
+    Results are keyed by symbol, timeframe, indicator key and method, and a
+    fingerprint of the bars they were computed from; equal keys mean equal
+    inputs, so a hit is always valid, whichever service or cycle stored it.
+    Several pipeline configs evaluated over the same bars compute each
+    indicator once.
+
+    Entries live in two generations. `start_cycle(cycle)` opens a new one
+    when `cycle` differs from the current one; results not read or stored
+    since the previous cycle are then dropped. A generation also rotates
+    once it holds `max_entries`, which bounds memory. Thread-safe.
+    """
+
+    __slots__ = ("max_entries", "hits", "misses", "_cycle", "_current", "_previous", "_lock")
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self._cycle: Hashable | None = None
+        self._current: Dict[ResultKey, IndicatorOutput] = {}
+        self._previous: Dict[ResultKey, IndicatorOutput] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._current) + len(self._previous)
+
+    def start_cycle(self, cycle: Hashable) -> None:
+        with self._lock:
+            if cycle != self._cycle:
+                self._cycle = cycle
+                self._rotate()
+
+    def get(self, key: ResultKey) -> IndicatorOutput | None:
+        with self._lock:
+            out = self._current.get(key)
+            if out is None:
+                out = self._previous.pop(key, None)
+                if out is not None:
+                    self._store(key, out)
+            if out is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return out
+
+    def put(self, key: ResultKey, output: IndicatorOutput) -> None:
+        with self._lock:
+            self._store(key, output)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._current.clear()
+            self._previous.clear()
+
+    def _store(self, key: ResultKey, output: IndicatorOutput) -> None:
+        if len(self._current) >= self.max_entries:
+            self._rotate()
+        self._current[key] = output
+
+    def _rotate(self) -> None:
+        self._previous = self._current
+        self._current = {}
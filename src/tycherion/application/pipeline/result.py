@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Mapping, Tuple
 
 from tycherion.domain.portfolio.entities import SignalsBySymbol
 from tycherion.domain.signals.entities import SymbolState
@@ -12,6 +12,11 @@ from .config import PipelineConfig
 @dataclass(frozen=True, slots=True)
 class PipelineRunResult:
     pipeline_config: PipelineConfig
-    states_by_symbol: Dict[str, SymbolState]
+    # Read-only view over the run's columnar state table (see `state.py`).
+    states_by_symbol: Mapping[str, SymbolState]
     signals_by_symbol: SignalsBySymbol
     stage_stats: Dict[str, int]
+    # True when the cycle budget cut work short (fetch timeouts or skipped symbols).
+    degraded: bool = False
+    # Non-held symbols left out because their data missed the cycle budget.
+    skipped_symbols: Tuple[str, ...] = ()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from tycherion.domain.market.columns import BarColumns, bar_times_ns
+
+from .config import SanityConfig
+
+# Name the sanity pass reports under (stage stats, drop logs, notes).
+SANITY_STAGE = "sanity"
+
+# Checks in reporting order: the first failing one is the drop reason.
+CHECKS = ("min_bars", "min_mean_tick_volume", "max_zero_volume_ratio", "max_gap_ratio", "max_mean_spread")
+
+
+@dataclass(frozen=True, slots=True)
+class SanityReport:
+    """Data-quality statistics and verdicts, one entry per evaluated frame.
+
+    `stats` holds the raw per-symbol figures (`bars`, `gap_ratio`,
+    `mean_tick_volume`, `zero_volume_ratio`, `mean_spread`); `score` is the
+    worst check score in [0, 1]; `reason` names the first failed check, or
+    is empty when the symbol passes.
+    """
+
+    stats: Dict[str, np.ndarray]
+    score: np.ndarray
+    reason: List[str]
+
+    @property
+    def failed(self) -> np.ndarray:
+        return np.fromiter((bool(r) for r in self.reason), dtype=bool, count=len(self.reason))
+
+
+def _column(frames: Sequence[pd.DataFrame | BarColumns], col: str, total: int) -> np.ndarray:
+    if not all(col in df.columns for df in frames):
+        return np.full(total, np.nan)
+    return np.concatenate([np.asarray(df[col], dtype=np.float64) for df in frames])
+
+
+def bar_stats(frames: Sequence[pd.DataFrame | BarColumns], bar_seconds: float | None) -> Dict[str, np.ndarray]:
+    """Per-frame statistics in one pass over all frames' bars.
+
+    Columns are concatenated and reduced per frame with `np.add.reduceat`.
+    A gap is a step between consecutive bars longer than 1.5 bar durations
+    (session breaks count too); without `bar_seconds` gaps are not measured.
+    Frames must be non-empty.
+    """
+
+    lengths = np.fromiter((len(df) for df in frames), dtype=np.int64, count=len(frames))
+    if lengths.size == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return {k: empty for k in ("bars", "gap_ratio", "mean_tick_volume", "zero_volume_ratio", "mean_spread")}
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    total = int(lengths.sum())
+
+    def per_frame_sum(values: np.ndarray) -> np.ndarray:
+        return np.add.reduceat(values, starts)
+
+    tick_volume = _column(frames, "tick_volume", total)
+    spread = _column(frames, "spread", total)
+
+    gap_ratio = np.full(lengths.size, np.nan)
+    if bar_seconds and all("time" in df.columns for df in frames):
+        times = np.concatenate([bar_times_ns(df) for df in frames])
+        steps = np.diff(times, prepend=times[0])
+        gaps = (steps > 1.5e9 * float(bar_seconds)).astype(np.float64)
+        gaps[starts] = 0.0  # a frame's first bar has no predecessor
+        with np.errstate(invalid="ignore", divide="ignore"):
+            gap_ratio = np.where(lengths > 1, per_frame_sum(gaps) / np.maximum(lengths - 1, 1), 0.0)
+
+    return {
+        "bars": lengths.astype(np.float64),
+        "gap_ratio": gap_ratio,
+        "mean_tick_volume": per_frame_sum(tick_volume) / lengths,
+        "zero_volume_ratio": per_frame_sum(np.where(np.isnan(tick_volume), np.nan, tick_volume == 0)) / lengths,
+        "mean_spread": per_frame_sum(spread) / lengths,
+    }
+
+
+def evaluate_sanity(frames: Sequence[pd.DataFrame | BarColumns], config: SanityConfig, bar_seconds: float | None) -> SanityReport:
+    """Score and check `frames` against `config` thresholds.
+
+    Unset thresholds, and statistics that could not be measured (NaN), are
+    neither scored nor failed.
+    """
+
+    stats = bar_stats(frames, bar_seconds)
+    n = stats["bars"].size
+    scores: Dict[str, np.ndarray] = {}
+    fails: Dict[str, np.ndarray] = {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if config.min_bars is not None:
+            limit = float(config.min_bars)
+            scores["min_bars"] = np.minimum(1.0, stats["bars"] / limit) if limit > 0 else np.ones(n)
+            fails["min_bars"] = stats["bars"] < limit
+        if config.min_mean_tick_volume is not None:
+            limit = float(config.min_mean_tick_volume)
+            v = stats["mean_tick_volume"]
+            scores["min_mean_tick_volume"] = np.minimum(1.0, v / limit) if limit > 0 else np.ones(n)
+            fails["min_mean_tick_volume"] = v < limit
+        if config.max_zero_volume_ratio is not None:
+            v = stats["zero_volume_ratio"]
+            scores["max_zero_volume_ratio"] = 1.0 - v
+            fails["max_zero_volume_ratio"] = v > float(config.max_zero_volume_ratio)
+        if config.max_gap_ratio is not None:
+            v = stats["gap_ratio"]
+            scores["max_gap_ratio"] = 1.0 - v
+            fails["max_gap_ratio"] = v > float(config.max_gap_ratio)
+        if config.max_mean_spread is not None:
+            limit = float(config.max_mean_spread)
+            v = stats["mean_spread"]
+            scores["max_mean_spread"] = np.where(v > limit, limit / v, 1.0)
+            fails["max_mean_spread"] = v > limit
+
+    score = np.ones(n)
+    for s in scores.values():
+        # NaN (not measured) scores as a pass.
+        score = np.fmin(score, np.clip(s, 0.0, 1.0))
+
+    reason = [""] * n
+    for check in reversed(CHECKS):
+        failed = fails.get(check)
+        if failed is None:
+            continue
+        for i in np.flatnonzero(failed):
+            reason[i] = check
+    return SanityReport(stats=stats, score=score, reason=reason)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+from tycherion.domain.portfolio.entities import Signal
+
+# Priority tiers, lowest first.
+TIER_HELD = 0
+TIER_RECENT = 1
+TIER_REST = 2
+
+
+class SymbolScheduler:
+    """Orders a cycle's symbols for processing: held positions first, then
+    symbols with a nonzero signal in the last `recent_cycles` cycles, then the
+    rest of coverage. Order within a tier is the input order.
+
+    One scheduler lives as long as its `ModelPipelineService`; `observe` is
+    called with each cycle's signals to keep the recent tier current.
+    """
+
+    __slots__ = ("recent_cycles", "_cycle", "_last_signal")
+
+    def __init__(self, recent_cycles: int = 3) -> None:
+        self.recent_cycles = max(0, int(recent_cycles))
+        self._cycle = 0
+        self._last_signal: Dict[str, int] = {}
+
+    def tier(self, symbol: str, held: bool) -> int:
+        if held:
+            return TIER_HELD
+        last = self._last_signal.get(symbol)
+        if last is not None and self._cycle - last < self.recent_cycles:
+            return TIER_RECENT
+        return TIER_REST
+
+    def order(self, symbols: Sequence[str], held: Sequence[bool]) -> List[int]:
+        """Row indices of `symbols` in processing order."""
+        tiers = [self.tier(sym, bool(h)) for sym, h in zip(symbols, held)]
+        return sorted(range(len(tiers)), key=tiers.__getitem__)
+
+    def recent(self) -> List[str]:
+        """Symbols currently in the recent tier, sorted."""
+        return sorted(s for s, c in self._last_signal.items() if self._cycle - c < self.recent_cycles)
+
+    def prime(self, symbols: Iterable[str]) -> None:
+        """Put `symbols` in the recent tier as of the current cycle (e.g. to
+        replay a recorded cycle in its recorded order)."""
+        for symbol in symbols:
+            self._last_signal[symbol] = self._cycle
+
+    def forget(self, symbols: Iterable[str]) -> None:
+        """Drop state for symbols that left coverage."""
+        for symbol in symbols:
+            self._last_signal.pop(symbol, None)
+
+    def observe(self, signals: Mapping[str, Signal]) -> None:
+        """Record a finished cycle's signals."""
+        self._cycle += 1
+        for symbol, signal in signals.items():
+            if signal.signed != 0.0:
+                self._last_signal[symbol] = self._cycle
+        horizon = self._cycle - self.recent_cycles
+        if self._last_signal and horizon > 0:
+            self._last_signal = {s: c for s, c in self._last_signal.items() if c > horizon}
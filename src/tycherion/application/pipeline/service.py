@@ -1,20 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Callable, Dict, Mapping, Optional, Tuple
-
-import pandas as pd
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, Mapping, Optional, Sequence, Tuple
 
 from tycherion.domain.portfolio.entities import PortfolioSnapshot, Signal, SignalsBySymbol
-from tycherion.domain.signals.entities import (
-    IndicatorOutput,
-    ModelDecision,
-    ModelStageResult,
-    SymbolState,
-)
+from tycherion.domain.signals.entities import IndicatorOutput, ModelDecision
+from tycherion.domain.signals.features import NO_FEATURES
 from tycherion.domain.signals.models.base import SignalModel
-from tycherion.domain.signals.indicators.base import BaseIndicator
 from tycherion.ports.market_data import MarketDataPort
 
 from tycherion.ports.observability import semconv
@@ -23,8 +18,19 @@ from tycherion.ports.observability.traces import SpanPort
 from tycherion.ports.observability.logs import LoggerPort
 from tycherion.ports.observability.types import Severity, TYCHERION_SCHEMA_VERSION
 
-from .config import PipelineConfig, PipelineStageConfig
+from .config import PipelineConfig, PipelineStageConfig, SanityConfig
 from .result import PipelineRunResult
+from .schedule import SymbolScheduler
+
+if TYPE_CHECKING:
+    from tycherion.domain.signals.batch import IndicatorColumns
+
+    from tycherion.domain.signals.indicators.base import BaseIndicator
+
+    from .bars import SymbolBars
+    from .indicator_store import IndicatorResultStore
+
+    from .state import SymbolStateTable
 
 
 @dataclass(slots=True)
@@ -37,6 +43,10 @@ class ModelPipelineService:
     timeframe: str
     lookback_days: int
     playbook: str | None = None
+    # Processing order across cycles (held, recently signalled, rest).
+    scheduler: SymbolScheduler = field(default_factory=SymbolScheduler)
+    # Indicator results shared with other services of the process (optional).
+    indicator_store: IndicatorResultStore | None = None
 
     def run(
         self,
@@ -45,7 +55,27 @@ class ModelPipelineService:
         pipeline_config: PipelineConfig,
         *,
         observability: ObservabilityPort,
+        as_of: datetime | None = None,
+        deadline: float | None = None,
     ) -> PipelineRunResult:
+        """Run the pipeline over `universe_symbols`.
+
+        `as_of` is the end of the bar window (default: now, UTC); pass it to
+        re-run a recorded cycle over the same window. `deadline` is a
+        `time.monotonic()` value for the cycle budget; by default it is
+        `pipeline_config.cycle_deadline_seconds` from the start of the run.
+        """
+        from tycherion.domain.market.columns import as_frame
+        from tycherion.domain.signals.batch import IndicatorColumns
+
+        from .bars import SymbolBars
+        from .fetch import FETCH_ERROR, FETCH_SKIPPED, FETCH_TIMEOUT, BarFetchQueue
+        from .sanity import SANITY_STAGE
+        from .state import SymbolStatesView, SymbolStateTable
+
+        if deadline is None and pipeline_config.cycle_deadline_seconds is not None:
+            deadline = time.monotonic() + float(pipeline_config.cycle_deadline_seconds)
+
         tracer = observability.traces.get_tracer("tycherion.pipeline", version=TYCHERION_SCHEMA_VERSION)
         logger = observability.logs.get_logger("tycherion.pipeline", version=TYCHERION_SCHEMA_VERSION)
 
@@ -58,28 +88,47 @@ class ModelPipelineService:
                 "stages": [st.name for st in pipeline_config.stages],
                 "timeframe": self.timeframe,
                 "lookback_days": int(self.lookback_days),
+                "execution": pipeline_config.execution,
             },
         ) as span:
-            # 1) Init per-symbol state
-            states: Dict[str, SymbolState] = {
-                sym: SymbolState(symbol=sym, is_held=(sym in held_symbols))
-                for sym in universe_symbols
-            }
-
-            # 2) Resolve models
+            # 1) Resolve models
             resolved = self._resolve_models(pipeline_config)
 
-            # 3) Determine indicator needs once for the whole pipeline
-            needed_keys: set[str] = set()
+            # 2) Determine indicator needs once for the whole pipeline
+            stage_keys: list[set[str] | None] = []
             for _, model in resolved:
                 try:
-                    needed_keys.update(model.requires() or set())
+                    stage_keys.append(set(model.requires() or set()))
                 except Exception:
-                    pass
+                    stage_keys.append(None)
+            needed_keys: set[str] = set().union(*(k for k in stage_keys if k is not None))
+            # A stage whose requires() failed gets every indicator.
+            stage_keys_full = [needed_keys if k is None else k for k in stage_keys]
+
+            # stage_major: compute each stage's indicators only for the symbols
+            # still alive when it runs (bars are kept until then).
+            lazy = pipeline_config.execution == "stage_major"
+            upfront_keys = (stage_keys_full[0] if stage_keys_full else set()) if lazy else needed_keys
+
+            # Resolve indicator implementations once for the run, not per symbol.
+            indicators = self._resolve_indicators(needed_keys, span, logger)
+
+            # 3) Init columnar per-symbol state
+            table = SymbolStateTable(
+                universe_symbols,
+                [stage_cfg.name for stage_cfg, _ in resolved],
+                held_symbols,
+                sorted(needed_keys),
+            )
 
             # 4) Time window for analysis
-            end = datetime.now(timezone.utc)
+            end = as_of or datetime.now(timezone.utc)
             start = end - timedelta(days=int(self.lookback_days))
+            store = self.indicator_store
+            if store is not None:
+                # Services running within the same minute share a generation.
+                store.start_cycle(end.replace(second=0, microsecond=0))
+                hits0, misses0 = store.hits, store.misses
 
             stage_stats: Dict[str, int] = {st.name: 0 for st in pipeline_config.stages}
             stage_passed: Dict[str, int] = {st.name: 0 for st in pipeline_config.stages}
@@ -93,86 +142,176 @@ class ModelPipelineService:
                     attrs,
                 )
 
-            for symbol, state in states.items():
-                if not state.alive and not state.is_held:
+            # Market data and indicators, per symbol.
+            data_rows: list[int] = []
+            bundles: Dict[int, Dict[str, IndicatorOutput]] = {}
+            contexts: Dict[int, SymbolBars] = {}
+            # Fetch the finest timeframe the indicators need; coarser ones are resampled.
+            fetch_tf = self._fetch_timeframe(indicators)
+            span.set_attribute("fetch_timeframe", fetch_tf)
+
+            # Fetches run on worker threads only under a cycle budget, so a slow
+            # symbol can be timed out or skipped instead of stalling the cycle.
+            budgeted = deadline is not None or pipeline_config.fetch_timeout_seconds is not None
+            # Risk-relevant symbols first, so they are evaluated before any deadline.
+            order = self.scheduler.order(table.symbols, table.held)
+            # Adapters with `get_bar_columns` skip the per-symbol DataFrame build.
+            get_bars = getattr(self.market_data, "get_bar_columns", None) or self.market_data.get_bars
+            fetches = BarFetchQueue(
+                partial(get_bars, timeframe=fetch_tf, start=start, end=end),
+                [(i, table.symbols[i], bool(table.held[i])) for i in order if table.active(i)],
+                workers=pipeline_config.fetch_workers if budgeted else 0,
+                fetch_timeout=pipeline_config.fetch_timeout_seconds,
+                deadline=deadline,
+            )
+
+            def admit(i: int, bars: SymbolBars) -> None:
+                bundles[i] = self._compute_indicators(bars, upfront_keys, indicators, table, i, span, logger)
+                data_rows.append(i)
+                if lazy:
+                    contexts[i] = bars
+
+            # With the sanity pre-filter on, indicators wait until every
+            # symbol's bars have been screened in one pass.
+            sanity = pipeline_config.sanity
+            screened: list[Tuple[int, SymbolBars]] = []
+            skipped: list[str] = []
+            timed_out: list[str] = []
+            # Recording wrappers drop fetches the run did not use.
+            discard = getattr(self.market_data, "discard", None)
+            for fetched in fetches:
+                i, symbol = fetched.row, fetched.symbol
+                if discard is not None and fetched.status in (FETCH_SKIPPED, FETCH_TIMEOUT):
+                    discard(symbol, fetch_tf)
+                if fetched.status == FETCH_SKIPPED:
+                    table.skip(i)
+                    skipped.append(symbol)
                     continue
 
-                df = self._safe_get_bars(symbol, start, end, state, span, logger)
+                df = fetched.frame
+                if fetched.status == FETCH_ERROR:
+                    self._report_fetch_error(symbol, fetched.error, table, i, span, logger)
+                elif fetched.status == FETCH_TIMEOUT:
+                    table.mark_fetch_timeout(i)
+                    timed_out.append(symbol)
+                    if not table.held[i]:
+                        skipped.append(symbol)
                 if df is None or df.empty:
-                    if not state.is_held:
+                    if not table.held[i]:
                         logger.emit(
                             "pipeline.symbol_dropped",
                             Severity.WARN,
                             {
                                 semconv.ATTR_CHANNEL: "audit",
                                 "symbol": symbol,
-                                "reason": "no_market_data",
+                                "reason": "fetch_timeout" if fetched.status == FETCH_TIMEOUT else "no_market_data",
                             },
                         )
-                        state.alive = False
+                        table.alive[i] = False
                     continue
 
                 if logger.is_enabled(Severity.DEBUG):
                     try:
+                        sample = as_frame(df)
                         logger.emit(
                             "market_data.sample",
                             Severity.DEBUG,
                             {
                                 semconv.ATTR_CHANNEL: "debug",
                                 "symbol": symbol,
-                                "rows": int(len(df)),
-                                "columns": list(df.columns)[:20],
-                                "head": df.head(2).to_dict(orient="list"),
-                                "tail": df.tail(2).to_dict(orient="list"),
+                                "rows": int(len(sample)),
+                                "columns": list(sample.columns)[:20],
+                                "head": sample.head(2).to_dict(orient="list"),
+                                "tail": sample.tail(2).to_dict(orient="list"),
                             },
                         )
                     except Exception:
                         pass
 
-                bundle = self._compute_indicators(df, needed_keys, state, span, logger)
+                # One compute graph per symbol and timeframe: indicators share
+                # intermediate series.
+                bars = SymbolBars(
+                    df,
+                    fetch_tf,
+                    start=start,
+                    fetch=partial(get_bars, symbol, start=start, end=end),
+                )
+                if sanity is not None:
+                    screened.append((i, bars))
+                else:
+                    admit(i, bars)
+
+            if fetches.abandoned:
+                # Calls still running past the drain budget (e.g. a hung broker call).
+                span.set_attribute("fetch_abandoned_count", int(fetches.abandoned))
+            if deadline is not None and fetches.drained_at is not None and fetches.drained_at > deadline:
+                span.set_attribute("fetch_drain_overrun_ms", round((fetches.drained_at - deadline) * 1000.0, 3))
+
+            if sanity is not None:
+                stage_stats[SANITY_STAGE] = self._screen_sanity(sanity, screened, fetch_tf, table, span, logger)
+                for i, bars in screened:
+                    if table.active(i):
+                        admit(i, bars)
+
+            # Pipeline execution, stage by stage over the rows still alive.
+            # Same outcome as running each symbol through all stages in turn.
+            computed_keys = set(upfront_keys)
+            for s, (stage_cfg, model) in enumerate(resolved):
+                rows = [i for i in data_rows if table.active(i)]
+                if not rows:
+                    continue
 
-                # Pipeline execution per stage
-                for stage_cfg, model in resolved:
-                    if not state.alive and not state.is_held:
-                        break
+                missing = stage_keys_full[s] - computed_keys
+                if missing:
+                    for i in rows:
+                        bundles[i].update(
+                            self._compute_indicators(contexts[i], missing, indicators, table, i, span, logger)
+                        )
+                    computed_keys |= missing
 
-                    stage_passed[stage_cfg.name] = int(stage_passed.get(stage_cfg.name, 0)) + 1
-                    score = self._run_stage(symbol, stage_cfg, model, bundle, state, span, logger)
+                columns = {
+                    key: IndicatorColumns.from_outputs([bundles[i][key] for i in rows])
+                    for key in sorted(stage_keys_full[s])
+                }
+                stage_passed[stage_cfg.name] = int(stage_passed.get(stage_cfg.name, 0)) + len(rows)
+                scores = self._run_stage_batch(s, stage_cfg, model, rows, bundles, columns, table, span, logger)
 
-                    # Drop policy
-                    if stage_cfg.drop_threshold is not None and score < float(stage_cfg.drop_threshold):
-                        if state.is_held:
-                            state.notes[f"below_threshold_{stage_cfg.name}"] = 1.0
-                            continue
-                        state.alive = False
-                        state.notes[f"dropped_by_{stage_cfg.name}"] = 1.0
-                        stage_stats[stage_cfg.name] = int(stage_stats.get(stage_cfg.name, 0)) + 1
-                        logger.emit(
-                            "pipeline.symbol_dropped",
-                            Severity.INFO,
-                            {
-                                semconv.ATTR_CHANNEL: "audit",
-                                "symbol": symbol,
-                                "stage": stage_cfg.name,
-                                "score": float(score),
-                                "threshold": float(stage_cfg.drop_threshold),
-                                "reason": "below_threshold",
-                            },
-                        )
-                        break
+                # Drop policy
+                if stage_cfg.drop_threshold is None:
+                    continue
+                threshold = float(stage_cfg.drop_threshold)
+                for i, score in zip(rows, scores):
+                    if score >= threshold:
+                        continue
+                    if table.held[i]:
+                        table.mark_below_threshold(s, i)
+                        continue
+                    table.drop(s, i)
+                    contexts.pop(i, None)
+                    stage_stats[stage_cfg.name] = int(stage_stats.get(stage_cfg.name, 0)) + 1
+                    logger.emit(
+                        "pipeline.symbol_dropped",
+                        Severity.INFO,
+                        {
+                            semconv.ATTR_CHANNEL: "audit",
+                            "symbol": table.symbols[i],
+                            "stage": stage_cfg.name,
+                            "score": float(score),
+                            "threshold": threshold,
+                            "reason": "below_threshold",
+                        },
+                    )
 
-                # Final signal fields (simple v1 rule: last stage score)
-                last_score = float(state.pipeline_results[-1].score) if state.pipeline_results else 0.0
-                state.alpha_score = last_score
-                state.notes["final_confidence"] = abs(last_score)
+            # Final signal fields (simple v1 rule: last stage score)
+            table.finalize(data_rows)
 
             # 5) Convert states into SignalsBySymbol
             signals: SignalsBySymbol = {}
-            for symbol, state in states.items():
-                if not state.alive and not state.is_held:
-                    continue
-                signed = float(state.alpha_score)
-                confidence = float(state.notes.get("final_confidence", abs(signed)))
+            active = table.active_indices()
+            for i in active:
+                symbol = table.symbols[i]
+                signed = float(table.alpha_score[i])
+                confidence = table.confidence_of(i)
                 signals[symbol] = Signal(symbol=symbol, signed=signed, confidence=confidence)
                 logger.emit(
                     "pipeline.signal_emitted",
@@ -202,20 +341,115 @@ class ModelPipelineService:
                     },
                 )
 
+            self.scheduler.observe(signals)
+            if store is not None:
+                span.set_attribute("indicator_cache_hits", store.hits - hits0)
+                span.set_attribute("indicator_cache_misses", store.misses - misses0)
+
+            degraded = bool(skipped or timed_out)
+            span.set_attribute(semconv.ATTR_CYCLE_STATUS, "degraded" if degraded else "ok")
+            if degraded:
+                span.add_event(
+                    semconv.EVT_PIPELINE_DEGRADED,
+                    {
+                        "skipped_count": int(len(skipped)),
+                        "timeout_count": int(len(timed_out)),
+                        "skipped_sample": skipped[: min(10, len(skipped))],
+                        "timeout_sample": timed_out[: min(10, len(timed_out))],
+                    },
+                )
+                logger.emit(
+                    "pipeline.cycle_degraded",
+                    Severity.WARN,
+                    {
+                        semconv.ATTR_CHANNEL: "ops",
+                        "skipped_count": int(len(skipped)),
+                        "timeout_count": int(len(timed_out)),
+                    },
+                )
+
             span.add_event(
                 semconv.EVT_PIPELINE_SUMMARY,
                 {
                     "signals_count": int(len(signals)),
-                    "alive_count": int(sum(1 for s in states.values() if s.alive or s.is_held)),
+                    "alive_count": int(len(active)),
                 },
             )
 
             return PipelineRunResult(
                 pipeline_config=pipeline_config,
-                states_by_symbol=states,
+                states_by_symbol=SymbolStatesView(table),
                 signals_by_symbol=signals,
                 stage_stats=stage_stats,
+                degraded=degraded,
+                skipped_symbols=tuple(skipped),
+            )
+
+    def apply_universe_diff(self, added: Sequence[str], removed: Sequence[str]) -> None:
+        """Update per-symbol state for a coverage change between cycles.
+
+        Removed symbols are forgotten by the scheduler. Market data adapters
+        that keep caches may implement `warm(symbols, timeframe)` (prepare
+        newly added symbols) and `evict(symbols)`; both are optional.
+        """
+        if removed:
+            self.scheduler.forget(removed)
+            evict = getattr(self.market_data, "evict", None)
+            if evict is not None:
+                evict(list(removed))
+        if added:
+            warm = getattr(self.market_data, "warm", None)
+            if warm is not None:
+                warm(list(added), self.timeframe)
+
+    def _screen_sanity(
+        self,
+        sanity: SanityConfig,
+        screened: Sequence[Tuple[int, SymbolBars]],
+        timeframe: str,
+        table: SymbolStateTable,
+        span: SpanPort,
+        logger: LoggerPort,
+    ) -> int:
+        """Score `screened` rows for data quality and drop failing non-held ones.
+
+        Sets `sanity_score` for every screened row; returns the drop count.
+        """
+        from tycherion.domain.market.resampling import TIMEFRAME_MINUTES
+
+        from .sanity import SANITY_STAGE, evaluate_sanity
+
+        minutes = TIMEFRAME_MINUTES.get(timeframe.upper())
+        report = evaluate_sanity([bars.frame for _, bars in screened], sanity, minutes * 60 if minutes else None)
+        rows = [i for i, _ in screened]
+        if rows:
+            table.sanity_score[rows] = report.score
+
+        dropped = 0
+        for k, reason in enumerate(report.reason):
+            if not reason:
+                continue
+            i = rows[k]
+            table.fail_sanity(i)
+            if table.held[i]:
+                continue
+            dropped += 1
+            logger.emit(
+                "pipeline.symbol_dropped",
+                Severity.INFO,
+                {
+                    semconv.ATTR_CHANNEL: "audit",
+                    "symbol": table.symbols[i],
+                    "stage": SANITY_STAGE,
+                    "score": float(report.score[k]),
+                    "reason": reason,
+                },
             )
+        span.add_event(
+            semconv.EVT_PIPELINE_STAGE_COMPLETED,
+            {"stage": SANITY_STAGE, "passed_count": int(len(rows)), "dropped_count": int(dropped)},
+        )
+        return dropped
 
     def _resolve_models(self, pipeline_config: PipelineConfig) -> list[Tuple[PipelineStageConfig, SignalModel]]:
         pipeline: list[Tuple[PipelineStageConfig, SignalModel]] = []
@@ -228,48 +462,93 @@ class ModelPipelineService:
             pipeline.append((stage, model))
         return pipeline
 
-    def _safe_get_bars(
+    def _fetch_timeframe(self, indicators: Mapping[str, BaseIndicator]) -> str:
+        from .bars import fetch_timeframe
+
+        wanted = [getattr(ind, "timeframe", None) or self.timeframe for ind in indicators.values()]
+        return fetch_timeframe(self.timeframe, wanted)
+
+    def _report_fetch_error(
         self,
         symbol: str,
-        start: datetime,
-        end: datetime,
-        state: SymbolState,
+        e: BaseException,
+        table: SymbolStateTable,
+        i: int,
         span: SpanPort,
         logger: LoggerPort,
-    ) -> pd.DataFrame | None:
-        try:
-            return self.market_data.get_bars(symbol, self.timeframe, start, end)
-        except Exception as e:
-            state.notes["data_error"] = 1.0
-            span.record_exception(e)
-            logger.emit(
-                "error.exception",
-                Severity.ERROR,
-                {
-                    semconv.ATTR_CHANNEL: "ops",
-                    "symbol": symbol,
-                    "exception_type": type(e).__name__,
-                    "message": str(e),
-                    "stage": "get_bars",
-                },
-            )
-            return None
+    ) -> None:
+        table.mark_data_error(i)
+        span.record_exception(e)
+        logger.emit(
+            "error.exception",
+            Severity.ERROR,
+            {
+                semconv.ATTR_CHANNEL: "ops",
+                "symbol": symbol,
+                "exception_type": type(e).__name__,
+                "message": str(e),
+                "stage": "get_bars",
+            },
+        )
+
+    def _resolve_indicators(
+        self,
+        needed_keys: set[str],
+        span: SpanPort,
+        logger: LoggerPort,
+    ) -> Dict[str, BaseIndicator]:
+        resolved: Dict[str, BaseIndicator] = {}
+        for key in needed_keys:
+            try:
+                resolved[key] = self.indicator_picker(key, self.playbook)
+            except Exception as e:
+                # Reported once per run; every symbol then gets a neutral output.
+                span.record_exception(e)
+                logger.emit(
+                    "error.exception",
+                    Severity.ERROR,
+                    {
+                        semconv.ATTR_CHANNEL: "ops",
+                        "exception_type": type(e).__name__,
+                        "message": str(e),
+                        "stage": "indicator_resolve",
+                        "indicator": key,
+                    },
+                )
+        return resolved
 
     def _compute_indicators(
         self,
-        df: pd.DataFrame,
+        bars: SymbolBars,
         needed_keys: set[str],
-        state: SymbolState,
+        indicators: Mapping[str, BaseIndicator],
+        table: SymbolStateTable,
+        i: int,
         span: SpanPort,
         logger: LoggerPort,
     ) -> Dict[str, IndicatorOutput]:
         bundle: Dict[str, IndicatorOutput] = {}
         for key in needed_keys:
+            ind = indicators.get(key)
+            if ind is None:
+                table.mark_indicator_error(i, key)
+                bundle[key] = IndicatorOutput(score=0.0, features=NO_FEATURES)
+                continue
+            # `timeframe=None` means the pipeline's timeframe, not the fetched one.
+            tf = (getattr(ind, "timeframe", None) or self.timeframe).upper()
             try:
-                ind = self.indicator_picker(key, self.playbook)
-                bundle[key] = ind.compute(df.copy())
+                store = self.indicator_store
+                if store is None:
+                    bundle[key] = ind.compute_from(bars.context(tf))
+                    continue
+                cache_key = (table.symbols[i], tf, key, ind.method, bars.fingerprint(tf))
+                out = store.get(cache_key)
+                if out is None:
+                    out = ind.compute_from(bars.context(tf))
+                    store.put(cache_key, out)
+                bundle[key] = out
             except Exception as e:
-                state.notes[f"indicator_error_{key}"] = 1.0
+                table.mark_indicator_error(i, key)
                 span.record_exception(e)
                 logger.emit(
                     "error.exception",
@@ -282,45 +561,27 @@ class ModelPipelineService:
                         "indicator": key,
                     },
                 )
-                bundle[key] = IndicatorOutput(score=0.0, features={})
+                bundle[key] = IndicatorOutput(score=0.0, features=NO_FEATURES)
         return bundle
 
     def _run_stage(
         self,
         symbol: str,
+        stage_index: int,
         stage_cfg: PipelineStageConfig,
         model: SignalModel,
         indicators: Dict[str, IndicatorOutput],
-        state: SymbolState,
+        table: SymbolStateTable,
+        i: int,
         span: SpanPort,
         logger: LoggerPort,
     ) -> float:
         stage_name = stage_cfg.name
         try:
-            if logger.is_enabled(Severity.DEBUG):
-                try:
-                    logger.emit(
-                        "model.input_snapshot",
-                        Severity.DEBUG,
-                        {
-                            semconv.ATTR_CHANNEL: "debug",
-                            "symbol": symbol,
-                            "stage": stage_name,
-                            "model": stage_name,
-                            "indicator_keys": list(indicators.keys())[:30],
-                            "features_keys": {
-                                k: list(v.features.keys())[:20]
-                                for k, v in indicators.items()
-                                if getattr(v, "features", None)
-                            },
-                        },
-                    )
-                except Exception:
-                    pass
-
+            self._log_model_input(symbol, stage_name, indicators, logger)
             decision = model.decide(indicators)
         except Exception as e:
-            state.notes[f"model_error_{stage_name}"] = 1.0
+            table.mark_model_error(stage_index, i)
             span.record_exception(e)
             logger.emit(
                 "error.exception",
@@ -338,8 +599,103 @@ class ModelPipelineService:
             decision = ModelDecision(side="HOLD", weight=0.0, confidence=0.0)
 
         score = self._decision_to_score(decision)
-        state.pipeline_results.append(ModelStageResult(model_name=stage_name, score=score))
+        table.scores[stage_index, i] = score
+
+        self._log_decision(symbol, stage_name, score, decision, logger)
+        return score
+
+    def _run_stage_batch(
+        self,
+        stage_index: int,
+        stage_cfg: PipelineStageConfig,
+        model: SignalModel,
+        rows: list[int],
+        bundles: Mapping[int, Dict[str, IndicatorOutput]],
+        columns: Mapping[str, IndicatorColumns],
+        table: SymbolStateTable,
+        span: SpanPort,
+        logger: LoggerPort,
+    ) -> list[float]:
+        """Run one stage for table `rows`; `columns` are aligned with `rows`.
+
+        Uses `model.decide_batch` when the model implements it; otherwise, or
+        if the batch call fails, falls back to per-symbol `decide`.
+        """
+        stage_name = stage_cfg.name
+        n = len(rows)
+        batch = None
+        try:
+            batch = model.decide_batch(columns, n)
+            if batch is not None and not (len(batch) == len(batch.weight) == len(batch.confidence) == n):
+                raise ValueError(f"decide_batch returned {len(batch)} rows for {n} symbols")
+        except Exception as e:
+            # Reported once per stage; the per-symbol path below reports its own errors.
+            batch = None
+            span.record_exception(e)
+            logger.emit(
+                "error.exception",
+                Severity.ERROR,
+                {
+                    semconv.ATTR_CHANNEL: "ops",
+                    "stage": stage_name,
+                    "model": stage_name,
+                    "exception_type": type(e).__name__,
+                    "message": str(e),
+                    "stage_kind": "model_batch",
+                },
+            )
+
+        if batch is None:
+            return [
+                self._run_stage(table.symbols[i], stage_index, stage_cfg, model, bundles[i], table, i, span, logger)
+                for i in rows
+            ]
 
+        scores = batch.scores().tolist()
+        for row, (i, score) in enumerate(zip(rows, scores)):
+            symbol = table.symbols[i]
+            self._log_model_input(symbol, stage_name, bundles[i], logger)
+            table.scores[stage_index, i] = score
+            self._log_decision(symbol, stage_name, score, batch.decision(row), logger)
+        return scores
+
+    @staticmethod
+    def _log_model_input(
+        symbol: str,
+        stage_name: str,
+        indicators: Dict[str, IndicatorOutput],
+        logger: LoggerPort,
+    ) -> None:
+        if not logger.is_enabled(Severity.DEBUG):
+            return
+        try:
+            logger.emit(
+                "model.input_snapshot",
+                Severity.DEBUG,
+                {
+                    semconv.ATTR_CHANNEL: "debug",
+                    "symbol": symbol,
+                    "stage": stage_name,
+                    "model": stage_name,
+                    "indicator_keys": list(indicators.keys())[:30],
+                    "features_keys": {
+                        k: list(v.features.keys())[:20]
+                        for k, v in indicators.items()
+                        if getattr(v, "features", None)
+                    },
+                },
+            )
+        except Exception:
+            pass
+
+    @staticmethod
+    def _log_decision(
+        symbol: str,
+        stage_name: str,
+        score: float,
+        decision: ModelDecision,
+        logger: LoggerPort,
+    ) -> None:
         logger.emit(
             "model.decided",
             Severity.INFO,
@@ -354,7 +710,6 @@ class ModelPipelineService:
                 "confidence": float(decision.confidence or 0.0),
             },
         )
-        return score
 
     @staticmethod
     def _decision_to_score(d: ModelDecision) -> float:
@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Protocol, Sequence, Tuple
+
+from tycherion.domain.portfolio.entities import PortfolioSnapshot, Signal, SignalsBySymbol
+from tycherion.ports.market_data import MarketDataPort
+
+from tycherion.ports.observability import semconv
+from tycherion.ports.observability.observability import ObservabilityPort
+from tycherion.ports.observability.types import Severity, TYCHERION_SCHEMA_VERSION
+
+from .config import PipelineConfig
+from .result import PipelineRunResult
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from .service import ModelPipelineService
+
+
+def _hash64(key: str) -> int:
+    # Stable across processes and runs (unlike the builtin, salted `hash`).
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hash ring mapping symbols to shards.
+
+    Each shard owns `replicas` points on the ring; a symbol goes to the first
+    point at or after its hash. The same symbol lands on the same shard every
+    cycle, and changing the shard count moves only about 1/N of the symbols,
+    so per-worker caches stay warm.
+    """
+
+    __slots__ = ("shards", "_points", "_owners")
+
+    def __init__(self, shards: int, replicas: int = 64) -> None:
+        if shards < 1:
+            raise ValueError("HashRing needs at least one shard")
+        self.shards = int(shards)
+        ring = sorted((_hash64(f"shard-{s}#{r}"), s) for s in range(self.shards) for r in range(replicas))
+        self._points = [p for p, _ in ring]
+        self._owners = [s for _, s in ring]
+
+    def shard_of(self, symbol: str) -> int:
+        k = bisect.bisect_left(self._points, _hash64(symbol))
+        return self._owners[k % len(self._owners)]
+
+    def partition(self, symbols: Sequence[str]) -> List[List[str]]:
+        """Split `symbols` into one list per shard, keeping input order."""
+        parts: List[List[str]] = [[] for _ in range(self.shards)]
+        for sym in symbols:
+            parts[self.shard_of(sym)].append(sym)
+        return parts
+
+
+class BarStore(Protocol):
+    """Shared bar cache the coordinator fills and workers read (optional)."""
+
+    name: str
+    slots: int
+
+    def refresh(
+        self,
+        source: MarketDataPort,
+        symbols: Iterable[str],
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> None: ...
+
+    def close(self) -> None: ...
+
+
+# Pipe protocol (pickled tuples):
+#   coordinator -> worker: ("run", request dict) | ("universe", (added, removed)) | ("stop", None)
+#   worker -> coordinator: ("ok", cycle, reply dict) | ("error", cycle, "Type: message")
+# `cycle` echoes the request's "cycle" id; the coordinator drops replies to
+# any other cycle (e.g. late answers of a shard it stopped waiting for).
+
+# Errors of a pipe whose worker process is gone.
+_PIPE_ERRORS = (BrokenPipeError, ConnectionError, EOFError, OSError)
+
+
+def serve_pipeline(
+    conn: Connection,
+    service: ModelPipelineService,
+    observability: ObservabilityPort,
+    *,
+    attach_bars: Callable[[str, MarketDataPort], MarketDataPort] | None = None,
+) -> None:
+    """Worker loop: run `service` on each shard request until told to stop.
+
+    When a request names a shared bar store, `attach_bars(name, fallback)`
+    builds the market data port that reads it; the worker's own port stays
+    the fallback for bars the store does not hold.
+    """
+
+    store_name: str | None = None
+    shared_service = service
+    while True:
+        try:
+            op, payload = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if op == "stop":
+            return
+        if op == "universe":
+            # No reply: applied before the next "run" on this pipe.
+            added, removed = payload
+            try:
+                service.apply_universe_diff(added, removed)
+            except Exception:
+                pass  # cache hooks are best effort; the next run fetches anyway
+            continue
+        cycle = payload.get("cycle")
+        try:
+            name = payload.get("bar_store") if attach_bars is not None else None
+            if name and name != store_name:
+                # Same scheduler and plugins, bars read from the shared store.
+                shared_service = replace(service, market_data=attach_bars(name, service.market_data))
+                store_name = name
+            runner = shared_service if name else service
+            budget = payload.get("deadline_in")
+            result = runner.run(
+                universe_symbols=payload["symbols"],
+                portfolio_snapshot=payload["portfolio"],
+                pipeline_config=payload["pipeline_config"],
+                observability=observability,
+                as_of=payload["as_of"],
+                deadline=None if budget is None else time.monotonic() + float(budget),
+            )
+            conn.send(
+                (
+                    "ok",
+                    cycle,
+                    {
+                        "signals": {s: (sig.signed, sig.confidence) for s, sig in result.signals_by_symbol.items()},
+                        "stage_stats": dict(result.stage_stats),
+                        "degraded": bool(result.degraded),
+                        "skipped": list(result.skipped_symbols),
+                    },
+                )
+            )
+        except Exception as e:
+            conn.send(("error", cycle, f"{type(e).__name__}: {e}"))
+
+
+class ShardedPipelineService:
+    """Drop-in for `ModelPipelineService.run` that spreads the universe over
+    worker processes.
+
+    Symbols are partitioned with a `HashRing`; each worker runs its own
+    `ModelPipelineService` on its shard (see `serve_pipeline`) and the
+    per-shard signals are merged here. Allocation, balancing and execution
+    stay in the coordinator and run once.
+
+    `states_by_symbol` is not shipped back: the merged result carries an
+    empty mapping.
+
+    Replies are awaited until the cycle deadline plus `grace_seconds`, or
+    `reply_timeout` without a deadline. A shard that cannot be reached,
+    errors out or does not answer in time fails the cycle; its worker is
+    marked dead and, with `spawn_worker`, replaced before the next cycle.
+    """
+
+    def __init__(
+        self,
+        market_data: MarketDataPort,
+        timeframe: str,
+        lookback_days: int,
+        connections: Sequence[Connection],
+        processes: Sequence[BaseProcess] = (),
+        bar_store_factory: Callable[[int], BarStore] | None = None,
+        *,
+        spawn_worker: Callable[[int], Tuple[Connection, BaseProcess | None]] | None = None,
+        reply_timeout: float | None = 300.0,
+        grace_seconds: float = 10.0,
+    ) -> None:
+        if not connections:
+            raise ValueError("ShardedPipelineService needs at least one worker")
+        self.market_data = market_data
+        self.timeframe = timeframe
+        self.lookback_days = lookback_days
+        self._connections = list(connections)
+        self._processes: List[BaseProcess | None] = list(processes) or [None] * len(self._connections)
+        self.ring = HashRing(len(self._connections))
+        # Shared bars: fetched once here, read zero-copy by the workers.
+        self._bar_store_factory = bar_store_factory
+        self.bar_store: BarStore | None = None
+        self._spawn_worker = spawn_worker
+        self.reply_timeout = reply_timeout
+        self.grace_seconds = float(grace_seconds)
+        self._cycle = 0
+        self._dead: set[int] = set()
+
+    def run(
+        self,
+        universe_symbols: list[str],
+        portfolio_snapshot: PortfolioSnapshot,
+        pipeline_config: PipelineConfig,
+        *,
+        observability: ObservabilityPort,
+        as_of: datetime | None = None,
+        deadline: float | None = None,
+    ) -> PipelineRunResult:
+        tracer = observability.traces.get_tracer("tycherion.pipeline.sharded", version=TYCHERION_SCHEMA_VERSION)
+        logger = observability.logs.get_logger("tycherion.pipeline.sharded", version=TYCHERION_SCHEMA_VERSION)
+
+        as_of = as_of or datetime.now(timezone.utc)
+        if deadline is None and pipeline_config.cycle_deadline_seconds is not None:
+            deadline = time.monotonic() + float(pipeline_config.cycle_deadline_seconds)
+
+        parts = self.ring.partition(universe_symbols)
+        with tracer.start_as_current_span(
+            semconv.SPAN_PIPELINE,
+            attributes={
+                "symbols_count": int(len(universe_symbols)),
+                "stages": [st.name for st in pipeline_config.stages],
+                "timeframe": self.timeframe,
+                "lookback_days": int(self.lookback_days),
+                "execution": pipeline_config.execution,
+                "shards": int(len(parts)),
+                "shard_sizes": [len(p) for p in parts],
+            },
+        ) as span:
+            t0 = time.perf_counter()
+            self._cycle += 1
+            cycle = self._cycle
+            failures: List[str] = []
+            restarted = self._restart_dead_workers(failures)
+            if restarted:
+                span.set_attribute("shards_restarted", restarted)
+            store_name = None
+            if self._bar_store_factory is not None:
+                store_name = self._load_shared_bars(universe_symbols, as_of)
+                span.set_attribute("shared_bars_ms", round((time.perf_counter() - t0) * 1000.0, 3))
+
+            # Fan out first so the shards run in parallel, then collect from
+            # every shard that was sent to, whatever happened to the others.
+            busy: List[int] = []
+            for shard, symbols in enumerate(parts):
+                if not symbols:
+                    continue
+                if shard in self._dead:
+                    failures.append(f"shard {shard}: worker unavailable")
+                    continue
+                held = {s: portfolio_snapshot.positions[s] for s in symbols if s in portfolio_snapshot.positions}
+                try:
+                    self._connections[shard].send(
+                        (
+                            "run",
+                            {
+                                "cycle": cycle,
+                                "symbols": symbols,
+                                "portfolio": PortfolioSnapshot(equity=portfolio_snapshot.equity, positions=held),
+                                "pipeline_config": pipeline_config,
+                                "as_of": as_of,
+                                "deadline_in": None if deadline is None else max(0.0, deadline - time.monotonic()),
+                                "bar_store": store_name,
+                            },
+                        )
+                    )
+                except _PIPE_ERRORS as e:
+                    self._dead.add(shard)
+                    failures.append(f"shard {shard}: {type(e).__name__}: {e}")
+                    continue
+                busy.append(shard)
+
+            wait_until: float | None = None
+            if deadline is not None:
+                wait_until = deadline + self.grace_seconds
+            elif self.reply_timeout is not None:
+                wait_until = time.monotonic() + float(self.reply_timeout)
+            replies: Dict[int, Mapping[str, Any]] = {}
+            for shard in busy:
+                status, payload = self._receive(shard, cycle, wait_until)
+                if status == "ok":
+                    replies[shard] = payload
+                else:
+                    failures.append(f"shard {shard}: {payload}")
+
+            if failures:
+                # A missing shard would drop held symbols from the signals and
+                # read as "sell": fail the cycle instead.
+                for msg in failures:
+                    logger.emit(
+                        "pipeline.shard_failed",
+                        Severity.ERROR,
+                        {semconv.ATTR_CHANNEL: "ops", "message": msg},
+                    )
+                raise RuntimeError(f"{len(failures)} pipeline shard(s) failed: {'; '.join(failures)}")
+
+            signals: SignalsBySymbol = {}
+            stage_stats: Dict[str, int] = {st.name: 0 for st in pipeline_config.stages}
+            skipped: List[str] = []
+            degraded = False
+            for shard in busy:
+                reply = replies[shard]
+                for sym, (signed, confidence) in reply["signals"].items():
+                    signals[sym] = Signal(symbol=sym, signed=float(signed), confidence=float(confidence))
+                for name, count in reply["stage_stats"].items():
+                    stage_stats[name] = int(stage_stats.get(name, 0)) + int(count)
+                skipped.extend(reply["skipped"])
+                degraded = degraded or bool(reply["degraded"])
+
+            span.set_attribute(semconv.ATTR_CYCLE_STATUS, "degraded" if degraded else "ok")
+            span.add_event(
+                semconv.EVT_PIPELINE_SUMMARY,
+                {
+                    "signals_count": int(len(signals)),
+                    "elapsed_ms": round((time.perf_counter() - t0) * 1000.0, 3),
+                },
+            )
+
+            return PipelineRunResult(
+                pipeline_config=pipeline_config,
+                states_by_symbol={},
+                signals_by_symbol=signals,
+                stage_stats=stage_stats,
+                degraded=degraded,
+                skipped_symbols=tuple(skipped),
+            )
+
+    def apply_universe_diff(self, added: Sequence[str], removed: Sequence[str]) -> None:
+        """Forward a coverage change to the workers owning the symbols."""
+        added_parts = self.ring.partition(list(added))
+        removed_parts = self.ring.partition(list(removed))
+        for shard, conn in enumerate(self._connections):
+            if shard in self._dead or not (added_parts[shard] or removed_parts[shard]):
+                continue
+            try:
+                conn.send(("universe", (added_parts[shard], removed_parts[shard])))
+            except _PIPE_ERRORS:
+                self._dead.add(shard)
+
+    def _receive(self, shard: int, cycle: int, wait_until: float | None) -> Tuple[str, Any]:
+        """The shard's reply to `cycle`, skipping replies to earlier cycles.
+
+        A shard that exits or misses `wait_until` is marked dead: a late
+        reply would otherwise be read as the answer to a later cycle.
+        """
+        conn = self._connections[shard]
+        while True:
+            timeout = None if wait_until is None else max(0.0, wait_until - time.monotonic())
+            try:
+                if not conn.poll(timeout):
+                    self._dead.add(shard)
+                    return "error", "no reply in time (worker hung)"
+                msg = conn.recv()
+            except _PIPE_ERRORS as e:
+                self._dead.add(shard)
+                return "error", f"{type(e).__name__}: worker exited"
+            status, reply_cycle, payload = msg
+            if reply_cycle == cycle:
+                return status, payload
+
+    def _restart_dead_workers(self, failures: List[str]) -> int:
+        """Replace dead (or exited) workers through `spawn_worker`."""
+        for shard, proc in enumerate(self._processes):
+            if proc is not None and not proc.is_alive():
+                self._dead.add(shard)
+        if self._spawn_worker is None:
+            return 0
+        restarted = 0
+        for shard in sorted(self._dead):
+            self._stop_worker(shard)
+            try:
+                conn, proc = self._spawn_worker(shard)
+            except Exception as e:
+                failures.append(f"shard {shard}: restart failed: {type(e).__name__}: {e}")
+                continue
+            self._connections[shard] = conn
+            self._processes[shard] = proc
+            self._dead.discard(shard)
+            restarted += 1
+        return restarted
+
+    def _stop_worker(self, shard: int) -> None:
+        proc = self._processes[shard]
+        if proc is not None and proc.is_alive():
+            proc.terminate()
+            proc.join(1.0)
+        try:
+            self._connections[shard].close()
+        except Exception:
+            pass
+
+    def _load_shared_bars(self, symbols: Sequence[str], as_of: datetime) -> str:
+        assert self._bar_store_factory is not None
+        store = self.bar_store
+        if store is None or store.slots < len(symbols):
+            # Sized for the universe with headroom; regrown (new name) if outgrown.
+            # Slots of symbols that left coverage are freed by `refresh`.
+            if store is not None:
+                store.close()
+            store = self.bar_store = self._bar_store_factory(len(symbols))
+        start = as_of - timedelta(days=int(self.lookback_days))
+        store.refresh(self.market_data, symbols, self.timeframe, start, as_of)
+        return store.name
+
+    def close(self, timeout: float = 5.0) -> None:
+        for conn in self._connections:
+            try:
+                conn.send(("stop", None))
+            except Exception:
+                pass
+        for proc in self._processes:
+            if proc is None:
+                continue
+            proc.join(timeout)
+            if proc.is_alive():
+                proc.terminate()
+        for conn in self._connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        if self.bar_store is not None:
+            self.bar_store.close()
+            self.bar_store = None
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Mapping, Sequence
+
+import numpy as np
+
+from tycherion.domain.signals.entities import ModelStageResult, SymbolState
+
+# Per-symbol flags (`SymbolStateTable.flags`).
+DATA_ERROR = np.uint8(1)
+FETCH_TIMEOUT = np.uint8(2)
+DEADLINE_SKIPPED = np.uint8(4)
+SANITY_DROPPED = np.uint8(8)
+SANITY_FAILED = np.uint8(16)
+
+# Per-stage, per-symbol flags (`SymbolStateTable.stage_flags`).
+STAGE_DROPPED = np.uint8(1)
+STAGE_BELOW_THRESHOLD = np.uint8(2)
+STAGE_MODEL_ERROR = np.uint8(4)
+
+
+class SymbolStateTable:
+    """Columnar per-symbol pipeline state for one run.
+
+    Struct-of-arrays replacement for one `SymbolState` (plus its `notes` dict and
+    `pipeline_results` list) per symbol. Row `i` is `symbols[i]`.
+
+    - `held`, `alive`: bool vectors
+    - `base_score` .. `alpha_score`: float64 vectors
+    - `confidence`: final confidence, NaN until set
+    - `scores`: stage x symbol matrix, NaN where the stage did not run
+    - `flags` / `stage_flags` / `indicator_errors`: the notes as bitflags
+
+    `SymbolState` objects are only built on demand, through `state_of` or the
+    `SymbolStatesView` mapping exposed on `PipelineRunResult.states_by_symbol`.
+    """
+
+    __slots__ = (
+        "symbols",
+        "stages",
+        "indicator_keys",
+        "index",
+        "held",
+        "alive",
+        "base_score",
+        "sanity_score",
+        "macro_score",
+        "alpha_score",
+        "confidence",
+        "scores",
+        "flags",
+        "stage_flags",
+        "indicator_errors",
+        "_indicator_index",
+    )
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        stages: Sequence[str],
+        held_symbols: set[str] | frozenset[str] = frozenset(),
+        indicator_keys: Sequence[str] = (),
+    ) -> None:
+        self.symbols: tuple[str, ...] = tuple(dict.fromkeys(symbols))
+        self.stages: tuple[str, ...] = tuple(stages)
+        self.indicator_keys: tuple[str, ...] = tuple(indicator_keys)
+        self.index: Dict[str, int] = {sym: i for i, sym in enumerate(self.symbols)}
+        self._indicator_index: Dict[str, int] = {k: j for j, k in enumerate(self.indicator_keys)}
+
+        n, s, k = len(self.symbols), len(self.stages), len(self.indicator_keys)
+        self.held = np.fromiter((sym in held_symbols for sym in self.symbols), dtype=bool, count=n)
+        self.alive = np.ones(n, dtype=bool)
+        self.base_score = np.zeros(n, dtype=np.float64)
+        self.sanity_score = np.zeros(n, dtype=np.float64)
+        self.macro_score = np.zeros(n, dtype=np.float64)
+        self.alpha_score = np.zeros(n, dtype=np.float64)
+        self.confidence = np.full(n, np.nan, dtype=np.float64)
+        self.scores = np.full((s, n), np.nan, dtype=np.float64)
+        self.flags = np.zeros(n, dtype=np.uint8)
+        self.stage_flags = np.zeros((s, n), dtype=np.uint8)
+        self.indicator_errors = np.zeros((k, n), dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def active(self, i: int) -> bool:
+        """A row keeps flowing through the pipeline while alive or held."""
+        return bool(self.alive[i] or self.held[i])
+
+    def active_mask(self) -> np.ndarray:
+        return self.alive | self.held
+
+    def active_indices(self) -> List[int]:
+        return np.flatnonzero(self.active_mask()).tolist()
+
+    def mark_data_error(self, i: int) -> None:
+        self.flags[i] |= DATA_ERROR
+
+    def mark_fetch_timeout(self, i: int) -> None:
+        self.flags[i] |= FETCH_TIMEOUT
+
+    def skip(self, i: int) -> None:
+        """Leave row `i` out of this cycle (its data missed the cycle deadline)."""
+        self.alive[i] = False
+        self.flags[i] |= DEADLINE_SKIPPED
+
+    def fail_sanity(self, i: int) -> None:
+        """Row `i` failed the data-quality pre-filter: dropped unless held."""
+        if self.held[i]:
+            self.flags[i] |= SANITY_FAILED
+        else:
+            self.alive[i] = False
+            self.flags[i] |= SANITY_DROPPED
+
+    def mark_model_error(self, stage: int, i: int) -> None:
+        self.stage_flags[stage, i] |= STAGE_MODEL_ERROR
+
+    def mark_below_threshold(self, stage: int, i: int) -> None:
+        self.stage_flags[stage, i] |= STAGE_BELOW_THRESHOLD
+
+    def drop(self, stage: int, i: int) -> None:
+        self.alive[i] = False
+        self.stage_flags[stage, i] |= STAGE_DROPPED
+
+    def mark_indicator_error(self, i: int, key: str) -> None:
+        j = self._indicator_index.get(key)
+        if j is None:
+            # Key outside the declared set: extend once, errors are rare.
+            j = len(self.indicator_keys)
+            self.indicator_keys = (*self.indicator_keys, key)
+            self._indicator_index[key] = j
+            self.indicator_errors = np.vstack([self.indicator_errors, np.zeros((1, len(self.symbols)), dtype=bool)])
+        self.indicator_errors[j, i] = True
+
+    def finalize(self, rows: Sequence[int]) -> None:
+        """Final signal fields for `rows` (v1 rule: last stage score)."""
+        idx = np.asarray(rows, dtype=np.intp)
+        if idx.size == 0:
+            return
+        ran = ~np.isnan(self.scores[:, idx])
+        if ran.shape[0] == 0:
+            last = np.zeros(idx.size, dtype=np.float64)
+        else:
+            last_stage = ran.shape[0] - 1 - np.argmax(ran[::-1], axis=0)
+            picked = self.scores[last_stage, idx]
+            last = np.where(ran.any(axis=0), picked, 0.0)
+        self.alpha_score[idx] = last
+        self.confidence[idx] = np.abs(last)
+
+    def confidence_of(self, i: int) -> float:
+        c = self.confidence[i]
+        return abs(float(self.alpha_score[i])) if np.isnan(c) else float(c)
+
+    def notes_of(self, i: int) -> Dict[str, float]:
+        """Rebuild the legacy `SymbolState.notes` dict for row `i`."""
+        notes: Dict[str, float] = {}
+        if self.flags[i] & DATA_ERROR:
+            notes["data_error"] = 1.0
+        if self.flags[i] & FETCH_TIMEOUT:
+            notes["fetch_timeout"] = 1.0
+        if self.flags[i] & DEADLINE_SKIPPED:
+            notes["skipped_deadline"] = 1.0
+        if self.flags[i] & SANITY_DROPPED:
+            notes["dropped_by_sanity"] = 1.0
+        if self.flags[i] & SANITY_FAILED:
+            notes["sanity_failed"] = 1.0
+        for j in np.flatnonzero(self.indicator_errors[:, i]):
+            notes[f"indicator_error_{self.indicator_keys[j]}"] = 1.0
+        for s in np.flatnonzero(self.stage_flags[:, i]):
+            stage = self.stages[s]
+            f = self.stage_flags[s, i]
+            if f & STAGE_MODEL_ERROR:
+                notes[f"model_error_{stage}"] = 1.0
+            if f & STAGE_BELOW_THRESHOLD:
+                notes[f"below_threshold_{stage}"] = 1.0
+            if f & STAGE_DROPPED:
+                notes[f"dropped_by_{stage}"] = 1.0
+        c = self.confidence[i]
+        if not np.isnan(c):
+            notes["final_confidence"] = float(c)
+        return notes
+
+    def state_of(self, i: int) -> SymbolState:
+        """Materialize row `i` as a standalone `SymbolState` (a copy)."""
+        col = self.scores[:, i]
+        results: List[ModelStageResult] = [
+            ModelStageResult(model_name=self.stages[s], score=float(col[s]))
+            for s in np.flatnonzero(~np.isnan(col))
+        ]
+        return SymbolState(
+            symbol=self.symbols[i],
+            is_held=bool(self.held[i]),
+            alive=bool(self.alive[i]),
+            base_score=float(self.base_score[i]),
+            sanity_score=float(self.sanity_score[i]),
+            macro_score=float(self.macro_score[i]),
+            alpha_score=float(self.alpha_score[i]),
+            pipeline_results=results,
+            notes=self.notes_of(i),
+        )
+
+
+class SymbolStatesView(Mapping[str, SymbolState]):
+    """Read-only `symbol -> SymbolState` mapping over a `SymbolStateTable`.
+
+    States are built on first access and cached, so repeated lookups return
+    the same object.
+    """
+
+    __slots__ = ("table", "_cache")
+
+    def __init__(self, table: SymbolStateTable) -> None:
+        self.table = table
+        self._cache: Dict[str, SymbolState] = {}
+
+    def __getitem__(self, symbol: str) -> SymbolState:
+        state = self._cache.get(symbol)
+        if state is None:
+            state = self.table.state_of(self.table.index[symbol])
+            self._cache[symbol] = state
+        return state
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.table.symbols)
+
+    def __len__(self) -> int:
+        return len(self.table.symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self.table.index
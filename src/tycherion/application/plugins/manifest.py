@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import ast
+import importlib.util
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = "plugins-manifest.json"
+
+# Decorator name -> manifest kind.
+_DECORATORS: Dict[str, str] = {
+    "register_indicator": "indicator",
+    "register_model": "model",
+    "register_allocator": "allocator",
+    "register_balancer": "balancer",
+}
+# Module-level calls with registry side effects we cannot describe statically.
+_SIDE_EFFECT_CALLS = set(_DECORATORS) | {"set_default_indicator_method"}
+
+
+@dataclass(frozen=True, slots=True)
+class PluginEntry:
+    """One registration found in a plugin module (no import needed)."""
+
+    kind: str  # indicator | model | allocator | balancer
+    name: str  # indicator key, or model/allocator/balancer name
+    method: str | None = None
+    tags: tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
+class ModuleRecord:
+    module: str
+    path: str
+    mtime_ns: int
+    size: int
+    entries: List[PluginEntry] = field(default_factory=list)
+    # True when registrations could not be read statically; always imported.
+    dynamic: bool = False
+
+
+@dataclass(slots=True)
+class PluginManifest:
+    modules: Dict[str, ModuleRecord]
+
+    def modules_for(self, kind: str, names: Iterable[str]) -> set[str]:
+        wanted = set(names)
+        return {
+            rec.module
+            for rec in self.modules.values()
+            for e in rec.entries
+            if e.kind == kind and e.name in wanted
+        }
+
+    def names(self, kind: str) -> set[str]:
+        return {e.name for rec in self.modules.values() for e in rec.entries if e.kind == kind}
+
+    def dynamic_modules(self) -> set[str]:
+        return {rec.module for rec in self.modules.values() if rec.dynamic}
+
+
+def default_cache_dir() -> Path:
+    env = (os.getenv("TYCHERION_CACHE_DIR") or "").strip()
+    if env:
+        return Path(env)
+    return Path.home() / ".cache" / "tycherion"
+
+
+def _call_name(node: ast.AST) -> str | None:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _scan_source(source: str, filename: str) -> tuple[List[PluginEntry], bool]:
+    tree = ast.parse(source, filename=filename)
+    entries: List[PluginEntry] = []
+    decorator_calls: set[int] = set()
+    dynamic = False
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for deco in node.decorator_list:
+            if not isinstance(deco, ast.Call):
+                continue
+            kind = _DECORATORS.get(_call_name(deco.func) or "")
+            if kind is None:
+                continue
+            decorator_calls.add(id(deco))
+            try:
+                kw = {k.arg: ast.literal_eval(k.value) for k in deco.keywords if k.arg}
+            except ValueError:
+                dynamic = True
+                continue
+            ident = kw.get("key") if kind == "indicator" else kw.get("name")
+            if not isinstance(ident, str):
+                dynamic = True
+                continue
+            entries.append(
+                PluginEntry(
+                    kind=kind,
+                    name=ident,
+                    method=str(kw["method"]) if kind == "indicator" and "method" in kw else None,
+                    tags=tuple(sorted(str(t) for t in (kw.get("tags") or ()))),
+                )
+            )
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and id(node) not in decorator_calls:
+            if (_call_name(node.func) or "") in _SIDE_EFFECT_CALLS:
+                dynamic = True
+                break
+
+    return entries, dynamic
+
+
+def _iter_plugin_files(base: str) -> Iterable[tuple[str, Path]]:
+    """Yield (module_name, path) like pkgutil.walk_packages, without importing plugins."""
+
+    spec = importlib.util.find_spec(base)
+    locations = list(getattr(spec, "submodule_search_locations", None) or []) if spec else []
+    for root in locations:
+        root_path = Path(root)
+        for path in sorted(root_path.rglob("*.py")):
+            rel = path.relative_to(root_path)
+            # Sub-packages are only walked when they are real packages.
+            if any(not (root_path.joinpath(*rel.parts[: i + 1]) / "__init__.py").exists() for i in range(len(rel.parts) - 1)):
+                continue
+            parts = list(rel.with_suffix("").parts)
+            if parts[-1] == "__init__":
+                parts = parts[:-1]
+                if not parts:
+                    continue
+            yield ".".join([base, *parts]), path
+
+
+def _load_cached(path: Path) -> Dict[str, ModuleRecord]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != MANIFEST_VERSION:
+        return {}
+    out: Dict[str, ModuleRecord] = {}
+    for item in raw.get("modules", []):
+        try:
+            out[item["module"]] = ModuleRecord(
+                module=item["module"],
+                path=item["path"],
+                mtime_ns=int(item["mtime_ns"]),
+                size=int(item["size"]),
+                entries=[
+                    PluginEntry(
+                        kind=e["kind"],
+                        name=e["name"],
+                        method=e.get("method"),
+                        tags=tuple(e.get("tags") or ()),
+                    )
+                    for e in item.get("entries", [])
+                ],
+                dynamic=bool(item.get("dynamic", False)),
+            )
+        except Exception:
+            continue
+    return out
+
+
+def _dump(path: Path, modules: Dict[str, ModuleRecord]) -> None:
+    payload: Dict[str, Any] = {
+        "version": MANIFEST_VERSION,
+        "modules": [
+            {
+                "module": rec.module,
+                "path": rec.path,
+                "mtime_ns": rec.mtime_ns,
+                "size": rec.size,
+                "dynamic": rec.dynamic,
+                "entries": [
+                    {"kind": e.kind, "name": e.name, "method": e.method, "tags": list(e.tags)}
+                    for e in rec.entries
+                ],
+            }
+            for rec in sorted(modules.values(), key=lambda r: r.module)
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_manifest(bases: Iterable[str], *, cache_dir: str | Path | None = None) -> PluginManifest:
+    """Return the plugin manifest for `bases`, rescanning only modules whose
+    file mtime or size changed since the cached copy was written.
+    """
+
+    cache_path = Path(cache_dir) if cache_dir else default_cache_dir()
+    cache_file = cache_path / MANIFEST_FILENAME
+    cached = _load_cached(cache_file)
+
+    modules: Dict[str, ModuleRecord] = {}
+    changed = False
+    for base in bases:
+        for module, path in _iter_plugin_files(base):
+            st = path.stat()
+            prev = cached.get(module)
+            if prev is not None and prev.path == str(path) and prev.mtime_ns == st.st_mtime_ns and prev.size == st.st_size:
+                modules[module] = prev
+                continue
+            changed = True
+            try:
+                entries, dynamic = _scan_source(path.read_text(encoding="utf-8"), str(path))
+            except (SyntaxError, UnicodeDecodeError):
+                entries, dynamic = [], True
+            modules[module] = ModuleRecord(
+                module=module,
+                path=str(path),
+                mtime_ns=st.st_mtime_ns,
+                size=st.st_size,
+                entries=entries,
+                dynamic=dynamic,
+            )
+
+    if changed or set(modules) != set(cached):
+        try:
+            _dump(cache_file, modules)
+        except OSError:
+            # Read-only home / container: the manifest still works, just uncached.
+            pass
+
+    return PluginManifest(modules=modules)
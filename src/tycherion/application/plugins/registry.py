@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from typing import Dict, List, Iterable
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Iterable, Mapping, Tuple
 
 from tycherion.ports.observability.observability import ObservabilityPort
 from tycherion.ports.observability.types import Severity, TYCHERION_SCHEMA_VERSION
 
-from tycherion.domain.signals.indicators.base import BaseIndicator
-from tycherion.domain.signals.models.base import SignalModel
-from tycherion.domain.portfolio.allocators.base import BaseAllocator
-from tycherion.domain.portfolio.balancers.base import BaseBalancer
+if TYPE_CHECKING:
+    # Annotation-only: the indicator base pulls pandas, which plugin modules
+    # load themselves when (and if) they are imported.
+    from tycherion.domain.signals.indicators.base import BaseIndicator
+    from tycherion.domain.signals.models.base import SignalModel
+    from tycherion.domain.portfolio.allocators.base import BaseAllocator
+    from tycherion.domain.portfolio.balancers.base import BaseBalancer
 
 INDICATORS: Dict[str, List[BaseIndicator]] = {}
 MODELS: Dict[str, SignalModel] = {}
@@ -16,6 +20,22 @@ ALLOCATORS: Dict[str, BaseAllocator] = {}
 BALANCERS: Dict[str, BaseBalancer] = {}
 DEFAULT_METHOD: Dict[str, str] = {}
 
+PLUGIN_PACKAGES = (
+    "tycherion.domain.signals.indicators",
+    "tycherion.domain.signals.models",
+    "tycherion.domain.portfolio.allocators",
+    "tycherion.domain.portfolio.balancers",
+)
+
+# Frozen (key, playbook) -> indicator table. Built lazily from INDICATORS and
+# DEFAULT_METHOD; any registration change drops it so it is rebuilt on next use.
+_RESOLUTION: Mapping[Tuple[str, str | None], BaseIndicator] | None = None
+
+
+def _invalidate_resolution() -> None:
+    global _RESOLUTION
+    _RESOLUTION = None
+
 
 def register_indicator(*, key: str, method: str, tags: set[str]):
     """Register an indicator implementation for a given logical key (e.g. "trend")
@@ -28,6 +48,7 @@ def register_indicator(*, key: str, method: str, tags: set[str]):
         inst.method = method
         inst.tags = tags
         INDICATORS.setdefault(key, []).append(inst)
+        _invalidate_resolution()
         return cls
 
     return deco
@@ -74,10 +95,11 @@ def register_balancer(*, name: str, tags: set[str]):
 
 def set_default_indicator_method(key: str, method: str) -> None:
     DEFAULT_METHOD[key] = method
+    _invalidate_resolution()
 
 
-def pick_indicator_for(key: str, playbook: str | None = None) -> BaseIndicator:
-    """Pick an indicator instance for a given key and (optionally) playbook."""
+def _resolve_indicator(key: str, playbook: str | None) -> BaseIndicator:
+    """Apply the canonical resolution rules (see docs/reference/plugins.md)."""
 
     candidates: Iterable[BaseIndicator] = INDICATORS.get(key, [])
     candidates = list(candidates)
@@ -105,6 +127,40 @@ def pick_indicator_for(key: str, playbook: str | None = None) -> BaseIndicator:
     return candidates[0]
 
 
+def compile_indicator_resolution() -> Mapping[Tuple[str, str | None], BaseIndicator]:
+    """Build the frozen (key, playbook) -> indicator table for all registered keys.
+
+    Only playbooks that appear as a tag on some indicator of a key can change the
+    result for that key, so the table holds `(key, None)` plus `(key, tag)` for
+    those tags; any other playbook resolves like `None`.
+    """
+
+    global _RESOLUTION
+    table: Dict[Tuple[str, str | None], BaseIndicator] = {}
+    for key, impls in INDICATORS.items():
+        if not impls:
+            continue
+        table[(key, None)] = _resolve_indicator(key, None)
+        for ind in impls:
+            for tag in getattr(ind, "tags", set()) or ():
+                if (key, tag) not in table:
+                    table[(key, tag)] = _resolve_indicator(key, tag)
+    _RESOLUTION = MappingProxyType(table)
+    return _RESOLUTION
+
+
+def pick_indicator_for(key: str, playbook: str | None = None) -> BaseIndicator:
+    """Pick an indicator instance for a given key and (optionally) playbook."""
+
+    table = _RESOLUTION if _RESOLUTION is not None else compile_indicator_resolution()
+    ind = table.get((key, playbook or None))
+    if ind is None:
+        ind = table.get((key, None))
+    if ind is None:
+        raise KeyError(f"No indicators registered for key={key!r}")
+    return ind
+
+
 def auto_discover(*, observability: ObservabilityPort | None) -> None:
     """Import all plugin modules so that their decorators run and fill registries."""
 
@@ -120,12 +176,7 @@ def auto_discover(*, observability: ObservabilityPort | None) -> None:
         attrs = {"tycherion.channel": "ops", **data}
         logger.emit(body, severity, attrs)
 
-    bases = (
-        "tycherion.domain.signals.indicators",
-        "tycherion.domain.signals.models",
-        "tycherion.domain.portfolio.allocators",
-        "tycherion.domain.portfolio.balancers",
-    )
+    bases = PLUGIN_PACKAGES
 
     if tracer is None:
         # No observability: best effort discovery without logs.
@@ -133,6 +184,7 @@ def auto_discover(*, observability: ObservabilityPort | None) -> None:
             pkg = importlib.import_module(base)
             for mod in pkgutil.walk_packages(getattr(pkg, "__path__", None), pkg.__name__ + "."):
                 importlib.import_module(mod.name)
+        compile_indicator_resolution()
         return
 
     with tracer.start_as_current_span("plugins.discover", attributes={"component": "plugins"}):
@@ -153,11 +205,108 @@ def auto_discover(*, observability: ObservabilityPort | None) -> None:
                 except Exception as e:
                     _log("plugins.module_import_failed", Severity.WARN, module=mod.name, error=str(e))
 
+        compile_indicator_resolution()
+
+        _log(
+            "plugins.discovered",
+            Severity.INFO,
+            indicators_count=int(sum(len(v) for v in INDICATORS.values())),
+            models_count=int(len(MODELS)),
+            allocators_count=int(len(ALLOCATORS)),
+            balancers_count=int(len(BALANCERS)),
+        )
+
+
+def discover_lazy(
+    *,
+    models: Iterable[str],
+    allocators: Iterable[str] = (),
+    balancers: Iterable[str] = (),
+    observability: ObservabilityPort | None,
+    cache_dir: str | None = None,
+) -> None:
+    """Import only the plugin modules needed by the given names.
+
+    Uses the on-disk plugin manifest (see `manifest.py`) to map names to modules,
+    imports the requested models, allocators and balancers, then the indicator
+    modules for every key those models `requires()`. Falls back to
+    `auto_discover` when a name is not in the manifest.
+    """
+
+    import importlib
+
+    from tycherion.application.plugins.manifest import load_manifest
+
+    tracer = observability.traces.get_tracer("tycherion.plugins", version=TYCHERION_SCHEMA_VERSION) if observability else None
+    logger = observability.logs.get_logger("tycherion.plugins", version=TYCHERION_SCHEMA_VERSION) if observability else None
+
+    def _log(body: str, severity: Severity, **data) -> None:
+        if logger is None:
+            return
+        attrs = {"tycherion.channel": "ops", **data}
+        logger.emit(body, severity, attrs)
+
+    model_names = set(models)
+    allocator_names = set(allocators)
+    balancer_names = set(balancers)
+
+    def _import(modules: Iterable[str]) -> None:
+        for name in sorted(modules):
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                _log("plugins.module_import_failed", Severity.WARN, module=name, error=str(e))
+
+    def _run() -> None:
+        try:
+            manifest = load_manifest(PLUGIN_PACKAGES, cache_dir=cache_dir)
+        except Exception as e:
+            _log("plugins.manifest_failed", Severity.WARN, error=str(e))
+            auto_discover(observability=observability)
+            return
+
+        missing = sorted(
+            (model_names - manifest.names("model"))
+            | (allocator_names - manifest.names("allocator"))
+            | (balancer_names - manifest.names("balancer"))
+        )
+        if missing:
+            _log("plugins.manifest_miss", Severity.WARN, names=missing)
+            auto_discover(observability=observability)
+            return
+
+        _import(
+            manifest.dynamic_modules()
+            | manifest.modules_for("model", model_names)
+            | manifest.modules_for("allocator", allocator_names)
+            | manifest.modules_for("balancer", balancer_names)
+        )
+
+        indicator_keys: set[str] = set()
+        for name in model_names:
+            model = MODELS.get(name)
+            if model is None:
+                continue
+            try:
+                indicator_keys.update(model.requires() or set())
+            except Exception:
+                pass
+        _import(manifest.modules_for("indicator", indicator_keys))
+        compile_indicator_resolution()
+
         _log(
             "plugins.discovered",
             Severity.INFO,
+            mode="lazy",
+            modules_count=int(len(manifest.modules)),
             indicators_count=int(sum(len(v) for v in INDICATORS.values())),
             models_count=int(len(MODELS)),
             allocators_count=int(len(ALLOCATORS)),
             balancers_count=int(len(BALANCERS)),
         )
+
+    if tracer is None:
+        _run()
+        return
+    with tracer.start_as_current_span("plugins.discover", attributes={"component": "plugins", "mode": "lazy"}):
+        _run()
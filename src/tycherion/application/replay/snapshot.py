@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tycherion.domain.market.columns import BarColumns, as_frame
+from tycherion.domain.portfolio.entities import PortfolioSnapshot, Position
+from tycherion.ports.market_data import MarketDataPort
+
+SNAPSHOT_VERSION = 1
+
+# (symbol, timeframe) of one `get_bars` / `get_bar_columns` call.
+BarKey = Tuple[str, str]
+
+
+@dataclass(slots=True)
+class CycleSnapshot:
+    """Inputs of one live cycle, enough to re-run it without a broker.
+
+    Holds the analysis time (`as_of`), the coverage and universe lists, the
+    portfolio snapshot, every bar slice the pipeline fetched (or the error it
+    got), the broker minimum volumes the order planner looked up, and the
+    scheduler's recent tier.
+
+    Stored as one compressed `.npz`: bar columns concatenated across slices
+    as plain arrays (time as int64 ns, with row offsets) plus a JSON metadata
+    record. No pickles.
+    """
+
+    as_of: datetime
+    timeframe: str
+    lookback_days: int
+    config_hash: str = ""
+    coverage: list[str] = field(default_factory=list)
+    universe_symbols: list[str] = field(default_factory=list)
+    portfolio: PortfolioSnapshot = field(default_factory=lambda: PortfolioSnapshot(equity=0.0, positions={}))
+    # As fetched: a DataFrame or `BarColumns` (converted when saved).
+    bars: Dict[BarKey, pd.DataFrame | BarColumns] = field(default_factory=dict)
+    bar_errors: Dict[BarKey, str] = field(default_factory=dict)
+    min_volumes: Dict[str, float] = field(default_factory=dict)
+    # Scheduler recent tier at cycle start, so a replay processes symbols in
+    # the recorded order.
+    recent_symbols: list[str] = field(default_factory=list)
+
+    def min_volume(self, symbol: str) -> float:
+        """Recorded broker minimum volume (0.0 when the cycle never asked)."""
+        return float(self.min_volumes.get(symbol, 0.0))
+
+    def record_min_volume(self, fn: Callable[[str], float]) -> Callable[[str], float]:
+        """Wrap a min-volume lookup so its answers are kept in this snapshot."""
+
+        def lookup(symbol: str) -> float:
+            vol = float(fn(symbol))
+            self.min_volumes[symbol] = vol
+            return vol
+
+        return lookup
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Slices with the same columns are stored together: one concatenated
+        # array per column plus row offsets, instead of one array per slice.
+        groups: Dict[Tuple[str, ...], list[int]] = {}
+        frames = [(key, as_frame(bars)) for key, bars in self.bars.items()]
+        for n, (_, df) in enumerate(frames):
+            groups.setdefault(tuple(str(c) for c in df.columns), []).append(n)
+
+        arrays: Dict[str, np.ndarray] = {}
+        bars_meta: list[dict] = [{} for _ in frames]
+        for g, (columns, members) in enumerate(groups.items()):
+            lengths = [len(frames[n][1]) for n in members]
+            arrays[f"bars.{g}.offsets"] = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+            for col in columns:
+                parts = [_column_values(frames[n][1], col) for n in members]
+                parts = [p for p in parts if len(p)] or [np.empty(0, dtype=np.float64)]
+                arrays[f"bars.{g}.{col}"] = np.concatenate(parts)
+            for pos, n in enumerate(members):
+                (symbol, timeframe), df = frames[n]
+                tz = pd.DatetimeIndex(df["time"]).tz if "time" in df.columns and len(df) else None
+                bars_meta[n] = {
+                    "symbol": symbol,
+                    "timeframe": timeframe,
+                    "group": g,
+                    "row": pos,
+                    "tz": str(tz) if tz is not None else None,
+                }
+
+        meta = {
+            "version": SNAPSHOT_VERSION,
+            "as_of": self.as_of.isoformat(),
+            "timeframe": self.timeframe,
+            "lookback_days": int(self.lookback_days),
+            "config_hash": self.config_hash,
+            "coverage": list(self.coverage),
+            "universe_symbols": list(self.universe_symbols),
+            "portfolio": {
+                "equity": float(self.portfolio.equity),
+                "positions": [
+                    [p.symbol, float(p.quantity), float(p.price)] for p in self.portfolio.positions.values()
+                ],
+            },
+            "groups": [list(columns) for columns in groups],
+            "bars": bars_meta,
+            "bar_errors": [[s, tf, msg] for (s, tf), msg in self.bar_errors.items()],
+            "min_volumes": dict(self.min_volumes),
+            "recent_symbols": list(self.recent_symbols),
+        }
+        arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CycleSnapshot":
+        with np.load(Path(path), allow_pickle=False) as data:
+            meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+            version = int(meta.get("version", 0))
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported snapshot version {version} in {path}")
+
+            group_columns = meta["groups"]
+            group_arrays = [
+                {col: data[f"bars.{g}.{col}"] for col in [*columns, "offsets"]}
+                for g, columns in enumerate(group_columns)
+            ]
+
+        bars: Dict[BarKey, pd.DataFrame] = {}
+        for entry in meta["bars"]:
+            g, row = entry["group"], entry["row"]
+            arrays = group_arrays[g]
+            lo, hi = int(arrays["offsets"][row]), int(arrays["offsets"][row + 1])
+            out: Dict[str, object] = {}
+            for col in group_columns[g]:
+                values = arrays[col][lo:hi]
+                if col == "time":
+                    times = pd.to_datetime(values, unit="ns", utc=entry["tz"] is not None)
+                    if entry["tz"] not in (None, "UTC"):
+                        times = times.tz_convert(entry["tz"])
+                    out[col] = times
+                else:
+                    out[col] = values
+            bars[(entry["symbol"], entry["timeframe"])] = pd.DataFrame(out, columns=group_columns[g])
+
+        portfolio = meta["portfolio"]
+        return cls(
+            as_of=datetime.fromisoformat(meta["as_of"]),
+            timeframe=meta["timeframe"],
+            lookback_days=int(meta["lookback_days"]),
+            config_hash=meta.get("config_hash", ""),
+            coverage=list(meta["coverage"]),
+            universe_symbols=list(meta["universe_symbols"]),
+            portfolio=PortfolioSnapshot(
+                equity=float(portfolio["equity"]),
+                positions={
+                    s: Position(symbol=s, quantity=float(q), price=float(p)) for s, q, p in portfolio["positions"]
+                },
+            ),
+            bars=bars,
+            bar_errors={(s, tf): msg for s, tf, msg in meta["bar_errors"]},
+            min_volumes={s: float(v) for s, v in meta["min_volumes"].items()},
+            recent_symbols=list(meta.get("recent_symbols", [])),
+        )
+
+
+def _column_values(df: pd.DataFrame, col: str) -> np.ndarray:
+    if col == "time":
+        idx = pd.DatetimeIndex(df["time"])
+        if idx.tz is not None:
+            idx = idx.tz_convert("UTC").tz_localize(None)
+        return idx.values.astype("datetime64[ns]").astype(np.int64)
+    values = df[col].to_numpy()
+    if values.dtype == object:
+        # Empty MT5 frames come back with object columns.
+        values = values.astype(np.float64)
+    return values
+
+
+class RecordingMarketData(MarketDataPort):
+    """Market data port that passes calls through and keeps what it returned
+    (or the error it raised) in a `CycleSnapshot`.
+
+    `discard` drops a key the pipeline did not use (a timed-out or skipped
+    fetch), including an answer that arrives later, so a replay skips the
+    same symbols as the live cycle.
+    """
+
+    def __init__(self, inner: MarketDataPort, snapshot: CycleSnapshot) -> None:
+        self.inner = inner
+        self.snapshot = snapshot
+        self._discarded: set[BarKey] = set()
+        self._lock = threading.Lock()
+
+    def get_bars(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame:
+        return self._record(self.inner.get_bars, symbol, timeframe, start, end)
+
+    def get_bar_columns(
+        self, symbol: str, timeframe: str, start: datetime, end: datetime
+    ) -> pd.DataFrame | BarColumns:
+        fetch = getattr(self.inner, "get_bar_columns", None) or self.inner.get_bars
+        return self._record(fetch, symbol, timeframe, start, end)
+
+    def _record(self, fetch, symbol: str, timeframe: str, start: datetime, end: datetime):
+        key = (symbol, timeframe.upper())
+        try:
+            df = fetch(symbol, timeframe, start, end)
+        except Exception as e:
+            with self._lock:
+                if key not in self._discarded:
+                    self.snapshot.bar_errors[key] = f"{type(e).__name__}: {e}"
+            raise
+        with self._lock:
+            if key not in self._discarded:
+                self.snapshot.bars[key] = df
+        return df
+
+    def discard(self, symbol: str, timeframe: str) -> None:
+        key = (symbol, timeframe.upper())
+        with self._lock:
+            self._discarded.add(key)
+            self.snapshot.bars.pop(key, None)
+            self.snapshot.bar_errors.pop(key, None)
+
+
+class SnapshotMarketData(MarketDataPort):
+    """Market data port that serves the bars recorded in a `CycleSnapshot`.
+
+    Recorded fetch errors are raised again; bars the cycle never fetched
+    raise `LookupError`.
+    """
+
+    def __init__(self, snapshot: CycleSnapshot) -> None:
+        self.snapshot = snapshot
+
+    def get_bars(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame:
+        key = (symbol, timeframe.upper())
+        df = self.snapshot.bars.get(key)
+        if df is not None:
+            return as_frame(df)
+        error = self.snapshot.bar_errors.get(key)
+        if error is not None:
+            raise RuntimeError(f"recorded fetch error: {error}")
+        raise LookupError(f"No bars recorded for {symbol} {timeframe}")
+
+
+def prune_snapshots(directory: str | Path, keep_last: int = 0, max_bytes: int = 0) -> List[Path]:
+    """Delete the oldest `cycle-*.npz` files in `directory` past `keep_last`
+    files or `max_bytes` in total (0: no limit). The newest file is always
+    kept. Returns the deleted paths.
+    """
+    # `cycle-<as_of>` names sort in time order.
+    files = sorted(Path(directory).glob("cycle-*.npz"))
+    sizes = [p.stat().st_size for p in files]
+    drop = max(0, len(files) - keep_last) if keep_last > 0 else 0
+    if max_bytes > 0:
+        total = sum(sizes[drop:])
+        while drop < len(files) - 1 and total > max_bytes:
+            total -= sizes[drop]
+            drop += 1
+    drop = min(drop, len(files) - 1)
+    removed: List[Path] = []
+    for path in files[:drop]:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        removed.append(path)
+    return removed
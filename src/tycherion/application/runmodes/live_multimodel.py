@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import hashlib
 import json
+import pathlib
 import time
-from typing import Dict
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict
 
-from tycherion.shared.config import AppConfig
 from tycherion.ports.trading import TradingPort
 from tycherion.ports.account import AccountPort
 from tycherion.ports.universe import UniversePort
@@ -18,16 +20,28 @@ from tycherion.application.plugins.registry import (
     ALLOCATORS,
     BALANCERS,
 )
-from tycherion.application.services.coverage_selector import build_coverage
+from tycherion.application.services.coverage_selector import CachedCoverageProvider, CoverageDiff
 from tycherion.application.services.order_planner import build_orders
+from tycherion.application.services.shadow import CycleOutcome, compare_outcomes
+from tycherion.application.services.sizer import symbol_min_volume
 from tycherion.domain.portfolio.entities import (
     PortfolioSnapshot,
     Position,
 )
 
-from tycherion.application.pipeline.config import build_pipeline_config
+from tycherion.application.pipeline.config import PipelineConfig, build_pipeline_config, build_shadow_pipeline_configs
+from tycherion.application.pipeline.schedule import SymbolScheduler
 from tycherion.application.pipeline.service import ModelPipelineService
 
+if TYPE_CHECKING:
+    from tycherion.domain.portfolio.allocators.base import BaseAllocator
+    from tycherion.domain.portfolio.balancers.base import BaseBalancer
+    from tycherion.application.pipeline.sharding import ShardedPipelineService
+    from tycherion.application.replay.snapshot import CycleSnapshot
+    from tycherion.ports.observability.logs import LoggerPort
+    from tycherion.ports.observability.traces import SpanPort
+    from tycherion.shared.config import AppConfig, SnapshotCfg
+
 
 def _build_portfolio_snapshot(account: AccountPort) -> PortfolioSnapshot:
     equity = float(account.equity())
@@ -45,17 +59,177 @@ def _stable_config_hash(d: dict) -> str:
         return ""
 
 
+def _save_snapshot(snapshot: CycleSnapshot, snapshot_cfg: SnapshotCfg, span: SpanPort, logger: LoggerPort) -> None:
+    from tycherion.application.replay.snapshot import prune_snapshots
+
+    stamp = snapshot.as_of.strftime("%Y%m%dT%H%M%S%fZ")
+    t0 = time.perf_counter()
+    try:
+        path = snapshot.save(pathlib.Path(snapshot_cfg.dir) / f"cycle-{stamp}.npz")
+        # Retention: oldest files go first; the one just saved is kept.
+        pruned = prune_snapshots(snapshot_cfg.dir, snapshot_cfg.keep_last, snapshot_cfg.max_bytes)
+    except Exception as e:
+        span.record_exception(e)
+        logger.emit(
+            "snapshot.save_failed",
+            Severity.WARN,
+            {
+                semconv.ATTR_CHANNEL: "ops",
+                "exception_type": type(e).__name__,
+                "message": str(e),
+            },
+        )
+        return
+    span.set_attribute("snapshot_path", str(path))
+    logger.emit(
+        "snapshot.saved",
+        Severity.INFO,
+        {
+            semconv.ATTR_CHANNEL: "ops",
+            "path": str(path),
+            "bars_count": int(len(snapshot.bars)),
+            "pruned_count": int(len(pruned)),
+            "elapsed_ms": round((time.perf_counter() - t0) * 1000.0, 3),
+        },
+    )
+
+
+def _apply_coverage_diff(
+    pipeline_service: ModelPipelineService | ShardedPipelineService,
+    diff: CoverageDiff,
+    span: SpanPort,
+    logger: LoggerPort,
+) -> None:
+    span.set_attribute("coverage_added", int(len(diff.added)))
+    span.set_attribute("coverage_removed", int(len(diff.removed)))
+    logger.emit(
+        "coverage.changed",
+        Severity.INFO,
+        {
+            semconv.ATTR_CHANNEL: "ops",
+            "added_count": int(len(diff.added)),
+            "removed_count": int(len(diff.removed)),
+            "added_sample": list(diff.added[:10]),
+            "removed_sample": list(diff.removed[:10]),
+        },
+    )
+    try:
+        pipeline_service.apply_universe_diff(diff.added, diff.removed)
+    except Exception as e:
+        # Warming/evicting is an optimisation; the cycle itself still runs.
+        span.record_exception(e)
+        logger.emit(
+            "coverage.diff_failed",
+            Severity.WARN,
+            {
+                semconv.ATTR_CHANNEL: "ops",
+                "exception_type": type(e).__name__,
+                "message": str(e),
+            },
+        )
+
+
+def _run_shadow(
+    name: str,
+    pipeline_config: PipelineConfig,
+    service: ModelPipelineService | ShardedPipelineService,
+    universe_symbols: list[str],
+    portfolio: PortfolioSnapshot,
+    as_of: datetime,
+    primary: CycleOutcome,
+    allocator: BaseAllocator,
+    balancer: BaseBalancer,
+    cfg: AppConfig,
+    observability: ObservabilityPort,
+    span: SpanPort,
+    logger: LoggerPort,
+) -> None:
+    """Run one shadow pipeline and report how it differs from the primary.
+
+    Its orders are logged, never sent. A failing shadow is logged and left
+    out; the cycle carries on.
+    """
+    t0 = time.perf_counter()
+    try:
+        result = service.run(
+            universe_symbols=universe_symbols,
+            portfolio_snapshot=portfolio,
+            pipeline_config=pipeline_config,
+            observability=observability,
+            as_of=as_of,
+        )
+        allocation = allocator.allocate(result.signals_by_symbol)
+        plan = balancer.plan(
+            portfolio=portfolio,
+            target=allocation,
+            threshold=cfg.application.portfolio.threshold_weight,
+        )
+        orders = build_orders(portfolio, plan, cfg.trading, min_volume_fn=symbol_min_volume)
+    except Exception as e:
+        span.record_exception(e)
+        logger.emit(
+            "shadow.failed",
+            Severity.WARN,
+            {
+                semconv.ATTR_CHANNEL: "ops",
+                "shadow": name,
+                "exception_type": type(e).__name__,
+                "message": str(e),
+            },
+        )
+        return
+
+    for od in orders:
+        logger.emit(
+            "shadow.order",
+            Severity.INFO,
+            {
+                semconv.ATTR_CHANNEL: "audit",
+                "shadow": name,
+                "symbol": od.symbol,
+                "side": od.side,
+                "volume": float(od.volume),
+            },
+        )
+
+    metrics = compare_outcomes(primary, CycleOutcome(result.signals_by_symbol, allocation, plan, orders))
+    metrics["elapsed_ms"] = round((time.perf_counter() - t0) * 1000.0, 3)
+    span.add_event(semconv.EVT_SHADOW_COMPARED, {"shadow": name, **metrics})
+    logger.emit(
+        "shadow.compared",
+        Severity.INFO,
+        {
+            semconv.ATTR_CHANNEL: "ops",
+            "shadow": name,
+            "stages": [st.name for st in pipeline_config.stages],
+            "degraded": bool(result.degraded),
+            **metrics,
+        },
+    )
+
+
 def run_live_multimodel(
     cfg: AppConfig,
     trader: TradingPort,
     account: AccountPort,
     universe: UniversePort,
-    pipeline_service: ModelPipelineService,
+    pipeline_service: ModelPipelineService | ShardedPipelineService,
     *,
     observability: ObservabilityPort,
     config_path: str | None = None,
+    run_mode: str = "live_multimodel",
+    shadow_service: ModelPipelineService | None = None,
 ) -> None:
-    """Live runmode that delegates per-symbol pipeline execution to ModelPipelineService."""
+    """Live runmode that delegates per-symbol pipeline execution to ModelPipelineService.
+
+    `pipeline_service` can also be a `ShardedPipelineService` (run mode
+    `sharded`): same cycle, with the pipeline spread over worker processes.
+
+    Shadow pipelines (`application.models.shadow`) run on `shadow_service`
+    after the cycle's orders are placed, over the bars the primary fetched
+    in this process; their orders are only logged. Without a
+    `shadow_service` a copy of `pipeline_service` is used.
+    """
 
     allocator = ALLOCATORS.get(cfg.application.portfolio.allocator)
     if not allocator:
@@ -66,20 +240,71 @@ def run_live_multimodel(
         raise RuntimeError(f"Balancer not found: {cfg.application.portfolio.balancer!r}")
 
     pipeline_config = build_pipeline_config(cfg)
+    shadow_configs = build_shadow_pipeline_configs(cfg)
+    if shadow_configs and shadow_service is None:
+        if not isinstance(pipeline_service, ModelPipelineService):
+            raise RuntimeError("Shadow pipelines need a shadow_service in sharded run mode")
+        # Own scheduler: shadow signals must not reorder the primary's cycles.
+        shadow_service = replace(pipeline_service, scheduler=SymbolScheduler(pipeline_service.scheduler.recent_cycles))
 
     tracer = observability.traces.get_tracer("tycherion.runmodes.live_multimodel", version=TYCHERION_SCHEMA_VERSION)
     logger = observability.logs.get_logger("tycherion.runmodes.live_multimodel", version=TYCHERION_SCHEMA_VERSION)
 
+    snapshot_cfg = cfg.application.snapshot
+    coverage_provider = CachedCoverageProvider(
+        cfg, universe, refresh_seconds=cfg.application.coverage.refresh_seconds
+    )
+
     def step_once() -> None:
         cfg_hash = _stable_config_hash(cfg.model_dump())
+        # Fixed analysis time for the cycle, so a recorded cycle can be replayed.
+        as_of = datetime.now(timezone.utc)
+        # The cycle budget counts from here, coverage and portfolio reads included.
+        deadline = (
+            time.monotonic() + pipeline_config.cycle_deadline_seconds
+            if pipeline_config.cycle_deadline_seconds is not None
+            else None
+        )
+
+        service = pipeline_service
+        min_volume_fn = symbol_min_volume
+        snapshot: CycleSnapshot | None = None
+        if snapshot_cfg.enabled:
+            from tycherion.application.replay.snapshot import CycleSnapshot, RecordingMarketData
+
+            snapshot = CycleSnapshot(
+                as_of=as_of,
+                timeframe=pipeline_service.timeframe,
+                lookback_days=int(pipeline_service.lookback_days),
+                config_hash=cfg_hash,
+                recent_symbols=pipeline_service.scheduler.recent(),
+            )
+            service = replace(pipeline_service, market_data=RecordingMarketData(pipeline_service.market_data, snapshot))
+            min_volume_fn = snapshot.record_min_volume(symbol_min_volume)
+
+        shadow = shadow_service
+        if shadow_configs and shadow is not None:
+            from tycherion.application.market_data.memo import CycleBarsMemo
+
+            # Shadows read the bars the primary fetched this cycle (the memo is
+            # frozen once the primary is done). Sharded primaries fetch in
+            # their workers: there the shadows share one fetch per symbol,
+            # served by the coordinator's bars cache.
+            if isinstance(service, ModelPipelineService):
+                memo = CycleBarsMemo(service.market_data)
+                service = replace(service, market_data=memo)
+            else:
+                memo = CycleBarsMemo(shadow.market_data)
+            shadow = replace(shadow, market_data=memo)
 
         with tracer.start_as_current_span(
             semconv.SPAN_RUN,
             attributes={
-                semconv.ATTR_RUN_MODE: "live_multimodel",
+                semconv.ATTR_RUN_MODE: run_mode,
                 "timeframe": cfg.timeframe,
                 "lookback_days": int(cfg.lookback_days),
                 "pipeline_stages": [st.name for st in pipeline_config.stages],
+                "shadow_pipelines": [name for name, _ in shadow_configs],
                 semconv.ATTR_CONFIG_HASH: cfg_hash,
                 semconv.ATTR_CONFIG_PATH: config_path,
             },
@@ -87,10 +312,20 @@ def run_live_multimodel(
             try:
                 # 1) Structural universe from coverage + ensure held symbols are included
                 with tracer.start_as_current_span(semconv.SPAN_COVERAGE_FETCH) as span_cov:
-                    coverage = build_coverage(cfg, pipeline_service.market_data, universe)
+                    coverage, diff = coverage_provider.get()
+                    if diff:
+                        _apply_coverage_diff(pipeline_service, diff, span_cov, logger)
                     portfolio = _build_portfolio_snapshot(account)
                     held_symbols = set(portfolio.positions.keys())
+                    exposure = portfolio.weight_index
+                    span_cov.set_attribute("positions_count", int(len(exposure)))
+                    span_cov.set_attribute("gross_exposure_weight", exposure.gross_weight)
+                    span_cov.set_attribute("net_exposure_weight", exposure.net_weight)
                     universe_symbols = sorted(set(coverage) | held_symbols)
+                    if snapshot is not None:
+                        snapshot.coverage = list(coverage)
+                        snapshot.universe_symbols = universe_symbols
+                        snapshot.portfolio = portfolio
 
                     span_cov.add_event(
                         semconv.EVT_COVERAGE_SUMMARY,
@@ -101,12 +336,15 @@ def run_live_multimodel(
                     )
 
                 # 2) Run pipeline (single entrypoint)
-                result = pipeline_service.run(
+                result = service.run(
                     universe_symbols=universe_symbols,
                     portfolio_snapshot=portfolio,
                     pipeline_config=pipeline_config,
                     observability=observability,
+                    as_of=as_of,
+                    deadline=deadline,
                 )
+                span_run.set_attribute(semconv.ATTR_CYCLE_STATUS, "degraded" if result.degraded else "ok")
 
                 span_run.add_event(
                     semconv.EVT_PIPELINE_RUN_SUMMARY,
@@ -129,7 +367,7 @@ def run_live_multimodel(
 
                 # 5) Orders -> execution
                 with tracer.start_as_current_span(semconv.SPAN_EXECUTION) as span_exec:
-                    orders = build_orders(portfolio, plan, cfg.trading)
+                    orders = build_orders(portfolio, plan, cfg.trading, min_volume_fn=min_volume_fn)
                     span_exec.add_event(semconv.EVT_ORDERS_BUILT, {"orders_count": int(len(orders))})
 
                     for od in orders:
@@ -150,6 +388,39 @@ def run_live_multimodel(
                             },
                         )
 
+                if snapshot is not None:
+                    # Inputs were complete once orders were planned; writing
+                    # them waits until the orders are sent.
+                    _save_snapshot(snapshot, snapshot_cfg, span_run, logger)
+                    snapshot = None
+
+                # 6) Shadow pipelines -> logged orders and comparison metrics
+                if shadow_configs and shadow is not None:
+                    primary = CycleOutcome(result.signals_by_symbol, target_alloc, plan, orders)
+                    if isinstance(service, ModelPipelineService):
+                        memo.freeze()
+                    # Symbols the primary skipped for the deadline stay out of
+                    # the comparison (and off the broker).
+                    skipped = set(result.skipped_symbols)
+                    shadow_symbols = [s for s in universe_symbols if s not in skipped]
+                    for name, shadow_config in shadow_configs:
+                        with tracer.start_as_current_span(semconv.SPAN_SHADOW, attributes={"shadow": name}) as span_shadow:
+                            _run_shadow(
+                                name,
+                                shadow_config,
+                                shadow,
+                                shadow_symbols,
+                                portfolio,
+                                as_of,
+                                primary,
+                                allocator,
+                                balancer,
+                                cfg,
+                                observability,
+                                span_shadow,
+                                logger,
+                            )
+
                 span_run.set_status_ok()
             except BaseException as e:
                 span_run.record_exception(e)
@@ -159,12 +430,16 @@ def run_live_multimodel(
                     Severity.ERROR,
                     {
                         semconv.ATTR_CHANNEL: "ops",
-                        "run_mode": "live_multimodel",
+                        "run_mode": run_mode,
                         "exception_type": type(e).__name__,
                         "message": str(e),
                     },
                 )
                 raise
+            finally:
+                if snapshot is not None:
+                    # Cycle failed before its orders were sent: keep what was recorded.
+                    _save_snapshot(snapshot, snapshot_cfg, span_run, logger)
 
     if cfg.application.schedule.run_forever:
         while True:
@@ -177,7 +452,7 @@ def run_live_multimodel(
                     Severity.INFO,
                     {
                         semconv.ATTR_CHANNEL: "ops",
-                        "run_mode": "live_multimodel",
+                        "run_mode": run_mode,
                         "reason": "KeyboardInterrupt",
                     },
                 )
@@ -189,7 +464,7 @@ def run_live_multimodel(
                     Severity.ERROR,
                     {
                         semconv.ATTR_CHANNEL: "ops",
-                        "run_mode": "live_multimodel",
+                        "run_mode": run_mode,
                         "exception_type": type(e).__name__,
                         "message": str(e),
                     },
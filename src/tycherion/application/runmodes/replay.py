@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import time
+from dataclasses import replace
+from typing import TYPE_CHECKING, List
+
+from tycherion.ports.observability import semconv
+from tycherion.ports.observability.observability import ObservabilityPort
+from tycherion.ports.observability.types import Severity, TYCHERION_SCHEMA_VERSION
+
+from tycherion.application.plugins.registry import (
+    ALLOCATORS,
+    BALANCERS,
+)
+from tycherion.application.services.order_planner import SuggestedOrder, build_orders
+
+from tycherion.application.pipeline.config import build_pipeline_config
+from tycherion.application.pipeline.service import ModelPipelineService
+from tycherion.application.runmodes.live_multimodel import _stable_config_hash
+
+if TYPE_CHECKING:
+    from tycherion.application.replay.snapshot import CycleSnapshot
+    from tycherion.shared.config import AppConfig
+
+
+def run_replay(
+    cfg: AppConfig,
+    snapshot: CycleSnapshot,
+    pipeline_service: ModelPipelineService,
+    *,
+    observability: ObservabilityPort,
+    config_path: str | None = None,
+) -> List[SuggestedOrder]:
+    """Re-run a recorded cycle: pipeline, allocator, balancer and order planner.
+
+    `pipeline_service` must read bars from the snapshot (`SnapshotMarketData`).
+    No broker is touched: planned orders are logged and returned, not sent.
+    Pipeline, portfolio and trading settings come from `cfg`, so a snapshot
+    can also be replayed against a changed configuration. The cycle deadline
+    and fetch timeout are ignored, so every recorded symbol is evaluated.
+    """
+
+    allocator = ALLOCATORS.get(cfg.application.portfolio.allocator)
+    if not allocator:
+        raise RuntimeError(f"Allocator not found: {cfg.application.portfolio.allocator!r}")
+
+    balancer = BALANCERS.get(cfg.application.portfolio.balancer)
+    if not balancer:
+        raise RuntimeError(f"Balancer not found: {cfg.application.portfolio.balancer!r}")
+
+    # No cycle budget: a deadline or fetch timeout would make the replayed
+    # symbol set depend on this machine's speed.
+    pipeline_config = replace(build_pipeline_config(cfg), cycle_deadline_seconds=None, fetch_timeout_seconds=None)
+
+    tracer = observability.traces.get_tracer("tycherion.runmodes.replay", version=TYCHERION_SCHEMA_VERSION)
+    logger = observability.logs.get_logger("tycherion.runmodes.replay", version=TYCHERION_SCHEMA_VERSION)
+
+    t0 = time.perf_counter()
+    with tracer.start_as_current_span(
+        semconv.SPAN_RUN,
+        attributes={
+            semconv.ATTR_RUN_MODE: "replay",
+            "timeframe": snapshot.timeframe,
+            "lookback_days": int(snapshot.lookback_days),
+            "pipeline_stages": [st.name for st in pipeline_config.stages],
+            semconv.ATTR_CONFIG_HASH: _stable_config_hash(cfg.model_dump()),
+            semconv.ATTR_CONFIG_PATH: config_path,
+            "snapshot_as_of": snapshot.as_of.isoformat(),
+            "snapshot_config_hash": snapshot.config_hash,
+        },
+    ) as span_run:
+        try:
+            portfolio = snapshot.portfolio
+
+            result = pipeline_service.run(
+                universe_symbols=list(snapshot.universe_symbols),
+                portfolio_snapshot=portfolio,
+                pipeline_config=pipeline_config,
+                observability=observability,
+                as_of=snapshot.as_of,
+            )
+
+            span_run.add_event(
+                semconv.EVT_PIPELINE_RUN_SUMMARY,
+                {f"stage_stats.{k}": int(v) for k, v in (result.stage_stats or {}).items()},
+            )
+
+            with tracer.start_as_current_span(semconv.SPAN_ALLOCATOR) as span_alloc:
+                target_alloc = allocator.allocate(result.signals_by_symbol)
+                span_alloc.add_event(semconv.EVT_ALLOCATOR_COMPLETED, {"symbols_count": int(len(result.signals_by_symbol))})
+
+            with tracer.start_as_current_span(semconv.SPAN_BALANCER) as span_bal:
+                plan = balancer.plan(
+                    portfolio=portfolio,
+                    target=target_alloc,
+                    threshold=cfg.application.portfolio.threshold_weight,
+                )
+                span_bal.add_event(semconv.EVT_REBALANCE_PLAN_BUILT, {"instructions_count": int(len(plan))})
+
+            with tracer.start_as_current_span(semconv.SPAN_EXECUTION) as span_exec:
+                # Broker minimum volumes come from the snapshot.
+                orders = build_orders(portfolio, plan, cfg.trading, min_volume_fn=snapshot.min_volume)
+                span_exec.add_event(semconv.EVT_ORDERS_BUILT, {"orders_count": int(len(orders))})
+
+                for od in orders:
+                    logger.emit(
+                        "trade.planned",
+                        Severity.INFO,
+                        {
+                            semconv.ATTR_CHANNEL: "ops",
+                            "symbol": od.symbol,
+                            "side": od.side,
+                            "volume": float(od.volume),
+                        },
+                    )
+
+            logger.emit(
+                "replay.completed",
+                Severity.INFO,
+                {
+                    semconv.ATTR_CHANNEL: "ops",
+                    "symbols_count": int(len(snapshot.universe_symbols)),
+                    "orders_count": int(len(orders)),
+                    "elapsed_ms": round((time.perf_counter() - t0) * 1000.0, 3),
+                },
+            )
+            span_run.set_status_ok()
+            return orders
+        except BaseException as e:
+            span_run.record_exception(e)
+            span_run.set_status_error(str(e))
+            logger.emit(
+                "run.exception",
+                Severity.ERROR,
+                {
+                    semconv.ATTR_CHANNEL: "ops",
+                    "run_mode": "replay",
+                    "exception_type": type(e).__name__,
+                    "message": str(e),
+                },
+            )
+            raise
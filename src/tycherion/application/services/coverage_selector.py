@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from tycherion.shared.config import AppConfig
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Sequence
+
 from tycherion.ports.market_data import MarketDataPort
 from tycherion.ports.universe import UniversePort
 
+if TYPE_CHECKING:
+    from tycherion.shared.config import AppConfig
+
 
 def _build_base_coverage(cfg: AppConfig, universe: UniversePort) -> list[str]:
     """Build the *structural* universe of symbols.
@@ -34,3 +40,67 @@ def build_coverage(cfg: AppConfig, data: MarketDataPort, universe: UniversePort)
     """
     _ = data  # explicit unused
     return _build_base_coverage(cfg, universe)
+
+
+@dataclass(frozen=True, slots=True)
+class CoverageDiff:
+    """Symbols that entered and left coverage since the previous resolution."""
+
+    added: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+def diff_coverage(old: Sequence[str], new: Sequence[str]) -> CoverageDiff:
+    old_set, new_set = set(old), set(new)
+    return CoverageDiff(
+        added=tuple(s for s in new if s not in old_set),
+        removed=tuple(s for s in old if s not in new_set),
+    )
+
+
+class CachedCoverageProvider:
+    """Coverage resolved from the universe at most every `refresh_seconds`.
+
+    Symbol lists change rarely; between refreshes `get` returns the cached
+    list without calling the broker. `invalidate()` forces a refresh on the
+    next call (e.g. on a change notification). `refresh_seconds <= 0`
+    resolves every call, like `build_coverage`.
+
+    `get` also returns the diff against the previous resolution; the first
+    resolution reports an empty diff.
+    """
+
+    __slots__ = ("cfg", "universe", "refresh_seconds", "_clock", "_symbols", "_resolved_at")
+
+    def __init__(
+        self,
+        cfg: AppConfig,
+        universe: UniversePort,
+        *,
+        refresh_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.cfg = cfg
+        self.universe = universe
+        self.refresh_seconds = float(refresh_seconds)
+        self._clock = clock
+        self._symbols: list[str] | None = None
+        self._resolved_at = 0.0
+
+    def invalidate(self) -> None:
+        self._resolved_at = float("-inf")
+
+    def stale(self) -> bool:
+        return self._symbols is None or self._clock() - self._resolved_at >= self.refresh_seconds
+
+    def get(self) -> tuple[list[str], CoverageDiff]:
+        if not self.stale():
+            return list(self._symbols or []), CoverageDiff()
+        symbols = _build_base_coverage(self.cfg, self.universe)
+        diff = CoverageDiff() if self._symbols is None else diff_coverage(self._symbols, symbols)
+        self._symbols = list(symbols)
+        self._resolved_at = self._clock()
+        return list(symbols), diff
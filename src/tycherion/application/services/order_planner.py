@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import TYPE_CHECKING, Callable, List
 
 from tycherion.domain.portfolio.entities import PortfolioSnapshot, RebalanceInstruction
-from tycherion.shared.config import Trading
+
+if TYPE_CHECKING:
+    from tycherion.shared.config import Trading
 
 
 @dataclass
@@ -18,11 +20,16 @@ def build_orders(
     portfolio: PortfolioSnapshot,
     plan: List[RebalanceInstruction],
     trading_cfg: Trading,
+    *,
+    min_volume_fn: Callable[[str], float] | None = None,
 ) -> List[SuggestedOrder]:
     """
     Convert domain-level rebalance instructions (expressed in weights) into
     concrete order suggestions with broker volumes. This is the point where
     we cross from the pure portfolio domain into broker-specific constraints.
+
+    `min_volume_fn` replaces the broker minimum-volume lookup (e.g. replay
+    from a recorded snapshot); defaults to `symbol_min_volume`.
     """
     # Lazy import to avoid circular deps
     from tycherion.application.services.sizer import (
@@ -30,6 +37,8 @@ def build_orders(
         symbol_min_volume,
     )
 
+    min_volume = min_volume_fn or symbol_min_volume
+
     orders: List[SuggestedOrder] = []
     for instr in plan:
         # For now we scale volumes solely by absolute delta_weight. In the
@@ -43,8 +52,9 @@ def build_orders(
             w,
             trading_cfg.volume_mode,
             trading_cfg.fixed_volume,
+            min_volume,
         )
-        min_vol = symbol_min_volume(instr.symbol)
+        min_vol = min_volume(instr.symbol)
         vol = max(vol, min_vol)
         if vol <= 0.0:
             continue
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from tycherion.domain.portfolio.entities import RebalanceInstruction, SignalsBySymbol, TargetAllocation
+from tycherion.application.services.order_planner import SuggestedOrder
+
+
+@dataclass(slots=True)
+class CycleOutcome:
+    """What one pipeline config produced in a cycle, from signals to orders."""
+
+    signals: SignalsBySymbol
+    allocation: TargetAllocation
+    plan: List[RebalanceInstruction] = field(default_factory=list)
+    orders: List[SuggestedOrder] = field(default_factory=list)
+
+
+def _sign(x: float) -> int:
+    return (x > 0) - (x < 0)
+
+
+def compare_outcomes(primary: CycleOutcome, shadow: CycleOutcome) -> Dict[str, float]:
+    """Metrics of how far `shadow` is from `primary` in the same cycle.
+
+    - `signals_count` / `nonzero_signals`: the shadow's signals
+    - `sign_agreement`: share of symbols with a nonzero signal in either
+      run whose signal direction matches (1.0 when neither has any)
+    - `signal_mean_abs_diff`: mean |signed difference| over those symbols
+    - `weight_l1`: sum of |target weight difference| over all symbols
+    - `turnover`: sum of |delta weight| in the shadow's rebalance plan
+    - `orders_count`, `order_overlap`: the shadow's orders, and the share
+      of symbols ordered by either run that both order on the same side
+    """
+
+    ps, ss = primary.signals, shadow.signals
+    active = sorted(
+        {s for s, v in ps.items() if v.signed != 0.0} | {s for s, v in ss.items() if v.signed != 0.0}
+    )
+    agree = 0
+    diff = 0.0
+    for sym in active:
+        a = ps[sym].signed if sym in ps else 0.0
+        b = ss[sym].signed if sym in ss else 0.0
+        agree += _sign(a) == _sign(b)
+        diff += abs(a - b)
+
+    pw, sw = primary.allocation.weights, shadow.allocation.weights
+    weight_l1 = sum(abs(float(sw.get(s, 0.0)) - float(pw.get(s, 0.0))) for s in set(pw) | set(sw))
+
+    po = {o.symbol: o.side.upper() for o in primary.orders}
+    so = {o.symbol: o.side.upper() for o in shadow.orders}
+    ordered = set(po) | set(so)
+    same = sum(1 for s in ordered if po.get(s) is not None and po.get(s) == so.get(s))
+
+    return {
+        "signals_count": float(len(ss)),
+        "nonzero_signals": float(sum(1 for v in ss.values() if v.signed != 0.0)),
+        "sign_agreement": agree / len(active) if active else 1.0,
+        "signal_mean_abs_diff": diff / len(active) if active else 0.0,
+        "weight_l1": float(weight_l1),
+        "turnover": float(sum(abs(float(p.delta_weight)) for p in shadow.plan)),
+        "orders_count": float(len(shadow.orders)),
+        "order_overlap": same / len(ordered) if ordered else 1.0,
+    }
@@ -1,7 +1,12 @@
 from __future__ import annotations
-import MetaTrader5 as mt5
+
+from typing import Callable
+
 
 def symbol_min_volume(symbol: str) -> float:
+    # Deferred so order planning code can be imported without the MT5 bindings.
+    import MetaTrader5 as mt5
+
     info = mt5.symbol_info(symbol)
     if not info:
         return 0.0
@@ -9,11 +14,17 @@ def symbol_min_volume(symbol: str) -> float:
     steps = round(v / info.volume_step)
     return steps * info.volume_step
 
-def volume_from_weight(symbol: str, weight: float, mode: str, fixed_volume: float) -> float:
+def volume_from_weight(
+    symbol: str,
+    weight: float,
+    mode: str,
+    fixed_volume: float,
+    min_volume_fn: Callable[[str], float] = symbol_min_volume,
+) -> float:
     weight = max(0.0, min(1.0, float(weight)))
     if weight < 1e-6:
         return 0.0
     if mode == 'fixed':
         return float(fixed_volume) * weight
-    return symbol_min_volume(symbol)
+    return min_volume_fn(symbol)
 
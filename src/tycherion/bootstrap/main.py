@@ -3,14 +3,7 @@ from __future__ import annotations
 import os
 import socket
 import uuid
-
-import MetaTrader5 as mt5
-
-from tycherion.shared.config import load_config, AppConfig
-from tycherion.adapters.mt5.market_data_mt5 import MT5MarketData
-from tycherion.adapters.mt5.trading_mt5 import MT5Trader
-from tycherion.adapters.mt5.account_mt5 import MT5Account
-from tycherion.adapters.mt5.universe_mt5 import MT5Universe
+from typing import TYPE_CHECKING, Callable
 
 from tycherion.adapters.observability.noop.noop_observability import NoopObservability
 
@@ -19,11 +12,31 @@ from tycherion.ports.observability.observability import ObservabilityPort
 from tycherion.ports.observability.types import Severity, TYCHERION_SCHEMA_VERSION
 
 from tycherion.application.plugins import registry as _registry
-from tycherion.application.pipeline.service import ModelPipelineService
-from tycherion.application.runmodes.live_multimodel import run_live_multimodel
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from tycherion.adapters.mt5.market_data_mt5 import MT5MarketData
+    from tycherion.adapters.shm.shared_bars import SharedBarStore
+
+    from tycherion.application.pipeline.indicator_store import IndicatorResultStore
+    from tycherion.application.pipeline.service import ModelPipelineService
+    from tycherion.application.pipeline.sharding import ShardedPipelineService
+    from tycherion.ports.market_data import MarketDataPort
+    from tycherion.shared.config import AppConfig
+
+# Heavy dependencies (MetaTrader5, pydantic/yaml config, pandas via the pipeline,
+# the OTel SDK) are imported at their point of use so that importing this module,
+# or spawning worker processes from it, stays cheap.
+
+# Built on first use by `_indicator_store`.
+_INDICATOR_STORE: IndicatorResultStore | None = None
 
 
 def _ensure_initialized(cfg: AppConfig) -> None:
+    import MetaTrader5 as mt5
+
     if not mt5.initialize(path=cfg.mt5.terminal_path or None):
         raise SystemExit(f"MT5 initialize failed: {mt5.last_error()}")
     if cfg.mt5.login and cfg.mt5.password and cfg.mt5.server:
@@ -36,6 +49,8 @@ def _ensure_initialized(cfg: AppConfig) -> None:
 
 
 def run_app(config_path: str) -> None:
+    from tycherion.shared.config import load_config
+
     cfg = load_config(config_path)
 
     # Observability must be available as early as possible (e.g. plugin discovery).
@@ -45,12 +60,37 @@ def run_app(config_path: str) -> None:
     logger = obs.logs.get_logger("tycherion.bootstrap", version=TYCHERION_SCHEMA_VERSION)
 
     with tracer.start_as_current_span(semconv.SPAN_BOOTSTRAP_DISCOVER, attributes={"component": "bootstrap"}):
-        _registry.auto_discover(observability=obs)
+        _discover_plugins(cfg, obs)
         logger.emit("Plugin discovery completed", Severity.INFO, {semconv.ATTR_CHANNEL: "ops"})
 
+    run_mode = (cfg.application.run_mode.name or "").lower()
+    if run_mode == "replay":
+        # Replays read a recorded cycle and never touch the broker.
+        try:
+            _run_replay(cfg, obs, config_path)
+        finally:
+            try:
+                obs.shutdown()
+            except Exception:
+                pass
+        return
+
+    from tycherion.adapters.mt5.trading_mt5 import MT5Trader
+    from tycherion.adapters.mt5.account_mt5 import MT5Account
+    from tycherion.adapters.mt5.universe_mt5 import MT5Universe
+    import MetaTrader5 as mt5
+
+    if run_mode == "sharded" and cfg.application.snapshot.enabled:
+        raise SystemExit("application.snapshot is not supported with run_mode 'sharded'")
+    if run_mode == "sharded" and cfg.application.models.shadow and not cfg.application.market_data.cache_enabled:
+        # The primary's bars are fetched by the workers; without the cache the
+        # coordinator's shadows would fetch the whole coverage again each cycle.
+        raise SystemExit("application.models.shadow with run_mode 'sharded' needs application.market_data.cache_enabled")
+
     _ensure_initialized(cfg)
+    pipeline_service = None
     try:
-        market_data = MT5MarketData()
+        market_data = _build_market_data(cfg, _mt5_market_data(cfg))
         trader = MT5Trader(
             dry_run=cfg.trading.dry_run,
             require_demo=cfg.trading.require_demo,
@@ -61,29 +101,33 @@ def run_app(config_path: str) -> None:
         account = MT5Account()
         universe = MT5Universe()
 
-        pipeline_service = ModelPipelineService(
-            market_data=market_data,
-            model_registry=_registry.MODELS,
-            indicator_picker=_registry.pick_indicator_for,
-            timeframe=cfg.timeframe,
-            lookback_days=cfg.lookback_days,
-            playbook=cfg.application.playbook,
-        )
-
-        run_mode = (cfg.application.run_mode.name or "").lower()
         if run_mode == "live_multimodel":
-            run_live_multimodel(
-                cfg,
-                trader,
-                account,
-                universe,
-                pipeline_service,
-                observability=obs,
-                config_path=config_path,
-            )
+            pipeline_service = _build_pipeline_service(cfg, market_data)
+        elif run_mode == "sharded":
+            pipeline_service = _start_shard_workers(cfg, config_path, market_data)
         else:
             raise SystemExit(f"Unknown run_mode: {run_mode}")
+        # Shadow pipelines run in this process, on the primary's bars and indicator store.
+        shadow_service = _build_pipeline_service(cfg, market_data) if cfg.application.models.shadow else None
+
+        from tycherion.application.runmodes.live_multimodel import run_live_multimodel
+
+        # The coordinator runs the same cycle; only the pipeline is spread out.
+        run_live_multimodel(
+            cfg,
+            trader,
+            account,
+            universe,
+            pipeline_service,
+            observability=obs,
+            config_path=config_path,
+            run_mode=run_mode,
+            shadow_service=shadow_service,
+        )
     finally:
+        close = getattr(pipeline_service, "close", None)
+        if close is not None:
+            close()
         try:
             obs.shutdown()
         except Exception:
@@ -91,6 +135,164 @@ def run_app(config_path: str) -> None:
         mt5.shutdown()
 
 
+def _mt5_market_data(cfg: AppConfig) -> MT5MarketData:
+    from tycherion.adapters.mt5.market_data_mt5 import MT5MarketData
+
+    # A fetch queued behind a hung MT5 call gives up after the fetch timeout.
+    return MT5MarketData(lock_timeout=cfg.application.schedule.fetch_timeout_seconds or None)
+
+
+def _build_market_data(cfg: AppConfig, market_data: MarketDataPort) -> MarketDataPort:
+    md_cfg = cfg.application.market_data
+    if not md_cfg.cache_enabled:
+        return market_data
+    from tycherion.application.market_data.cache import CachingMarketData
+
+    return CachingMarketData(market_data, repair_gaps=md_cfg.repair_gaps, max_gap_repairs=md_cfg.max_gap_repairs)
+
+
+def _indicator_store() -> IndicatorResultStore:
+    """The process's indicator result store, shared by its pipeline services."""
+    global _INDICATOR_STORE
+    if _INDICATOR_STORE is None:
+        from tycherion.application.pipeline.indicator_store import IndicatorResultStore
+
+        _INDICATOR_STORE = IndicatorResultStore()
+    return _INDICATOR_STORE
+
+
+def _build_pipeline_service(cfg: AppConfig, market_data: MarketDataPort) -> ModelPipelineService:
+    from tycherion.application.pipeline.schedule import SymbolScheduler
+    from tycherion.application.pipeline.service import ModelPipelineService
+
+    return ModelPipelineService(
+        market_data=market_data,
+        model_registry=_registry.MODELS,
+        indicator_picker=_registry.pick_indicator_for,
+        timeframe=cfg.timeframe,
+        lookback_days=cfg.lookback_days,
+        playbook=cfg.application.playbook,
+        scheduler=SymbolScheduler(recent_cycles=cfg.application.schedule.priority_recent_cycles),
+        indicator_store=_indicator_store(),
+    )
+
+
+def _start_shard_workers(cfg: AppConfig, config_path: str, market_data: MarketDataPort) -> ShardedPipelineService:
+    from functools import partial
+
+    from tycherion.application.pipeline.sharding import ShardedPipelineService
+
+    n = int(cfg.application.run_mode.workers or 0) or (os.cpu_count() or 1)
+    # Dead or hung workers are replaced with the same function.
+    spawn = partial(_spawn_shard_worker, config_path)
+    workers = [spawn(shard) for shard in range(n)]
+    timeout = cfg.application.run_mode.shard_timeout_seconds
+    return ShardedPipelineService(
+        market_data=market_data,
+        timeframe=cfg.timeframe,
+        lookback_days=cfg.lookback_days,
+        connections=[conn for conn, _ in workers],
+        processes=[proc for _, proc in workers],
+        bar_store_factory=_shared_bar_store_factory(cfg) if cfg.application.run_mode.shared_bars else None,
+        spawn_worker=spawn,
+        reply_timeout=float(timeout) if timeout and timeout > 0 else None,
+    )
+
+
+def _spawn_shard_worker(config_path: str, shard: int) -> tuple[Connection, BaseProcess]:
+    import multiprocessing
+
+    # Spawn (not fork): each worker opens its own MT5 session.
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe()
+    proc = ctx.Process(
+        target=_shard_worker_main,
+        args=(child, config_path, shard),
+        name=f"tycherion-shard-{shard}",
+        daemon=True,
+    )
+    proc.start()
+    child.close()
+    return parent, proc
+
+
+def _shared_bar_store_factory(cfg: AppConfig) -> Callable[[int], SharedBarStore]:
+    from tycherion.adapters.shm.shared_bars import SharedBarStore, capacity_for, slots_for
+    from tycherion.domain.market.resampling import TIMEFRAME_MINUTES
+
+    # Unknown timeframes are sized as M1 (the most rows per day).
+    capacity = capacity_for(cfg.lookback_days, TIMEFRAME_MINUTES.get(cfg.timeframe.upper(), 1))
+    return lambda symbols: SharedBarStore.create(slots_for(symbols), capacity)
+
+
+def _attach_shared_bars(name: str, fallback: MarketDataPort) -> MarketDataPort:
+    from tycherion.adapters.shm.shared_bars import SharedBarReader, SharedBarStore
+
+    return SharedBarReader(SharedBarStore.attach(name), fallback=fallback)
+
+
+def _shard_worker_main(conn: Connection, config_path: str, shard: int) -> None:
+    """Entry point of one sharded-pipeline worker process."""
+    from tycherion.application.pipeline.sharding import serve_pipeline
+    from tycherion.shared.config import load_config
+    import MetaTrader5 as mt5
+
+    _ = shard
+    cfg = load_config(config_path)
+    # Workers report through the coordinator; their own telemetry stays off.
+    obs = NoopObservability()
+    _discover_plugins(cfg, obs)
+    _ensure_initialized(cfg)
+    try:
+        serve_pipeline(conn, _build_pipeline_service(cfg, _build_market_data(cfg, _mt5_market_data(cfg))), obs, attach_bars=_attach_shared_bars)
+    finally:
+        conn.close()
+        mt5.shutdown()
+
+
+def _run_replay(cfg: AppConfig, obs: ObservabilityPort, config_path: str) -> None:
+    from tycherion.application.pipeline.schedule import SymbolScheduler
+    from tycherion.application.pipeline.service import ModelPipelineService
+    from tycherion.application.replay.snapshot import CycleSnapshot, SnapshotMarketData
+    from tycherion.application.runmodes.replay import run_replay
+
+    path = cfg.application.run_mode.snapshot_path
+    if not path:
+        raise SystemExit("run_mode 'replay' needs application.run_mode.snapshot_path")
+    snapshot = CycleSnapshot.load(path)
+    # Same symbol order as the recorded cycle (one cycle: the primed tier is all that counts).
+    scheduler = SymbolScheduler(recent_cycles=1)
+    scheduler.prime(snapshot.recent_symbols)
+
+    # Bar window comes from the snapshot so the replay reads exactly what was recorded.
+    pipeline_service = ModelPipelineService(
+        market_data=SnapshotMarketData(snapshot),
+        model_registry=_registry.MODELS,
+        indicator_picker=_registry.pick_indicator_for,
+        timeframe=snapshot.timeframe,
+        lookback_days=snapshot.lookback_days,
+        playbook=cfg.application.playbook,
+        scheduler=scheduler,
+    )
+    run_replay(cfg, snapshot, pipeline_service, observability=obs, config_path=config_path)
+
+
+def _discover_plugins(cfg: AppConfig, obs: ObservabilityPort) -> None:
+    plugins_cfg = cfg.application.plugins
+    if (plugins_cfg.discovery or "eager").lower() == "lazy":
+        models_cfg = cfg.application.models
+        stages = [*models_cfg.pipeline, *(st for sh in models_cfg.shadow for st in sh.pipeline)]
+        _registry.discover_lazy(
+            models=list(dict.fromkeys(st.name for st in stages)),
+            allocators=[cfg.application.portfolio.allocator],
+            balancers=[cfg.application.portfolio.balancer],
+            observability=obs,
+            cache_dir=plugins_cfg.manifest_dir,
+        )
+        return
+    _registry.auto_discover(observability=obs)
+
+
 def _parse_severity(level: str | None) -> Severity:
     lvl = (level or "INFO").strip().upper()
     try:
@@ -130,11 +332,17 @@ def _build_observability(cfg: AppConfig, config_path: str) -> ObservabilityPort:
                 console_min_severity=_parse_severity(tel.console_min_level),
                 console_show_span_lifecycle=True,
                 log_format=str(getattr(tel, "log_format", "pretty") or "pretty"),
+                console_buffered=bool(getattr(tel, "console_buffered", False)),
+                console_flush_interval_ms=int(getattr(tel, "console_flush_interval_ms", 500) or 500),
                 otlp_enabled=bool(getattr(tel, "otlp_enabled", False)),
                 otlp_endpoint=str(getattr(tel, "otlp_endpoint", "http://localhost:4317") or "http://localhost:4317"),
                 otlp_protocol=str(getattr(tel, "otlp_protocol", "grpc") or "grpc"),
                 otlp_headers=getattr(tel, "otlp_headers", None),
                 otlp_insecure=getattr(tel, "otlp_insecure", None),
+                trace_sample_ratio=float(getattr(tel, "trace_sample_ratio", 1.0)),
+                trace_keep_errors=bool(getattr(tel, "trace_keep_errors", True)),
+                trace_keep_slow_ms=getattr(tel, "trace_keep_slow_ms", None),
+                span_max_events=getattr(tel, "span_max_events", 128),
             )
         )
     except Exception as e:
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Field layout of MT5 `copy_rates_*` results.
+RATES_DTYPE = np.dtype(
+    [
+        ("time", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("tick_volume", "<u8"),
+        ("spread", "<i4"),
+        ("real_volume", "<u8"),
+    ]
+)
+
+
+class BarColumns:
+    """OHLCV bars as column arrays over one structured array.
+
+    `bars["close"]` is a view of that field (no copy); `time` is int64 epoch
+    seconds. The pandas frame (time as UTC datetimes) is built only when
+    `to_frame()` is first called, then cached. Treat the arrays as
+    read-only: they may be shared with the frame.
+    """
+
+    __slots__ = ("data", "_frame")
+
+    def __init__(self, data: np.ndarray) -> None:
+        if data.dtype.names is None or "time" not in data.dtype.names:
+            raise ValueError("BarColumns needs a structured array with a 'time' field")
+        self.data = data
+        self._frame: pd.DataFrame | None = None
+
+    @classmethod
+    def empty_like(cls, dtype: np.dtype = RATES_DTYPE) -> "BarColumns":
+        return cls(np.empty(0, dtype=dtype))
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return tuple(self.data.dtype.names or ())
+
+    @property
+    def empty(self) -> bool:
+        return self.data.size == 0
+
+    def __len__(self) -> int:
+        return int(self.data.size)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.data[name]
+
+    def time_ns(self) -> np.ndarray:
+        return self.data["time"].astype(np.int64) * 1_000_000_000
+
+    def to_frame(self) -> pd.DataFrame:
+        if self._frame is None:
+            frame = pd.DataFrame({name: self.data[name] for name in self.columns})
+            frame["time"] = pd.to_datetime(frame["time"], unit="s", utc=True)
+            self._frame = frame
+        return self._frame
+
+
+def as_frame(bars: pd.DataFrame | BarColumns) -> pd.DataFrame:
+    """`bars` as a DataFrame (converting `BarColumns` on demand)."""
+    return bars.to_frame() if isinstance(bars, BarColumns) else bars
+
+
+# Columns a bars fingerprint covers (when present).
+_FINGERPRINT_COLUMNS = ("open", "high", "low", "close", "tick_volume", "spread", "real_volume")
+
+
+def bars_fingerprint(bars: pd.DataFrame | BarColumns) -> bytes:
+    """Digest of the bar times and OHLCV values; equal bars, equal digest."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(bar_times_ns(bars)).tobytes() if len(bars) else b"")
+    for col in _FINGERPRINT_COLUMNS:
+        if col in bars.columns:
+            h.update(col.encode("ascii"))
+            h.update(np.ascontiguousarray(np.asarray(bars[col], dtype=np.float64)).tobytes())
+    return h.digest()
+
+
+def bar_times_ns(bars: pd.DataFrame | BarColumns) -> np.ndarray:
+    """Bar open times as int64 epoch nanoseconds (naive times read as UTC)."""
+    if isinstance(bars, BarColumns):
+        return bars.time_ns()
+    idx = pd.DatetimeIndex(bars["time"])
+    if idx.tz is not None:
+        idx = idx.tz_convert("UTC").tz_localize(None)
+    return idx.values.astype("datetime64[ns]").astype(np.int64)
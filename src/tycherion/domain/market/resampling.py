@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+# Supported timeframes and their bar sizes. The MT5 adapter builds its
+# timeframe map from these keys: add a timeframe here, not in the adapter.
+TIMEFRAME_MINUTES: Dict[str, int] = {
+    "M1": 1,
+    "M5": 5,
+    "M15": 15,
+    "M30": 30,
+    "H1": 60,
+    "H4": 240,
+    "D1": 1440,
+}
+
+# Column -> aggregation when bars are merged into a coarser timeframe.
+_FIRST = ("open",)
+_MAX = ("high", "spread")
+_MIN = ("low",)
+_SUM = ("tick_volume", "real_volume")
+
+
+def timeframe_minutes(timeframe: str) -> int:
+    minutes = TIMEFRAME_MINUTES.get(str(timeframe).upper())
+    if minutes is None:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    return minutes
+
+
+def can_resample(source: str, target: str) -> bool:
+    """True when `target` bars can be built from whole `source` bars."""
+    s = TIMEFRAME_MINUTES.get(str(source).upper())
+    t = TIMEFRAME_MINUTES.get(str(target).upper())
+    if s is None or t is None:
+        return False
+    return t >= s and t % s == 0
+
+
+def finest_timeframe(timeframes: Iterable[str]) -> str:
+    return min((str(tf).upper() for tf in timeframes), key=timeframe_minutes)
+
+
+def _epoch_ns(times: pd.Series) -> np.ndarray:
+    idx = pd.DatetimeIndex(times)
+    if idx.tz is not None:
+        idx = idx.tz_convert("UTC").tz_localize(None)
+    return idx.values.astype("datetime64[ns]").astype(np.int64)
+
+
+def resample_ohlcv(df: pd.DataFrame, timeframe: str, *, start: datetime | None = None) -> pd.DataFrame:
+    """Aggregate time-sorted OHLCV bars into `timeframe` buckets.
+
+    Buckets are aligned to the epoch (so H4 starts at 00/04/08.. and D1 at
+    midnight of the bar clock): open first, high max, low min, close last,
+    volumes summed, spread max. Other columns keep their last value.
+
+    With `start`, buckets that begin before it are dropped: they only hold
+    the tail of a bar that started outside the fetched window.
+    """
+
+    if df.empty:
+        return df.iloc[0:0].copy()
+
+    step = timeframe_minutes(timeframe) * 60 * 1_000_000_000
+    ns = _epoch_ns(df["time"])
+    order = None
+    if ns.size > 1 and np.any(ns[1:] < ns[:-1]):
+        order = np.argsort(ns, kind="stable")
+        ns = ns[order]
+
+    bucket = (ns // step) * step
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:] - 1, ns.size - 1]
+
+    if start is not None:
+        ts = pd.Timestamp(start)
+        ts = ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+        keep = bucket[starts] >= ts.value
+        starts, ends = starts[keep], ends[keep]
+        if starts.size == 0:
+            return df.iloc[0:0].copy()
+
+    tz = pd.DatetimeIndex(df["time"]).tz
+    times = pd.to_datetime(bucket[starts], unit="ns", utc=tz is not None)
+    out: Dict[str, object] = {}
+    for col in df.columns:
+        if col == "time":
+            out[col] = times
+            continue
+        values = df[col].to_numpy()
+        if order is not None:
+            values = values[order]
+        if col in _FIRST:
+            out[col] = values[starts]
+        elif col in _MAX:
+            out[col] = np.fmax.reduceat(values, starts)
+        elif col in _MIN:
+            out[col] = np.fmin.reduceat(values, starts)
+        elif col in _SUM:
+            out[col] = np.add.reduceat(values, starts)
+        else:
+            # `close` and any extra column: value of the last bar in the bucket.
+            out[col] = values[ends]
+    return pd.DataFrame(out, columns=list(df.columns))
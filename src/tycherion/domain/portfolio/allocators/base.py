@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from tycherion.domain.portfolio.batch import SignalBatch
 from tycherion.domain.portfolio.entities import SignalsBySymbol, TargetAllocation
 
 
@@ -15,3 +18,11 @@ class BaseAllocator(ABC):
     @abstractmethod
     def allocate(self, signals: SignalsBySymbol) -> TargetAllocation:
         raise NotImplementedError
+
+    def allocate_batch(self, batch: SignalBatch) -> np.ndarray:
+        """Target weights aligned with `batch.symbols`.
+
+        Vectorized allocators override this; the default adapts to `allocate`.
+        """
+        target = self.allocate(batch.to_signals())
+        return np.array([float(target.weights.get(s, 0.0)) for s in batch.symbols], dtype=np.float64)
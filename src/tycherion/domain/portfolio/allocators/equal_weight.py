@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
+
 from tycherion.domain.portfolio.allocators.base import BaseAllocator
 from tycherion.application.plugins.registry import register_allocator
+from tycherion.domain.portfolio.batch import SignalBatch
 from tycherion.domain.portfolio.entities import SignalsBySymbol, TargetAllocation
 
 
@@ -12,18 +15,15 @@ class EqualWeightAllocator(BaseAllocator):
     a non-zero signal. Longs get +w, shorts get -w, holds get 0.
     """
     def allocate(self, signals: SignalsBySymbol) -> TargetAllocation:
-        nonzero = [s for s in signals.values() if abs(float(s.signed)) > 1e-6]
-        if not nonzero:
+        batch = SignalBatch.from_signals(signals)
+        return batch.to_allocation(self.allocate_batch(batch))
+
+    def allocate_batch(self, batch: SignalBatch) -> np.ndarray:
+        signed = batch.signed
+        nonzero = int(np.count_nonzero(np.abs(signed) > 1e-6))
+        if nonzero == 0:
             # nothing to do
-            return TargetAllocation(weights={})
+            return np.zeros(len(batch), dtype=np.float64)
 
-        w = 1.0 / float(len(nonzero))
-        weights: dict[str, float] = {}
-        for sig in signals.values():
-            if sig.signed > 0:
-                weights[sig.symbol] = w
-            elif sig.signed < 0:
-                weights[sig.symbol] = -w
-            else:
-                weights[sig.symbol] = 0.0
-        return TargetAllocation(weights=weights)
+        w = 1.0 / float(nonzero)
+        return np.where(signed > 0, w, np.where(signed < 0, -w, 0.0))
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
+
 from tycherion.domain.portfolio.allocators.base import BaseAllocator
 from tycherion.application.plugins.registry import register_allocator
+from tycherion.domain.portfolio.batch import SignalBatch
 from tycherion.domain.portfolio.entities import SignalsBySymbol, TargetAllocation
 
 
@@ -13,15 +16,13 @@ class ProportionalAllocator(BaseAllocator):
     weights is 1. Longs get +w, shorts get -w.
     """
     def allocate(self, signals: SignalsBySymbol) -> TargetAllocation:
-        total = sum(abs(float(s.signed)) for s in signals.values())
-        if total <= 1e-9:
-            return TargetAllocation(weights={})
+        batch = SignalBatch.from_signals(signals)
+        return batch.to_allocation(self.allocate_batch(batch))
 
-        weights: dict[str, float] = {}
-        for sig in signals.values():
-            if sig.signed == 0:
-                weights[sig.symbol] = 0.0
-            else:
-                frac = abs(float(sig.signed)) / total
-                weights[sig.symbol] = frac if sig.signed > 0 else -frac
-        return TargetAllocation(weights=weights)
+    def allocate_batch(self, batch: SignalBatch) -> np.ndarray:
+        signed = batch.signed
+        total = float(np.abs(signed).sum())
+        if total <= 1e-9:
+            return np.zeros(len(batch), dtype=np.float64)
+        # |s| / total with the sign of s; zero signals stay 0.0.
+        return signed / total
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from typing import Sequence
+
+import numpy as np
+
 from tycherion.domain.portfolio.balancers.base import BaseBalancer
 from tycherion.application.plugins.registry import register_balancer
 from tycherion.domain.portfolio.entities import (
     PortfolioSnapshot,
     TargetAllocation,
     RebalanceInstruction,
+    Symbol,
 )
 
 
@@ -22,24 +27,48 @@ class ThresholdBalancer(BaseBalancer):
         target: TargetAllocation,
         threshold: float = 0.25,
     ) -> list[RebalanceInstruction]:
+        current = portfolio.weight_index
+        symbols = sorted(set(target.weights.keys()) | set(current.symbols))
+        weights = target.weights
+        target_w = np.fromiter(
+            (float(weights.get(sym, 0.0)) for sym in symbols),
+            dtype=np.float64,
+            count=len(symbols),
+        )
+        return self.plan_arrays(symbols, current.weights_for(symbols), target_w, threshold)
+
+    def plan_arrays(
+        self,
+        symbols: Sequence[Symbol],
+        current: np.ndarray,
+        target: np.ndarray,
+        threshold: float = 0.25,
+    ) -> list[RebalanceInstruction]:
+        """Plan from current/target weight vectors aligned with `symbols`.
+
+        Deltas and the threshold mask are computed in one pass; instructions
+        are only built for the symbols that cross the threshold, in input order.
+        """
         threshold = max(0.0, min(1.0, float(threshold)))
-        instructions: list[RebalanceInstruction] = []
-
-        symbols = set(target.weights.keys()) | set(portfolio.positions.keys())
-        for sym in sorted(symbols):
-            current_w = float(portfolio.weight_of(sym))
-            target_w = float(target.weights.get(sym, 0.0))
-            delta = target_w - current_w
-            if abs(delta) < threshold:
-                continue
-            side = "BUY" if delta > 0 else "SELL"
-            instructions.append(
-                RebalanceInstruction(
-                    symbol=sym,
-                    from_weight=current_w,
-                    to_weight=target_w,
-                    delta_weight=delta,
-                    side=side,
-                )
+        current = np.asarray(current, dtype=np.float64)
+        target = np.asarray(target, dtype=np.float64)
+        if current.shape != (len(symbols),) or target.shape != (len(symbols),):
+            raise ValueError("symbols, current and target must have the same length")
+
+        delta = target - current
+        idx = np.flatnonzero(np.abs(delta) >= threshold)
+        return [
+            RebalanceInstruction(
+                symbol=symbols[i],
+                from_weight=cw,
+                to_weight=tw,
+                delta_weight=d,
+                side="BUY" if d > 0 else "SELL",
+            )
+            for i, cw, tw, d in zip(
+                idx.tolist(),
+                current[idx].tolist(),
+                target[idx].tolist(),
+                delta[idx].tolist(),
             )
-        return instructions
+        ]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from tycherion.domain.portfolio.entities import Signal, SignalsBySymbol, Symbol, TargetAllocation
+
+
+@dataclass(frozen=True, slots=True)
+class SignalBatch:
+    """Columnar view of per-symbol signals, aligned by position.
+
+    symbols: symbol per row
+    signed: float64 array with the desired direction/intensity in [-1, 1]
+    confidence: float64 array with confidence levels in [0, 1]
+
+    This is the input of vectorized allocators; `SignalsBySymbol` dicts are
+    converted with `from_signals` and results mapped back with `to_allocation`.
+    """
+
+    symbols: tuple[Symbol, ...]
+    signed: np.ndarray
+    confidence: np.ndarray
+
+    @classmethod
+    def from_arrays(
+        cls,
+        symbols: Sequence[Symbol],
+        signed: Sequence[float] | np.ndarray,
+        confidence: Sequence[float] | np.ndarray | None = None,
+    ) -> "SignalBatch":
+        sym = tuple(symbols)
+        s = np.asarray(signed, dtype=np.float64)
+        c = np.ones(len(sym), dtype=np.float64) if confidence is None else np.asarray(confidence, dtype=np.float64)
+        if s.shape != (len(sym),) or c.shape != (len(sym),):
+            raise ValueError("symbols, signed and confidence must have the same length")
+        return cls(symbols=sym, signed=s, confidence=c)
+
+    @classmethod
+    def from_signals(cls, signals: SignalsBySymbol) -> "SignalBatch":
+        values = list(signals.values())
+        n = len(values)
+        return cls(
+            symbols=tuple(sig.symbol for sig in values),
+            signed=np.fromiter((float(sig.signed) for sig in values), dtype=np.float64, count=n),
+            confidence=np.fromiter((float(sig.confidence) for sig in values), dtype=np.float64, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def to_signals(self) -> SignalsBySymbol:
+        return {
+            sym: Signal(symbol=sym, signed=float(s), confidence=float(c))
+            for sym, s, c in zip(self.symbols, self.signed, self.confidence)
+        }
+
+    def to_allocation(self, weights: np.ndarray) -> TargetAllocation:
+        """Map aligned target weights back to a `TargetAllocation`.
+
+        An all-zero vector means "nothing to allocate" and yields empty weights,
+        matching the dict-based allocators.
+        """
+        if len(weights) != len(self.symbols):
+            raise ValueError("weights must be aligned with symbols")
+        if not np.any(weights):
+            return TargetAllocation(weights={})
+        return TargetAllocation(weights=dict(zip(self.symbols, weights.tolist())))
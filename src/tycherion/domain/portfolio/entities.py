@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 Symbol = str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Signal:
     """Per-symbol signal produced by the models/ensemble.
 
@@ -23,7 +27,7 @@ class Signal:
 SignalsBySymbol = Dict[Symbol, Signal]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Position:
     """Domain-level position in a single instrument.
 
@@ -36,21 +40,104 @@ class Position:
     price: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class PortfolioWeightIndex:
+    """Current exposure of a portfolio, indexed by symbol.
+
+    Row `i` is `symbols[i]` (held symbols, in position order):
+    - `exposure`: signed notional, `quantity * price`
+    - `weights`: `exposure / equity` (all zeros when equity <= 0)
+    - `gross_exposure` / `net_exposure`: sum of |exposure| / of exposure
+    """
+
+    symbols: Tuple[Symbol, ...]
+    index: Dict[Symbol, int]
+    equity: float
+    exposure: "np.ndarray"
+    weights: "np.ndarray"
+    gross_exposure: float
+    net_exposure: float
+
+    @classmethod
+    def build(cls, equity: float, positions: Mapping[Symbol, Position]) -> "PortfolioWeightIndex":
+        import numpy as np
+
+        symbols = tuple(positions)
+        n = len(symbols)
+        exposure = np.fromiter(
+            (float(pos.quantity * pos.price) for pos in positions.values()),
+            dtype=np.float64,
+            count=n,
+        )
+        equity = float(equity)
+        weights = exposure / equity if equity > 0 else np.zeros(n, dtype=np.float64)
+        return cls(
+            symbols=symbols,
+            index={sym: i for i, sym in enumerate(symbols)},
+            equity=equity,
+            exposure=exposure,
+            weights=weights,
+            gross_exposure=float(np.abs(exposure).sum()),
+            net_exposure=float(exposure.sum()),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def gross_weight(self) -> float:
+        return self.gross_exposure / self.equity if self.equity > 0 else 0.0
+
+    @property
+    def net_weight(self) -> float:
+        return self.net_exposure / self.equity if self.equity > 0 else 0.0
+
+    def weight_of(self, symbol: Symbol) -> float:
+        i = self.index.get(symbol)
+        return 0.0 if i is None else float(self.weights[i])
+
+    def weights_for(self, symbols: Sequence[Symbol]) -> "np.ndarray":
+        """Weights aligned with `symbols` (0.0 when not held)."""
+        import numpy as np
+
+        index = self.index
+        rows = np.fromiter((index.get(sym, -1) for sym in symbols), dtype=np.intp, count=len(symbols))
+        held = rows >= 0
+        out = np.zeros(len(symbols), dtype=np.float64)
+        out[held] = self.weights[rows[held]]
+        return out
+
+
+@dataclass(frozen=True, slots=True)
 class PortfolioSnapshot:
     """Portfolio snapshot used by allocators/balancers at the domain level.
 
-    Equity is the current account equity in account currency.
+    Equity is the current account equity in account currency. The snapshot
+    is read-only (`positions` is exposed as a read-only mapping), so its
+    `weight_index` is built once, on construction.
     """
 
     equity: float
-    positions: Dict[Symbol, Position]
+    positions: Mapping[Symbol, Position]
+    weight_index: PortfolioWeightIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        positions = MappingProxyType(dict(self.positions))
+        object.__setattr__(self, "positions", positions)
+        object.__setattr__(self, "weight_index", PortfolioWeightIndex.build(self.equity, positions))
+
+    def __reduce__(self):
+        # Sent to shard workers; a mappingproxy does not pickle.
+        return (type(self), (self.equity, dict(self.positions)))
 
     def weight_of(self, symbol: Symbol) -> float:
-        pos = self.positions.get(symbol)
-        if not pos or self.equity <= 0:
-            return 0.0
-        return float(pos.quantity * pos.price) / float(self.equity)
+        return self.weight_index.weight_of(symbol)
+
+    def weights_for(self, symbols: Sequence[Symbol]) -> "np.ndarray":
+        """Current weights aligned with `symbols` (0.0 when not held), as one
+        float64 vector. Same values as calling `weight_of` per symbol.
+        """
+        return self.weight_index.weights_for(symbols)
 
 
 @dataclass
@@ -63,7 +150,7 @@ class TargetAllocation:
     weights: Dict[Symbol, float]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RebalanceInstruction:
     """Domain-level rebalance instruction expressed in weights, not broker
     volumes. Conversion to concrete order sizes happens in the application
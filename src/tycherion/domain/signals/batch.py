@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from tycherion.domain.signals.entities import IndicatorOutput, ModelDecision
+
+# DecisionBatch.side codes.
+SIDE_SELL = -1
+SIDE_HOLD = 0
+SIDE_BUY = 1
+
+_SIDE_CODES = {"BUY": SIDE_BUY, "SELL": SIDE_SELL}
+_SIDE_NAMES = ("SELL", "HOLD", "BUY")
+
+
+@dataclass(frozen=True, slots=True)
+class IndicatorColumns:
+    """Columnar outputs of one indicator key for many symbols, aligned by row.
+
+    score: float64 array
+    features: feature name -> float64 array (NaN where a row lacks the feature)
+    """
+
+    score: np.ndarray
+    features: Mapping[str, np.ndarray]
+
+    @classmethod
+    def from_outputs(cls, outputs: Sequence[IndicatorOutput]) -> "IndicatorColumns":
+        n = len(outputs)
+        names = dict.fromkeys(name for out in outputs for name in out.features)
+        return cls(
+            score=np.fromiter((float(out.score) for out in outputs), dtype=np.float64, count=n),
+            features={
+                name: np.fromiter(
+                    (float(out.features.get(name, np.nan)) for out in outputs),
+                    dtype=np.float64,
+                    count=n,
+                )
+                for name in names
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+    def feature(self, name: str, default: float = 0.0) -> np.ndarray:
+        """Feature column with missing (NaN) entries replaced by `default`,
+        like `IndicatorOutput.features.get(name, default)` per row.
+        """
+        col = self.features.get(name)
+        if col is None:
+            return np.full(len(self.score), default, dtype=np.float64)
+        return np.where(np.isnan(col), default, col)
+
+    def take(self, rows: Sequence[int] | np.ndarray) -> "IndicatorColumns":
+        idx = np.asarray(rows, dtype=np.intp)
+        return IndicatorColumns(
+            score=self.score[idx],
+            features={name: col[idx] for name, col in self.features.items()},
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DecisionBatch:
+    """Model decisions for many symbols, aligned by row.
+
+    side: int8 array of SIDE_BUY / SIDE_SELL / SIDE_HOLD
+    weight: float64 array, relative intensity (usually in [0, 1])
+    confidence: float64 array in [0, 1]
+    """
+
+    side: np.ndarray
+    weight: np.ndarray
+    confidence: np.ndarray
+
+    @classmethod
+    def from_decisions(cls, decisions: Sequence[ModelDecision]) -> "DecisionBatch":
+        n = len(decisions)
+        return cls(
+            side=np.fromiter(
+                (_SIDE_CODES.get((d.side or "HOLD").upper(), SIDE_HOLD) for d in decisions),
+                dtype=np.int8,
+                count=n,
+            ),
+            weight=np.fromiter((float(d.weight or 0.0) for d in decisions), dtype=np.float64, count=n),
+            confidence=np.fromiter((float(d.confidence or 0.0) for d in decisions), dtype=np.float64, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.side)
+
+    def side_name(self, row: int) -> str:
+        return _SIDE_NAMES[int(np.sign(self.side[row])) + 1]
+
+    def decision(self, row: int) -> ModelDecision:
+        return ModelDecision(
+            side=self.side_name(row),
+            weight=float(self.weight[row]),
+            confidence=float(self.confidence[row]),
+        )
+
+    def scores(self) -> np.ndarray:
+        """Pipeline scores in [-1, 1]: +weight for BUY, -weight for SELL, 0 for HOLD."""
+        w = np.clip(np.nan_to_num(self.weight, nan=0.0), 0.0, 1.0)
+        return np.where(self.side > 0, w, np.where(self.side < 0, -w, 0.0))
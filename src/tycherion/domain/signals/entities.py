@@ -1,22 +1,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Mapping
 
+from tycherion.domain.signals.features import NO_FEATURES
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class IndicatorOutput:
     """Standard output of an indicator for a single symbol.
 
     - score: aggregated metric in [-1, 1] (by convention in this project)
-    - features: extra numeric features that models may consume.
+    - features: extra numeric features that models may consume; built-in
+      indicators use a fixed-schema `FeatureRecord` (see `features.py`).
     """
 
     score: float
-    features: Dict[str, float]
+    features: Mapping[str, float] = NO_FEATURES
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelDecision:
     """Per-model decision for a single symbol.
 
@@ -45,7 +48,7 @@ class AggregatedDecision:
     signed: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelStageResult:
     """Result for a symbol at a specific model stage in the pipeline."""
 
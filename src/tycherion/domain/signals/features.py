@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import ClassVar, Iterator, Mapping
+
+
+class FeatureRecord(Mapping[str, float]):
+    """Fixed-schema, read-only indicator features.
+
+    Subclasses are slotted dataclasses, one per indicator key. They behave like
+    the `Dict[str, float]` they replace (`features["z"]`, `features.get("z")`,
+    `dict(features)`, equality with plain dicts) without a per-instance dict.
+    """
+
+    __slots__ = ()
+    # Set by @dataclass on subclasses: the field names, in order.
+    __match_args__: ClassVar[tuple[str, ...]] = ()
+
+    def __getitem__(self, key: str) -> float:
+        if key in self.__match_args__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__match_args__)
+
+    def __len__(self) -> int:
+        return len(self.__match_args__)
+
+    def __hash__(self) -> int:
+        # Immutable, so hashable (and usable as a dataclass field default).
+        return hash(tuple(self.items()))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{k}={getattr(self, k)!r}' for k in self.__match_args__)})"
+
+
+# Shared record for "no features" outputs (not enough bars, indicator errors).
+NO_FEATURES: Mapping[str, float] = FeatureRecord()
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
+class StretchFeatures(FeatureRecord):
+    """Features of the `stretch` indicator key."""
+
+    z: float
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
+class TrendFeatures(FeatureRecord):
+    """Features of the `trend` indicator key (channel bounds)."""
+
+    upper: float
+    lower: float
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
+class VolatilityFeatures(FeatureRecord):
+    """Features of the `volatility` indicator key."""
+
+    atr: float
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from tycherion.domain.signals.entities import IndicatorOutput
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from tycherion.domain.signals.indicators.series import SeriesContext
+
 
 class BaseIndicator(ABC):
     """Abstract base class for indicator plugins."""
@@ -14,6 +19,18 @@ class BaseIndicator(ABC):
     method: str = ""
     tags: set[str] = set()
 
+    # Bar timeframe this indicator reads (e.g. "D1"); None means the pipeline's
+    # configured timeframe. Coarser timeframes are resampled from one fetch.
+    timeframe: str | None = None
+
     @abstractmethod
     def compute(self, df: pd.DataFrame) -> IndicatorOutput:
         raise NotImplementedError
+
+    def compute_from(self, ctx: SeriesContext) -> IndicatorOutput:
+        """Compute from the symbol's shared `SeriesContext`.
+
+        The pipeline calls this. The default runs `compute` on a copy of the
+        bars, so indicators that only implement `compute` keep working.
+        """
+        return self.compute(ctx.frame.copy())
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from tycherion.domain.market.columns import BarColumns, as_frame
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesInput:
+    """A named intermediate series indicators can read and share.
+
+    Inputs form a small DAG (`source` / the OHLC columns behind `true_range`).
+    Two indicators that read equal inputs get the same series, computed once
+    per symbol by `SeriesContext`. Build them with the helpers below.
+    """
+
+    op: str  # column | true_range | rolling_mean | rolling_std | rolling_max | rolling_min
+    column: str | None = None
+    source: "SeriesInput | None" = None
+    window: int = 0
+    ddof: int = 0
+
+
+def column(name: str) -> SeriesInput:
+    """Bar column as float64."""
+    return SeriesInput(op="column", column=name)
+
+
+def _src(source: str | SeriesInput) -> SeriesInput:
+    return column(source) if isinstance(source, str) else source
+
+
+def true_range() -> SeriesInput:
+    """max(high - low, |high - prev close|, |low - prev close|)."""
+    return SeriesInput(op="true_range")
+
+
+def rolling_mean(source: str | SeriesInput, window: int) -> SeriesInput:
+    return SeriesInput(op="rolling_mean", source=_src(source), window=int(window))
+
+
+def rolling_std(source: str | SeriesInput, window: int, ddof: int = 0) -> SeriesInput:
+    return SeriesInput(op="rolling_std", source=_src(source), window=int(window), ddof=int(ddof))
+
+
+def rolling_max(source: str | SeriesInput, window: int) -> SeriesInput:
+    return SeriesInput(op="rolling_max", source=_src(source), window=int(window))
+
+
+def rolling_min(source: str | SeriesInput, window: int) -> SeriesInput:
+    return SeriesInput(op="rolling_min", source=_src(source), window=int(window))
+
+
+class SeriesContext:
+    """Per-symbol compute graph over one symbol's bars.
+
+    `ctx[input]` evaluates the input (and its dependencies) on first use and
+    memoizes it, so every indicator in a bundle shares the same intermediate
+    series. Series returned here are shared: treat them as read-only.
+
+    The bars may be a DataFrame or `BarColumns`; with `BarColumns`, column
+    inputs read the arrays directly and `frame` is built only if asked for.
+    """
+
+    __slots__ = ("bars", "_memo", "hits", "misses")
+
+    def __init__(self, bars: pd.DataFrame | BarColumns) -> None:
+        self.bars = bars
+        self._memo: Dict[SeriesInput, pd.Series] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        return as_frame(self.bars)
+
+    def __len__(self) -> int:
+        return len(self.bars)
+
+    @property
+    def empty(self) -> bool:
+        return bool(self.bars.empty)
+
+    def __getitem__(self, inp: SeriesInput) -> pd.Series:
+        out = self._memo.get(inp)
+        if out is not None:
+            self.hits += 1
+            return out
+        self.misses += 1
+        out = self._evaluate(inp)
+        self._memo[inp] = out
+        return out
+
+    def _evaluate(self, inp: SeriesInput) -> pd.Series:
+        op = inp.op
+        if op == "column":
+            values = self.bars[inp.column]
+            if isinstance(values, np.ndarray):
+                return pd.Series(values, dtype=np.float64)
+            return values.astype(float)
+        if op == "true_range":
+            high = self[column("high")]
+            low = self[column("low")]
+            prev_close = self[column("close")].shift(1)
+            tr = (high - low).abs()
+            return pd.concat([tr, (high - prev_close).abs(), (low - prev_close).abs()], axis=1).max(axis=1)
+
+        if inp.source is None:
+            raise ValueError(f"series input {op!r} needs a source")
+        rolling = self[inp.source].rolling(inp.window)
+        if op == "rolling_mean":
+            return rolling.mean()
+        if op == "rolling_std":
+            return rolling.std(ddof=inp.ddof)
+        if op == "rolling_max":
+            return rolling.max()
+        if op == "rolling_min":
+            return rolling.min()
+        raise ValueError(f"unknown series input op: {op!r}")
@@ -5,19 +5,25 @@ import pandas as pd
 
 from tycherion.application.plugins.registry import register_indicator
 from tycherion.domain.signals.entities import IndicatorOutput
+from tycherion.domain.signals.features import NO_FEATURES, StretchFeatures
+from tycherion.domain.signals.indicators.series import SeriesContext, column, rolling_mean, rolling_std
 
 
 @register_indicator(key="stretch", method="zscore_20", tags={"default"})
 class StretchZScore20(BaseIndicator):
     period = 20
+    close = column("close")
+    mean = rolling_mean("close", period)
+    std = rolling_std("close", period, ddof=0)
 
     def compute(self, df: pd.DataFrame) -> IndicatorOutput:
-        if df.empty or len(df) < self.period:
-            return IndicatorOutput(score=0.0, features={})
-        close = df["close"].astype(float)
-        ma = close.rolling(self.period).mean()
-        sd = close.rolling(self.period).std(ddof=0).replace(0, 1e-9)
-        z = (close - ma) / sd
+        return self.compute_from(SeriesContext(df))
+
+    def compute_from(self, ctx: SeriesContext) -> IndicatorOutput:
+        if ctx.empty or len(ctx) < self.period:
+            return IndicatorOutput(score=0.0, features=NO_FEATURES)
+        sd = ctx[self.std].replace(0, 1e-9)
+        z = (ctx[self.close] - ctx[self.mean]) / sd
         zval = float(z.iloc[-1])
         score = max(-1.0, min(1.0, -zval / 3.0))
-        return IndicatorOutput(score=score, features={"z": zval})
+        return IndicatorOutput(score=score, features=StretchFeatures(z=zval))
@@ -5,24 +5,32 @@ import pandas as pd
 
 from tycherion.application.plugins.registry import register_indicator
 from tycherion.domain.signals.entities import IndicatorOutput
+from tycherion.domain.signals.features import NO_FEATURES, TrendFeatures
+from tycherion.domain.signals.indicators.series import SeriesContext, column, rolling_max, rolling_min
 
 
 @register_indicator(key="trend", method="donchian_50_50", tags={"default"})
 class TrendDonchian5050(BaseIndicator):
     high_n = 50
     low_n = 50
+    close = column("close")
+    upper = rolling_max("high", high_n)
+    lower = rolling_min("low", low_n)
 
     def compute(self, df: pd.DataFrame) -> IndicatorOutput:
-        if df.empty or len(df) < max(self.high_n, self.low_n):
-            return IndicatorOutput(score=0.0, features={})
-        hh = df["high"].rolling(self.high_n).max()
-        ll = df["low"].rolling(self.low_n).min()
+        return self.compute_from(SeriesContext(df))
+
+    def compute_from(self, ctx: SeriesContext) -> IndicatorOutput:
+        if ctx.empty or len(ctx) < max(self.high_n, self.low_n):
+            return IndicatorOutput(score=0.0, features=NO_FEATURES)
+        hh = ctx[self.upper]
+        ll = ctx[self.lower]
         mid = (hh + ll) / 2.0
         rng = (hh - ll).replace(0, 1e-9)
-        pos = (df["close"] - mid) / (rng / 2.0)
+        pos = (ctx[self.close] - mid) / (rng / 2.0)
         score = float(pos.iloc[-1])
         score = max(-1.0, min(1.0, score))
         return IndicatorOutput(
             score=score,
-            features={"upper": float(hh.iloc[-1]), "lower": float(ll.iloc[-1])},
+            features=TrendFeatures(upper=float(hh.iloc[-1]), lower=float(ll.iloc[-1])),
         )
@@ -5,24 +5,21 @@ import pandas as pd
 
 from tycherion.application.plugins.registry import register_indicator
 from tycherion.domain.signals.entities import IndicatorOutput
+from tycherion.domain.signals.features import NO_FEATURES, VolatilityFeatures
+from tycherion.domain.signals.indicators.series import SeriesContext, rolling_mean, true_range
 
 
 @register_indicator(key="volatility", method="atr_14", tags={"default"})
 class VolATR14(BaseIndicator):
     period = 14
+    atr = rolling_mean(true_range(), period)
 
     def compute(self, df: pd.DataFrame) -> IndicatorOutput:
-        if df.empty or len(df) < self.period + 1:
-            return IndicatorOutput(score=0.0, features={})
-        high = df["high"].astype(float)
-        low = df["low"].astype(float)
-        close = df["close"].astype(float)
-        prev_close = close.shift(1)
-        tr = (high - low).abs()
-        tr = pd.concat(
-            [tr, (high - prev_close).abs(), (low - prev_close).abs()], axis=1
-        ).max(axis=1)
-        atr = tr.rolling(self.period).mean()
-        val = float(atr.iloc[-1])
+        return self.compute_from(SeriesContext(df))
+
+    def compute_from(self, ctx: SeriesContext) -> IndicatorOutput:
+        if ctx.empty or len(ctx) < self.period + 1:
+            return IndicatorOutput(score=0.0, features=NO_FEATURES)
+        val = float(ctx[self.atr].iloc[-1])
         score = 1.0 / (1.0 + val) if val > 0 else 0.0
-        return IndicatorOutput(score=score, features={"atr": val})
+        return IndicatorOutput(score=score, features=VolatilityFeatures(atr=val))
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Mapping
 
 from tycherion.domain.signals.entities import IndicatorOutput, ModelDecision
 
+if TYPE_CHECKING:
+    from tycherion.domain.signals.batch import DecisionBatch, IndicatorColumns
+
 
 class SignalModel(ABC):
     """Abstract base class for per-symbol signal models."""
@@ -19,3 +22,12 @@ class SignalModel(ABC):
     @abstractmethod
     def decide(self, indicators: Dict[str, IndicatorOutput]) -> ModelDecision:
         raise NotImplementedError
+
+    def decide_batch(self, indicators: Mapping[str, IndicatorColumns], n: int) -> DecisionBatch | None:
+        """Optional vectorized `decide` over `n` symbols.
+
+        `indicators` holds one `IndicatorColumns` per required key, aligned by
+        row. Return None (the default) to have the pipeline call `decide` per
+        symbol instead.
+        """
+        return None
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from tycherion.domain.signals.models.base import SignalModel
-from typing import Dict
+from typing import Dict, Mapping
+
+import numpy as np
 
 from tycherion.application.plugins.registry import register_model
+from tycherion.domain.signals.batch import SIDE_BUY, SIDE_HOLD, SIDE_SELL, DecisionBatch, IndicatorColumns
 from tycherion.domain.signals.entities import IndicatorOutput, ModelDecision
 
 
@@ -24,3 +27,14 @@ class MeanReversion(SignalModel):
             return ModelDecision(side="SELL", weight=w, confidence=0.6)
         return ModelDecision(side="HOLD", weight=0.0, confidence=0.4)
 
+    def decide_batch(self, indicators: Mapping[str, IndicatorColumns], n: int) -> DecisionBatch:
+        stretch = indicators.get("stretch")
+        z = stretch.feature("z", 0.0) if stretch is not None else np.zeros(n, dtype=np.float64)
+
+        buy = z <= -2.0
+        sell = z >= 2.0
+        return DecisionBatch(
+            side=np.where(buy, SIDE_BUY, np.where(sell, SIDE_SELL, SIDE_HOLD)).astype(np.int8),
+            weight=np.where(buy | sell, np.minimum(1.0, np.abs(z) / 3.0), 0.0),
+            confidence=np.where(buy | sell, 0.6, 0.4),
+        )
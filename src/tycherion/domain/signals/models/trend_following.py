@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from tycherion.domain.signals.models.base import SignalModel
-from typing import Dict
+from typing import Dict, Mapping
+
+import numpy as np
 
 from tycherion.application.plugins.registry import register_model
+from tycherion.domain.signals.batch import SIDE_BUY, SIDE_HOLD, SIDE_SELL, DecisionBatch, IndicatorColumns
 from tycherion.domain.signals.entities import IndicatorOutput, ModelDecision
 
 
@@ -30,3 +33,18 @@ class TrendFollowing(SignalModel):
             )
         return ModelDecision(side="HOLD", weight=0.0, confidence=0.3)
 
+    def decide_batch(self, indicators: Mapping[str, IndicatorColumns], n: int) -> DecisionBatch:
+        trend = indicators.get("trend")
+        tr = trend.score if trend is not None else np.zeros(n, dtype=np.float64)
+
+        buy = tr > 0.2
+        sell = tr < -0.2
+        return DecisionBatch(
+            side=np.where(buy, SIDE_BUY, np.where(sell, SIDE_SELL, SIDE_HOLD)).astype(np.int8),
+            weight=np.where(
+                buy,
+                np.minimum(1.0, 0.5 + tr * 0.5),
+                np.where(sell, np.minimum(1.0, 0.5 + (-tr) * 0.5), 0.0),
+            ),
+            confidence=np.where(buy | sell, 0.7, 0.3),
+        )
@@ -1,7 +1,16 @@
 from __future__ import annotations
-from typing import Protocol
+from typing import Protocol, TYPE_CHECKING
 from datetime import datetime
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class MarketDataPort(Protocol):
+    """Bars by symbol and time window.
+
+    Adapters may also offer `get_bar_columns(symbol, timeframe, start, end)`
+    returning `BarColumns` (no DataFrame build; the pipeline prefers it),
+    and the cache hooks `warm(symbols, timeframe)` / `evict(symbols)`.
+    """
+
     def get_bars(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame: ...
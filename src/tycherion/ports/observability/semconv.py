@@ -21,16 +21,19 @@ SPAN_ALLOCATOR = "tycherion.allocator"
 SPAN_BALANCER = "tycherion.balancer"
 SPAN_EXECUTION = "tycherion.execution"
 SPAN_RUN = "tycherion.run"
+SPAN_SHADOW = "tycherion.shadow"
 
 # Event names (prefixed)
 EVT_PIPELINE_STAGE_STARTED = "tycherion.pipeline.stage_started"
 EVT_PIPELINE_STAGE_COMPLETED = "tycherion.pipeline.stage_completed"
 EVT_PIPELINE_SUMMARY = "tycherion.pipeline.summary"
 EVT_PIPELINE_RUN_SUMMARY = "tycherion.pipeline.run_summary"
+EVT_PIPELINE_DEGRADED = "tycherion.pipeline.degraded"
 EVT_COVERAGE_SUMMARY = "tycherion.coverage.summary"
 EVT_ALLOCATOR_COMPLETED = "tycherion.allocator.completed"
 EVT_REBALANCE_PLAN_BUILT = "tycherion.rebalance.plan_built"
 EVT_ORDERS_BUILT = "tycherion.orders.built"
+EVT_SHADOW_COMPARED = "tycherion.shadow.compared"
 
 # Common attribute keys
 ATTR_CHANNEL = "tycherion.channel"
@@ -41,3 +44,5 @@ ATTR_THRESHOLD = "threshold"
 ATTR_CONFIG_HASH = "config_hash"
 ATTR_CONFIG_PATH = "config_path"
 ATTR_RUN_MODE = "run_mode"
+ATTR_CYCLE_STATUS = "cycle_status"  # ok | degraded
+ATTR_SPAN_DROPPED_EVENTS = "tycherion.span.dropped_events"
@@ -22,16 +22,33 @@ class MT5(BaseModel):
     password: Optional[str] = None
 
 class RunMode(BaseModel):
-    name: str = "live_multimodel"
+    name: str = "live_multimodel"      # live_multimodel | sharded | replay
+    snapshot_path: str | None = None   # replay input (a cycle snapshot file)
+    workers: int = 0                   # sharded pipeline processes (0 => CPU count)
+    shared_bars: bool = False          # sharded: fetch bars once, share with workers
+    shard_timeout_seconds: float = 300.0  # sharded: max wait for a shard reply without a cycle deadline (0 => unbounded)
 
 class ScheduleCfg(BaseModel):
     run_forever: bool = False
     interval_seconds: int = 60
+    cycle_deadline_seconds: float | None = None   # null => no cycle budget
+    fetch_timeout_seconds: float | None = None    # per-symbol bars fetch wait
+    fetch_workers: int = 1                        # fetch threads when a budget is set
+    priority_recent_cycles: int = 3               # cycles a nonzero signal keeps a symbol in the "recent" tier
+
+class SnapshotCfg(BaseModel):
+    """Per-cycle input snapshots, replayable with run_mode `replay`."""
+
+    enabled: bool = False
+    dir: str = "snapshots"
+    keep_last: int = 1000     # newest files kept in `dir` (0 => no limit)
+    max_bytes: int = 0        # total size of `dir` snapshots (0 => no limit)
 
 class CoverageCfg(BaseModel):
     source: str = "market_watch"
     symbols: list[str] = []
     pattern: str | None = None
+    refresh_seconds: float = 0.0   # re-resolve coverage at most this often (0 => every cycle)
 
 
 class PipelineStageCfg(BaseModel):
@@ -41,33 +58,91 @@ class PipelineStageCfg(BaseModel):
     drop_threshold: float | None = None
 
 
+def _coerce_stages(v: Any):
+    # Accept both:
+    # - pipeline: ["trend_following", "mean_reversion"]
+    # - pipeline: [{name: "...", drop_threshold: ...}, ...]
+    if v is None:
+        return []
+    if isinstance(v, list):
+        out: list[Any] = []
+        for item in v:
+            if isinstance(item, str):
+                out.append({"name": item})
+            else:
+                out.append(item)
+        return out
+    return v
+
+
+class ShadowPipelineCfg(BaseModel):
+    """A pipeline evaluated next to the primary one, without trading.
+
+    It reuses the primary's bars and indicator results; its orders are
+    logged, not executed. `execution` defaults to the primary's.
+    """
+
+    name: str
+    pipeline: list[PipelineStageCfg] = []
+    execution: str | None = None
+
+    @field_validator("pipeline", mode="before")
+    @classmethod
+    def _coerce_pipeline(cls, v: Any):
+        return _coerce_stages(v)
+
+
+class SanityCfg(BaseModel):
+    """Data-quality/liquidity pre-filter run before any indicator.
+
+    Scores every fetched symbol in one pass (`sanity_score`) and drops
+    non-held symbols that fail a set threshold. Unset thresholds are off.
+    """
+
+    enabled: bool = False
+    min_bars: int | None = None                  # bars in the lookback window
+    min_mean_tick_volume: float | None = None
+    max_zero_volume_ratio: float | None = None   # share of bars with no ticks
+    max_gap_ratio: float | None = None           # share of steps longer than 1.5 bars
+    max_mean_spread: float | None = None         # broker points
+
+
 class ModelsCfg(BaseModel):
     """Application-level model selection.
 
     `pipeline` defines an ordered list of models to run per symbol. The order
     is the order of execution. Each stage can optionally define a
     `drop_threshold` used to discard non-held symbols early.
+
+    `execution` controls when indicators are computed: `symbol_major`
+    computes every stage's indicators per symbol up front; `stage_major`
+    computes each stage's indicators only for the symbols still alive when
+    that stage runs.
+
+    `shadow` lists extra pipelines compared against the primary each cycle.
     """
 
     pipeline: list[PipelineStageCfg] = []
+    execution: str = "symbol_major"    # symbol_major | stage_major
+    sanity: SanityCfg = SanityCfg()
+    shadow: list[ShadowPipelineCfg] = []
 
     @field_validator("pipeline", mode="before")
     @classmethod
     def _coerce_pipeline(cls, v: Any):
-        # Accept both:
-        # - pipeline: ["trend_following", "mean_reversion"]
-        # - pipeline: [{name: "...", drop_threshold: ...}, ...]
-        if v is None:
-            return []
-        if isinstance(v, list):
-            out: list[Any] = []
-            for item in v:
-                if isinstance(item, str):
-                    out.append({"name": item})
-                else:
-                    out.append(item)
-            return out
-        return v
+        return _coerce_stages(v)
+
+
+class PluginsCfg(BaseModel):
+    """Plugin discovery settings.
+
+    `eager` imports every plugin module at startup. `lazy` reads a cached
+    manifest and imports only the modules the configured pipeline, allocator
+    and balancer need.
+    """
+
+    discovery: str = "eager"           # eager | lazy
+    manifest_dir: str | None = None    # null => $TYCHERION_CACHE_DIR or ~/.cache/tycherion
 
 
 class PortfolioCfg(BaseModel):
@@ -75,6 +150,14 @@ class PortfolioCfg(BaseModel):
     balancer: str = "threshold"         # plugin name
     threshold_weight: float = 0.25      # only rebalance if |w| >= threshold
 
+class MarketDataCfg(BaseModel):
+    """Bar cache in front of the broker (live run modes)."""
+
+    cache_enabled: bool = False     # keep bars across cycles, fetch only missing ranges
+    repair_gaps: bool = True        # re-fetch holes once; empty ones are closed sessions
+    max_gap_repairs: int = 8        # hole re-fetches per symbol and request
+
+
 class ApplicationCfg(BaseModel):
     run_mode: RunMode = RunMode()
     playbook: str = "default"
@@ -82,6 +165,9 @@ class ApplicationCfg(BaseModel):
     coverage: CoverageCfg = CoverageCfg()
     models: ModelsCfg = ModelsCfg()
     portfolio: PortfolioCfg = PortfolioCfg()
+    plugins: PluginsCfg = PluginsCfg()
+    snapshot: SnapshotCfg = SnapshotCfg()
+    market_data: MarketDataCfg = MarketDataCfg()
 
 
 class ObservabilityCfg(BaseModel):
@@ -92,6 +178,8 @@ class ObservabilityCfg(BaseModel):
     console_channels: list[str] = ["ops"]
     console_min_level: str = "INFO"
     log_format: str = "pretty"  # pretty | json
+    console_buffered: bool = False          # batch console lines into one write
+    console_flush_interval_ms: int = 500    # max time a buffered line waits
 
     # OTLP export (Collector/Alloy)
     otlp_enabled: bool = False
@@ -100,6 +188,12 @@ class ObservabilityCfg(BaseModel):
     otlp_headers: str | None = None
     otlp_insecure: bool | None = None  # None => infer from scheme
 
+    # Trace sampling / span budget
+    trace_sample_ratio: float = 1.0           # head ratio in [0, 1]
+    trace_keep_errors: bool = True            # keep traces with errors even when ratio drops them
+    trace_keep_slow_ms: float | None = None   # keep cycles whose root span is at least this slow
+    span_max_events: int | None = 128         # per-span event cap (null => unlimited)
+
     # Deployment metadata
     deployment_env: str | None = None
 
@@ -184,11 +278,13 @@ def load_config(path: str) -> AppConfig:
     obs_cfg["otlp_insecure"] = env_override(obs_cfg.get("otlp_insecure"), env_bool("TYCHERION_OTLP_INSECURE"))
     obs_cfg["deployment_env"] = env_override(obs_cfg.get("deployment_env"), os.getenv("TYCHERION_DEPLOYMENT_ENV"))
     obs_cfg["log_format"] = env_override(obs_cfg.get("log_format"), os.getenv("TYCHERION_LOG_FORMAT"))
+    obs_cfg["trace_sample_ratio"] = env_override(obs_cfg.get("trace_sample_ratio"), os.getenv("TYCHERION_TRACE_SAMPLE_RATIO"))
 
     # Console output for local dev
     obs_cfg["console_enabled"] = env_override(obs_cfg.get("console_enabled"), env_bool("TYCHERION_CONSOLE_ENABLED"))
     obs_cfg["console_min_level"] = env_override(obs_cfg.get("console_min_level"), os.getenv("TYCHERION_CONSOLE_MIN_LEVEL"))
     obs_cfg["console_channels"] = env_override(obs_cfg.get("console_channels"), env_csv_list("TYCHERION_CONSOLE_CHANNELS"))
+    obs_cfg["console_buffered"] = env_override(obs_cfg.get("console_buffered"), env_bool("TYCHERION_CONSOLE_BUFFERED"))
 
     raw["observability"] = obs_cfg
     # Keep runtime config canonical and avoid validating partial legacy payloads.
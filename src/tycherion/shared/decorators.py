@@ -1,7 +1,6 @@
 from __future__ import annotations
 from functools import wraps
 import logging
-import MetaTrader5 as mt5
 
 _log = logging.getLogger(__name__)
 
@@ -10,6 +9,9 @@ def demo_only(fn):
     def wrapper(self, *args, **kwargs):
         require = getattr(self, "require_demo", True)
         if require:
+            # Deferred: importing this module must not load the MT5 bindings.
+            import MetaTrader5 as mt5
+
             ai = mt5.account_info()
             if not ai or ai.trade_mode != mt5.ACCOUNT_TRADE_MODE_DEMO:
                 raise RuntimeError("Blocked: only allowed in DEMO account.")
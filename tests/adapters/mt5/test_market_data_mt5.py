@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+
+from tycherion.domain.market.resampling import TIMEFRAME_MINUTES
+
+
+def test_adapter_supports_exactly_the_domain_timeframes(monkeypatch):
+    # MetaTrader5 only installs on Windows; its timeframe constants are all
+    # the adapter reads at import.
+    mt5 = types.ModuleType("MetaTrader5")
+    for n, tf in enumerate(["M1", "M2", "M5", "M15", "M30", "H1", "H4", "H12", "D1", "W1", "MN1"]):
+        setattr(mt5, f"TIMEFRAME_{tf}", 1000 + n)
+    monkeypatch.setitem(sys.modules, "MetaTrader5", mt5)
+    monkeypatch.delitem(sys.modules, "tycherion.adapters.mt5.market_data_mt5", raising=False)
+
+    adapter = importlib.import_module("tycherion.adapters.mt5.market_data_mt5")
+
+    assert adapter._TF_MAP.keys() == TIMEFRAME_MINUTES.keys()
+    assert all(adapter._TF_MAP[tf] == getattr(mt5, f"TIMEFRAME_{tf}") for tf in TIMEFRAME_MINUTES)
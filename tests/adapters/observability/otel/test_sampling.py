@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from opentelemetry.sdk.trace import SpanLimits, TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.id_generator import IdGenerator
+from opentelemetry.trace import Status, StatusCode, set_span_in_context
+
+from tycherion.adapters.observability.otel.console_dev import ConsoleConfig, ConsoleRenderer
+from tycherion.adapters.observability.otel.otel_sampling import (
+    TailSamplingSpanProcessor,
+    build_sampler,
+    tail_sampling_enabled,
+)
+from tycherion.adapters.observability.otel.otel_traces import OtelTracer
+from tycherion.ports.observability import semconv
+
+# Low 64 bits decide the ratio: 1 falls inside any ratio > 0, the max outside any < 1.
+INSIDE = (7 << 64) | 1
+OUTSIDE = (7 << 64) | ((1 << 64) - 1)
+
+
+@pytest.mark.parametrize(
+    ("ratio", "tail", "root"),
+    [
+        (1.0, False, "AlwaysOnSampler"),
+        (2.0, False, "AlwaysOnSampler"),
+        (0.25, False, "TraceIdRatioBased{0.25}"),
+        (-1.0, False, "TraceIdRatioBased{0.0}"),
+        (0.25, True, "AlwaysOnSampler"),
+    ],
+)
+def test_build_sampler(ratio, tail, root):
+    description = build_sampler(ratio, tail_sampling=tail).get_description()
+
+    assert description.startswith(f"ParentBased{{root:{root},")
+
+
+def test_keep_errors_default_turns_any_ratio_below_one_into_tail_sampling():
+    assert tail_sampling_enabled(0.1, keep_errors=True, keep_slow_ms=None)
+    assert tail_sampling_enabled(0.1, keep_errors=False, keep_slow_ms=500.0)
+    assert not tail_sampling_enabled(0.1, keep_errors=False, keep_slow_ms=None)
+    assert not tail_sampling_enabled(1.0, keep_errors=True, keep_slow_ms=500.0)
+
+
+class FixedIds(IdGenerator):
+    def __init__(self, trace_ids):
+        self.trace_ids = list(trace_ids)
+        self.span_id = 0
+
+    def generate_trace_id(self):
+        return self.trace_ids.pop(0)
+
+    def generate_span_id(self):
+        self.span_id += 1
+        return self.span_id
+
+
+def tail_tracer(trace_ids, **kwargs):
+    exporter = InMemorySpanExporter()
+    tail = TailSamplingSpanProcessor(SimpleSpanProcessor(exporter), ratio=0.5, **kwargs)
+    provider = TracerProvider(
+        sampler=build_sampler(0.5, tail_sampling=True),
+        id_generator=FixedIds(trace_ids),
+    )
+    provider.add_span_processor(tail)
+    return provider.get_tracer("test"), tail, exporter
+
+
+def exported_traces(exporter):
+    return {span.context.trace_id for span in exporter.get_finished_spans()}
+
+
+def test_tail_keeps_ratio_errors_exceptions_and_slow_roots():
+    ids = [INSIDE, OUTSIDE, OUTSIDE + 2, OUTSIDE + 4, OUTSIDE + 6]
+    tracer, tail, exporter = tail_tracer(list(ids), keep_errors=True, keep_slow_ms=1000.0)
+
+    for trace_id in ids:
+        root = tracer.start_span("cycle", start_time=0)
+        with tracer.start_as_current_span("step", context=set_span_in_context(root)) as child:
+            if trace_id == OUTSIDE + 2:
+                child.set_status(Status(StatusCode.ERROR))
+            if trace_id == OUTSIDE + 4:
+                child.record_exception(RuntimeError("boom"))
+        # OUTSIDE + 6 lasts 2 s, the others 1 ms.
+        root.end(end_time=2_000_000_000 if trace_id == OUTSIDE + 6 else 1_000_000)
+
+    assert exported_traces(exporter) == set(ids) - {OUTSIDE}
+    assert (tail.kept_traces, tail.dropped_traces) == (4, 1)
+    # A kept trace is forwarded whole: child and root.
+    assert len(exporter.get_finished_spans()) == 8
+
+
+def test_tail_without_keep_rules_drops_errors_outside_the_ratio():
+    tracer, tail, exporter = tail_tracer([OUTSIDE], keep_errors=False)
+
+    root = tracer.start_span("cycle")
+    root.set_status(Status(StatusCode.ERROR))
+    root.end()
+
+    assert exporter.get_finished_spans() == ()
+    assert tail.dropped_traces == 1
+
+
+class Recorder:
+    def __init__(self):
+        self.ended = []
+
+    def on_start(self, span, parent_context=None):
+        pass
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+
+def fake_span(trace_id, *, root):
+    parent = None if root else SimpleNamespace(is_remote=False)
+    return SimpleNamespace(context=SimpleNamespace(trace_id=trace_id), parent=parent, events=(), status=None)
+
+
+def test_pending_traces_are_capped_oldest_first():
+    delegate = Recorder()
+    tail = TailSamplingSpanProcessor(delegate, ratio=1.0)
+
+    # Children of 600 traces whose roots never end.
+    for trace_id in range(600):
+        tail.on_end(fake_span(trace_id, root=False))
+
+    assert len(tail._pending) == 512
+    assert tail.evicted_traces == 600 - 512
+    assert next(iter(tail._pending)) == 600 - 512
+
+    # An evicted trace's root ends alone; a pending one flushes with its child.
+    tail.on_end(fake_span(0, root=True))
+    tail.on_end(fake_span(599, root=True))
+    assert [s.context.trace_id for s in delegate.ended] == [0, 599, 599]
+
+
+def test_events_over_max_events_are_counted_and_reported():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider(span_limits=SpanLimits(max_events=3))
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    console = ConsoleRenderer(ConsoleConfig(enabled=False))
+    tracer = OtelTracer(provider.get_tracer("test"), schema_version="1", console=console, max_span_events=3)
+
+    with tracer.start_as_current_span("cycle") as span:
+        for i in range(5):
+            span.add_event(f"e{i}")
+        assert span.dropped_events == 2
+
+    (exported,) = exporter.get_finished_spans()
+    assert [e.name for e in exported.events] == ["e0", "e1", "e2"]
+    assert exported.attributes[semconv.ATTR_SPAN_DROPPED_EVENTS] == 2
+
+
+def test_unlimited_events_drop_nothing():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = OtelTracer(
+        provider.get_tracer("test"), schema_version="1", console=ConsoleRenderer(ConsoleConfig(enabled=False))
+    )
+
+    with tracer.start_as_current_span("cycle") as span:
+        for i in range(100):
+            span.add_event(f"e{i}")
+
+    (exported,) = exporter.get_finished_spans()
+    assert len(exported.events) == 100
+    assert semconv.ATTR_SPAN_DROPPED_EVENTS not in exported.attributes
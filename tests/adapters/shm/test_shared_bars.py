@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tycherion.adapters.shm.shared_bars import SharedBarReader, SharedBarStore, slots_for
+
+END = datetime(2024, 1, 10, tzinfo=timezone.utc)
+START = END - timedelta(days=2)
+
+
+class HourlyBars:
+    """48 hourly bars per symbol; symbols in `failing` raise."""
+
+    def __init__(self) -> None:
+        self.failing: set[str] = set()
+        self.calls: list[str] = []
+
+    def get_bars(self, symbol, timeframe, start, end):
+        self.calls.append(symbol)
+        if symbol in self.failing:
+            raise ConnectionError(f"{symbol}: terminal busy")
+        times = pd.date_range(end=pd.Timestamp(end).floor("h"), periods=48, freq="h")
+        times = times[times >= pd.Timestamp(start)]
+        close = np.full(len(times), float(sum(map(ord, symbol))))
+        return pd.DataFrame({"time": times, "open": close, "high": close, "low": close, "close": close})
+
+
+@pytest.fixture
+def store():
+    s = SharedBarStore.create(slots_for(10), 128)
+    yield s
+    s.close()
+
+
+def test_churning_universe_reuses_freed_slots(store):
+    source = HourlyBars()
+    for cycle in range(12):
+        # Each cycle swaps 5 of 10 symbols: 60 distinct symbols over 16 slots.
+        universe = [f"KEEP{i}" for i in range(5)] + [f"NEW{cycle}_{i}" for i in range(5)]
+        store.refresh(source, universe, "H1", START, END)
+        assert sorted(s for s, _ in store.keys()) == sorted(universe)
+        for sym in universe:
+            view, _ = store.read(sym, "H1")
+            assert view.shape[1] == 48
+            assert view[4, -1] == float(sum(map(ord, sym)))
+
+
+def test_freed_slot_bumps_generation(store):
+    source = HourlyBars()
+    store.refresh(source, ["AAA"], "H1", START, END)
+    _, gen = store.read("AAA", "H1")
+    store.refresh(source, ["BBB"], "H1", START, END)
+    assert store.read("AAA", "H1") is None
+    view, new_gen = store.read("BBB", "H1")
+    assert new_gen > gen
+    assert view[4, -1] == float(sum(map(ord, "BBB")))
+
+
+def test_failed_fetch_drops_the_symbol_so_readers_fall_back(store):
+    source = HourlyBars()
+    store.refresh(source, ["AAA", "BBB"], "H1", START, END)
+    source.failing = {"AAA"}
+    store.refresh(source, ["AAA", "BBB"], "H1", START, END)
+    assert store.read("AAA", "H1") is None
+    assert store.read("BBB", "H1") is not None
+
+    fallback = HourlyBars()
+    reader = SharedBarReader(SharedBarStore.attach(store.name), fallback=fallback)
+    try:
+        df = reader.get_bars("AAA", "H1", START, END)
+    finally:
+        reader.store.close()
+    assert fallback.calls == ["AAA"]
+    assert len(df) == 48
+
+
+def test_full_store_still_raises_for_more_keys_than_slots():
+    small = SharedBarStore.create(2, 64)
+    try:
+        with pytest.raises(MemoryError):
+            small.refresh(HourlyBars(), ["A", "B", "C"], "H1", START, END)
+    finally:
+        small.close()
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from tycherion.application.market_data.cache import (
+    CachingMarketData,
+    add_interval,
+    subtract_intervals,
+)
+
+T0 = datetime(2024, 1, 8, tzinfo=timezone.utc)
+HOUR = timedelta(hours=1)
+
+
+class Terminal:
+    """Hourly bars from T0 for `hours` hours, minus `missing` hours; counts calls.
+
+    `close_of(hour)` is the bar's close; `bump` changes the newest bar, as if
+    it were still forming.
+    """
+
+    def __init__(self, hours=72, missing=()):
+        self.hours = hours
+        self.missing = set(missing)
+        self.calls = []
+        self.forming = 0.0
+
+    def close_of(self, h):
+        return 100.0 + h + (self.forming if h == self.hours - 1 else 0.0)
+
+    def get_bars(self, symbol, timeframe, start, end):
+        self.calls.append((pd.Timestamp(start), pd.Timestamp(end)))
+        hours = [
+            h
+            for h in range(self.hours)
+            if h not in self.missing and pd.Timestamp(start) <= pd.Timestamp(T0 + h * HOUR) <= pd.Timestamp(end)
+        ]
+        return pd.DataFrame(
+            {
+                "time": pd.to_datetime([T0 + h * HOUR for h in hours], utc=True),
+                "close": np.array([self.close_of(h) for h in hours], dtype=np.float64),
+            }
+        )
+
+
+def window(terminal, days=2):
+    end = T0 + (terminal.hours - 1) * HOUR
+    return end - timedelta(days=days), end
+
+
+def test_interval_helpers():
+    assert add_interval([(0, 10), (20, 30)], 10, 20) == [(0, 30)]
+    assert add_interval([(0, 10)], 15, 15) == [(0, 10)]
+    assert subtract_intervals(0, 40, [(5, 10), (20, 30)]) == [(0, 5), (10, 20), (30, 40)]
+    assert subtract_intervals(5, 10, [(0, 20)]) == []
+
+
+def test_only_missing_ranges_are_fetched():
+    term = Terminal(hours=72)
+    cache = CachingMarketData(term)
+    start, end = window(term)
+    first = cache.get_bars("A", "H1", start, end)
+
+    term.hours += 3  # three new bars
+    start, end = window(term)
+    df = cache.get_bars("A", "H1", start, end)
+
+    assert len(term.calls) == 2
+    # The second fetch starts at the previous newest bar, not the window start.
+    assert term.calls[1][0] == pd.Timestamp(first["time"].iloc[-1])
+    assert len(df) == 49 and pd.Timestamp(df["time"].iloc[-1]) == pd.Timestamp(end)
+
+
+def test_forming_bar_is_fetched_again():
+    term = Terminal(hours=48)
+    cache = CachingMarketData(term)
+    start, end = window(term, days=1)
+    cache.get_bars("A", "H1", start, end)
+
+    term.forming = 0.5
+    df = cache.get_bars("A", "H1", start, end)
+
+    assert len(term.calls) == 2
+    assert term.calls[1][0] == pd.Timestamp(end)
+    assert df["close"].iloc[-1] == term.close_of(47)
+    assert df["time"].is_unique
+
+
+def test_empty_hole_is_marked_closed_and_not_retried():
+    term = Terminal(hours=48, missing=range(30, 35))
+    cache = CachingMarketData(term)
+    start, end = window(term, days=1)
+
+    cache.get_bars("A", "H1", start, end)
+    # Window fetch, then one repair fetch of the hole that comes back empty.
+    assert len(term.calls) == 2
+    assert term.calls[1][0] == pd.Timestamp(T0 + 30 * HOUR)
+
+    cache.get_bars("A", "H1", start, end)
+    # Only the forming bar again; the closed hole is not retried.
+    assert len(term.calls) == 3
+    assert term.calls[2][0] == pd.Timestamp(end)
+
+
+def test_hole_synced_later_is_filled_by_the_repair():
+    term = Terminal(hours=48)
+    cache = CachingMarketData(term)
+    start, end = window(term, days=1)
+    term.missing = set(range(30, 32))
+    # Window fetch sees the hole; the repair finds the bars synced meanwhile.
+    original = term.get_bars
+
+    def sync_after_first(*args):
+        out = original(*args)
+        term.missing = set()
+        return out
+
+    term.get_bars = sync_after_first
+    df = cache.get_bars("A", "H1", start, end)
+
+    assert len(term.calls) == 2
+    assert len(df) == 25
+
+
+def test_moving_window_trims_old_bars():
+    term = Terminal(hours=72)
+    cache = CachingMarketData(term)
+    start, end = window(term, days=1)
+    cache.get_bars("A", "H1", start, end)
+
+    term.hours += 24
+    start, end = window(term, days=1)
+    df = cache.get_bars("A", "H1", start, end)
+
+    series = cache._series[("A", "H1")]
+    lo = pd.Timestamp(start).value
+    assert series.times[0] >= lo
+    assert all(a >= lo for a, _ in series.covered)
+    assert len(df) == 25
+
+
+def test_empty_symbol_costs_one_call_per_request():
+    term = Terminal(hours=48, missing=range(48))
+    cache = CachingMarketData(term)
+    start, end = window(term, days=1)
+
+    df = cache.get_bars("A", "H1", start, end)
+
+    assert df.empty and list(df.columns) == ["time", "close"]
+    assert len(term.calls) == 1
+
+
+class ColumnarTerminal(Terminal):
+    """`Terminal` that also answers `get_bar_columns` with MT5-style rates."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.frame_calls = 0
+
+    def get_bars(self, symbol, timeframe, start, end):
+        self.frame_calls += 1
+        return super().get_bars(symbol, timeframe, start, end)
+
+    def get_bar_columns(self, symbol, timeframe, start, end):
+        from tycherion.domain.market.columns import RATES_DTYPE, BarColumns
+
+        df = Terminal.get_bars(self, symbol, timeframe, start, end)
+        rates = np.zeros(len(df), dtype=RATES_DTYPE)
+        rates["time"] = pd.DatetimeIndex(df["time"]).as_unit("s").asi8
+        rates["close"] = df["close"].to_numpy()
+        return BarColumns(rates)
+
+
+def test_columns_pass_through_the_cache_without_frames():
+    from tycherion.domain.market.columns import BarColumns
+
+    terminal = ColumnarTerminal()
+    cache = CachingMarketData(terminal)
+    start, end = window(terminal)
+
+    first = cache.get_bar_columns("A", "H1", start, end)
+    terminal.forming = 0.5
+    second = cache.get_bar_columns("A", "H1", start + HOUR, end + HOUR)
+
+    assert isinstance(first, BarColumns) and isinstance(second, BarColumns)
+    assert terminal.frame_calls == 0
+    # Second call fetched only from the forming bar on.
+    assert terminal.calls[-1][0] == pd.Timestamp(end)
+    assert len(second) == 48
+    assert second["close"][-1] == terminal.close_of(terminal.hours - 1)
+
+    # Same bars as the DataFrame path.
+    reference = Terminal()
+    frames = CachingMarketData(reference)
+    frames.get_bars("A", "H1", start, end)
+    reference.forming = 0.5
+    expected = frames.get_bars("A", "H1", start + HOUR, end + HOUR)
+    assert second.to_frame()["close"].tolist() == expected["close"].tolist()
+    assert pd.DatetimeIndex(second.to_frame()["time"]).equals(pd.DatetimeIndex(expected["time"]))
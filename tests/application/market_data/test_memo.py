@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from tycherion.application.market_data.memo import CycleBarsMemo
+
+END = datetime(2024, 1, 10, tzinfo=timezone.utc)
+START = END - timedelta(days=2)
+
+
+class CountingBars:
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = set(fail)
+
+    def get_bars(self, symbol, timeframe, start, end):
+        self.calls.append((symbol, timeframe))
+        if symbol in self.fail:
+            raise RuntimeError(f"no bars for {symbol}")
+        return pd.DataFrame({"close": [1.0, 2.0]})
+
+
+def test_repeated_request_is_served_from_memory():
+    inner = CountingBars()
+    memo = CycleBarsMemo(inner)
+
+    first = memo.get_bars("A", "h1", START, END)
+    again = memo.get_bars("A", "H1", START, END)
+    columns = memo.get_bar_columns("A", "H1", START, END)
+    columns_again = memo.get_bar_columns("A", "H1", START, END)
+
+    assert again is first and columns_again is columns
+    # One call per kind of answer (frame, columns), none repeated.
+    assert inner.calls == [("A", "H1"), ("A", "H1")]
+
+
+def test_errors_are_memoized_too():
+    inner = CountingBars(fail={"BAD"})
+    memo = CycleBarsMemo(inner)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            memo.get_bars("BAD", "H1", START, END)
+
+    assert inner.calls == [("BAD", "H1")]
+
+
+def test_frozen_memo_never_calls_the_broker():
+    inner = CountingBars()
+    memo = CycleBarsMemo(inner)
+    memo.get_bars("A", "H1", START, END)
+    memo.freeze()
+
+    memo.get_bars("A", "H1", START, END)
+    with pytest.raises(LookupError):
+        memo.get_bars("B", "H1", START, END)
+
+    assert inner.calls == [("A", "H1")]
+
+
+def test_discarded_fetch_is_forgotten_and_not_stored_later():
+    inner = CountingBars()
+    memo = CycleBarsMemo(inner)
+    memo.get_bars("A", "H1", START, END)
+
+    memo.discard("A", "H1")
+    memo.get_bars("A", "H1", START, END)
+    memo.freeze()
+
+    assert len(memo) == 0
+    with pytest.raises(LookupError):
+        memo.get_bars("A", "H1", START, END)
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from tycherion.application.market_data.cache import CachingMarketData
+from tycherion.application.pipeline.fetch import (
+    FETCH_ERROR,
+    FETCH_OK,
+    FETCH_SKIPPED,
+    FETCH_TIMEOUT,
+    BarFetchQueue,
+)
+
+
+class SlowFetch:
+    """Fetch that sleeps per symbol and records calls still running."""
+
+    def __init__(self, delays=None, fail=()):
+        self.delays = delays or {}
+        self.fail = set(fail)
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, symbol):
+        with self._lock:
+            self.calls.append(symbol)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(self.delays.get(symbol, 0.0))
+            if symbol in self.fail:
+                raise RuntimeError(f"no bars for {symbol}")
+            return pd.DataFrame({"close": [1.0]})
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+class StepClock:
+    """Monotonic clock that advances `step` seconds per read."""
+
+    def __init__(self, step):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def statuses(queue):
+    return {o.symbol: o.status for o in queue}
+
+
+def test_inline_past_deadline_skips_non_held_and_fetches_held():
+    fetch = SlowFetch()
+    items = [(0, "HELD", True), (1, "A", False), (2, "B", False), (3, "HELD2", True)]
+    # First read is before the deadline, every later one past it.
+    queue = BarFetchQueue(fetch, items, deadline=1.5, clock=StepClock(1.0))
+
+    got = statuses(queue)
+
+    assert got == {"HELD": FETCH_OK, "A": FETCH_SKIPPED, "B": FETCH_SKIPPED, "HELD2": FETCH_OK}
+    assert fetch.calls == ["HELD", "HELD2"]
+
+
+def test_inline_reports_errors_without_stopping():
+    fetch = SlowFetch(fail={"B"})
+    items = [(0, "A", False), (1, "B", False), (2, "C", False)]
+
+    got = statuses(BarFetchQueue(fetch, items))
+
+    assert got == {"A": FETCH_OK, "B": FETCH_ERROR, "C": FETCH_OK}
+
+
+def test_threaded_keeps_item_order():
+    fetch = SlowFetch(delays={"A": 0.05})
+    items = [(i, s, False) for i, s in enumerate("ABCDEF")]
+
+    out = list(BarFetchQueue(fetch, items, workers=3, fetch_timeout=5.0))
+
+    assert [o.row for o in out] == list(range(6))
+    assert all(o.status == FETCH_OK for o in out)
+
+
+def test_timeout_reports_symbol_and_abandons_call_past_drain_budget():
+    fetch = SlowFetch(delays={"SLOW": 0.5})
+    items = [(0, "SLOW", False), (1, "A", False), (2, "HELD", True)]
+
+    t0 = time.monotonic()
+    queue = BarFetchQueue(fetch, items, workers=2, fetch_timeout=0.05)
+    got = statuses(queue)
+    elapsed = time.monotonic() - t0
+
+    assert got == {"SLOW": FETCH_TIMEOUT, "A": FETCH_OK, "HELD": FETCH_OK}
+    # The drain waits one fetch timeout, then leaves the slow call behind.
+    assert queue.abandoned == 1
+    assert elapsed < 0.4
+
+
+def test_drain_waits_for_calls_finishing_within_budget():
+    fetch = SlowFetch(delays={"SLOW": 0.1})
+    items = [(0, "SLOW", False), (1, "A", False)]
+
+    queue = BarFetchQueue(fetch, items, workers=2, fetch_timeout=0.3)
+    got = statuses(queue)
+
+    assert got == {"SLOW": FETCH_OK, "A": FETCH_OK}
+    assert queue.abandoned == 0 and fetch.running == 0
+
+
+def test_fetch_raising_timeout_error_counts_as_timed_out():
+    def fetch(symbol):
+        if symbol == "BUSY":
+            raise TimeoutError("session busy")
+        return pd.DataFrame({"close": [1.0]})
+
+    items = [(0, "BUSY", True), (1, "A", False)]
+
+    assert statuses(BarFetchQueue(fetch, items)) == {"BUSY": FETCH_TIMEOUT, "A": FETCH_OK}
+    assert statuses(BarFetchQueue(fetch, items, workers=2, fetch_timeout=1.0)) == {
+        "BUSY": FETCH_TIMEOUT,
+        "A": FETCH_OK,
+    }
+
+
+def test_deadline_skips_non_held_but_waits_for_held():
+    fetch = SlowFetch(delays={"A": 0.2, "HELD": 0.2})
+    items = [(0, "A", False), (1, "HELD", True), (2, "B", False)]
+    deadline = time.monotonic() + 0.05
+
+    got = statuses(BarFetchQueue(fetch, items, workers=1, prefetch=1, deadline=deadline))
+
+    assert got == {"A": FETCH_SKIPPED, "HELD": FETCH_OK, "B": FETCH_SKIPPED}
+    # B was never submitted: the deadline had passed when its turn came.
+    assert "B" not in fetch.calls
+    assert fetch.running == 0
+
+
+def test_closing_the_queue_early_waits_for_running_calls():
+    fetch = SlowFetch(delays={"B": 0.2})
+    items = [(i, s, False) for i, s in enumerate("ABCD")]
+    queue = iter(BarFetchQueue(fetch, items, workers=2, prefetch=4, fetch_timeout=5.0))
+
+    assert next(queue).symbol == "A"
+    queue.close()
+
+    assert fetch.running == 0
+
+
+class GrowingBars:
+    """Hourly bars up to `end`, with a short pause to widen races."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.concurrent = 0
+        self.overlapped = False
+
+    def get_bars(self, symbol, timeframe, start, end):
+        with self.lock:
+            self.concurrent += 1
+            self.overlapped |= self.concurrent > 1
+        try:
+            time.sleep(0.002)
+            times = pd.date_range(start=pd.Timestamp(start).ceil("h"), end=end, freq="h")
+            close = np.arange(len(times), dtype=np.float64)
+            return pd.DataFrame({"time": times, "open": close, "high": close, "low": close, "close": close})
+        finally:
+            with self.lock:
+                self.concurrent -= 1
+
+
+def test_cache_serves_one_series_from_many_threads():
+    inner = GrowingBars()
+    cache = CachingMarketData(inner, repair_gaps=False)
+    end0 = datetime(2024, 1, 10, tzinfo=timezone.utc)
+
+    def read(k):
+        end = end0 + timedelta(hours=k % 5)
+        return end, cache.get_bars("EURUSD", "H1", end - timedelta(days=2), end)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(read, range(40)))
+
+    # One series is fetched by one thread at a time.
+    assert not inner.overlapped
+    for end, df in results:
+        times = pd.DatetimeIndex(df["time"])
+        assert times.is_monotonic_increasing and times.is_unique
+        assert len(df) == 49
+        assert times[-1] == pd.Timestamp(end)
+
+
+class BrokerSession:
+    """Bars behind one session lock, like the MT5 adapter: `HUNG` holds the
+    lock until released, and callers queued behind it give up after
+    `lock_timeout` with `TimeoutError`."""
+
+    def __init__(self, lock_timeout):
+        self.lock_timeout = lock_timeout
+        self.session = threading.Lock()
+        self.release = threading.Event()
+
+    def get_bars(self, symbol, timeframe, start, end):
+        if not self.session.acquire(timeout=self.lock_timeout):
+            raise TimeoutError(f"session busy ({symbol})")
+        try:
+            if symbol == "HUNG":
+                self.release.wait(10.0)
+            times = pd.date_range(end=pd.Timestamp(end).floor("h"), periods=50, freq="h")
+            close = np.linspace(100.0, 110.0, len(times))
+            return pd.DataFrame({"time": times, "open": close, "high": close, "low": close, "close": close})
+        finally:
+            self.session.release()
+
+
+def test_run_returns_near_deadline_when_a_broker_call_hangs():
+    from tycherion.adapters.observability.noop.noop_observability import NoopObservability
+    from tycherion.application.pipeline.config import PipelineConfig, PipelineStageConfig
+    from tycherion.application.pipeline.service import ModelPipelineService
+    from tycherion.application.replay.snapshot import CycleSnapshot, RecordingMarketData
+    from tycherion.domain.portfolio.entities import PortfolioSnapshot, Position
+    from tycherion.domain.signals.entities import IndicatorOutput, ModelDecision
+    from tycherion.domain.signals.indicators.base import BaseIndicator
+    from tycherion.domain.signals.models.base import SignalModel
+
+    class Last(BaseIndicator):
+        key, method = "last", "close"
+
+        def compute(self, df):
+            return IndicatorOutput(score=0.1, features={})
+
+    class Follow(SignalModel):
+        def requires(self):
+            return {"last"}
+
+        def decide(self, indicators):
+            return ModelDecision(side="BUY", weight=0.1, confidence=1.0)
+
+    as_of = datetime(2024, 1, 10, tzinfo=timezone.utc)
+    broker = BrokerSession(lock_timeout=0.2)
+    snapshot = CycleSnapshot(as_of=as_of, timeframe="H1", lookback_days=3)
+    service = ModelPipelineService(
+        market_data=RecordingMarketData(broker, snapshot),
+        model_registry={"follow": Follow()},
+        indicator_picker=lambda key, playbook: Last(),
+        timeframe="H1",
+        lookback_days=3,
+    )
+    held = {s: Position(symbol=s, quantity=1.0, price=100.0) for s in ("HUNG", "HELD")}
+    config = PipelineConfig(
+        stages=[PipelineStageConfig("follow")],
+        cycle_deadline_seconds=0.5,
+        fetch_timeout_seconds=0.2,
+        fetch_workers=2,
+    )
+
+    t0 = time.monotonic()
+    try:
+        result = service.run(
+            ["HUNG", "HELD", "A", "B", "C"],
+            PortfolioSnapshot(equity=1000.0, positions=held),
+            config,
+            observability=NoopObservability(),
+            as_of=as_of,
+        )
+        elapsed = time.monotonic() - t0
+    finally:
+        broker.release.set()
+
+    # Held symbols queued behind the hung call time out instead of waiting.
+    assert elapsed < 1.2
+    assert result.degraded
+    assert set(result.skipped_symbols) == {"A", "B", "C"}
+    assert "HUNG" not in result.signals_by_symbol or result.signals_by_symbol["HUNG"].signed == 0.0
+
+    # The hung call's late answer is not recorded: a replay skips it too.
+    time.sleep(0.1)
+    assert ("HUNG", "H1") not in snapshot.bars
+    assert not any(key[0] in {"A", "B", "C"} for key in snapshot.bars)
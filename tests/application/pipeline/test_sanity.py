@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tycherion.adapters.observability.noop.noop_observability import NoopObservability
+from tycherion.application.pipeline.config import PipelineConfig, PipelineStageConfig, SanityConfig
+from tycherion.application.pipeline.sanity import bar_stats, evaluate_sanity
+from tycherion.application.pipeline.service import ModelPipelineService
+from tycherion.domain.portfolio.entities import PortfolioSnapshot, Position
+from tycherion.domain.signals.entities import IndicatorOutput, ModelDecision
+from tycherion.domain.signals.indicators.base import BaseIndicator
+from tycherion.domain.signals.models.base import SignalModel
+
+H1 = 3600.0
+T0 = pd.Timestamp("2024-01-08", tz="UTC")
+
+
+def frame(n=10, tick_volume=100.0, spread=2.0, skip=()):
+    """`n` hourly bars; hours listed in `skip` are left out (gaps)."""
+    hours = [h for h in range(n + len(skip)) if h not in set(skip)][:n]
+    return pd.DataFrame(
+        {
+            "time": [T0 + pd.Timedelta(hours=h) for h in hours],
+            "close": np.linspace(1.0, 2.0, n),
+            "tick_volume": np.broadcast_to(np.asarray(tick_volume, dtype=np.float64), (n,)).copy(),
+            "spread": np.full(n, spread),
+        }
+    )
+
+
+def check(config, df, bar_seconds=H1):
+    report = evaluate_sanity([df], config, bar_seconds)
+    return report.reason[0], float(report.score[0])
+
+
+@pytest.mark.parametrize(
+    "config, df, reason",
+    [
+        (SanityConfig(min_bars=10), frame(10), ""),
+        (SanityConfig(min_bars=11), frame(10), "min_bars"),
+        (SanityConfig(min_mean_tick_volume=100.0), frame(tick_volume=100.0), ""),
+        (SanityConfig(min_mean_tick_volume=100.5), frame(tick_volume=100.0), "min_mean_tick_volume"),
+        # 2 of 10 bars without ticks.
+        (SanityConfig(max_zero_volume_ratio=0.2), frame(tick_volume=[0, 0] + [5] * 8), ""),
+        (SanityConfig(max_zero_volume_ratio=0.19), frame(tick_volume=[0, 0] + [5] * 8), "max_zero_volume_ratio"),
+        # 1 gap over 9 steps.
+        (SanityConfig(max_gap_ratio=1 / 9), frame(skip=(4,)), ""),
+        (SanityConfig(max_gap_ratio=0.11), frame(skip=(4,)), "max_gap_ratio"),
+        (SanityConfig(max_mean_spread=2.0), frame(spread=2.0), ""),
+        (SanityConfig(max_mean_spread=1.99), frame(spread=2.0), "max_mean_spread"),
+    ],
+)
+def test_check_boundaries(config, df, reason):
+    got, score = check(config, df)
+
+    assert got == reason
+    if reason:
+        assert score < 1.0
+
+
+def test_scores_are_the_worst_check():
+    config = SanityConfig(min_bars=20, max_mean_spread=1.0)
+
+    _, score = check(config, frame(10, spread=4.0))
+
+    assert score == pytest.approx(0.25)
+
+
+def test_unmeasured_stats_pass():
+    df = frame(10).drop(columns=["tick_volume", "spread"])
+    config = SanityConfig(min_mean_tick_volume=50.0, max_zero_volume_ratio=0.0, max_gap_ratio=0.0, max_mean_spread=1.0)
+
+    report = evaluate_sanity([df], config, None)
+
+    assert math.isnan(report.stats["mean_tick_volume"][0])
+    assert math.isnan(report.stats["gap_ratio"][0])
+    assert report.reason == [""]
+    assert report.score[0] == 1.0
+
+
+def test_first_failing_check_is_the_reason():
+    config = SanityConfig(min_bars=50, min_mean_tick_volume=1e6, max_mean_spread=0.5)
+
+    reason, _ = check(config, frame(10))
+    assert reason == "min_bars"
+
+    reason, _ = check(SanityConfig(min_mean_tick_volume=1e6, max_mean_spread=0.5), frame(10))
+    assert reason == "min_mean_tick_volume"
+
+
+def test_gaps_are_counted_per_frame_across_concatenation():
+    # Frames back to back in the concatenated arrays: the step from one
+    # frame's last bar to the next frame's first bar must not count.
+    late = frame(5)
+    late["time"] = late["time"] + pd.Timedelta(days=30)
+    frames = [frame(5), late, frame(5, skip=(1, 2)), frame(1)]
+
+    stats = bar_stats(frames, H1)
+
+    np.testing.assert_allclose(stats["gap_ratio"], [0.0, 0.0, 0.25, 0.0])
+    np.testing.assert_allclose(stats["bars"], [5, 5, 5, 1])
+
+
+class Score(BaseIndicator):
+    key, method = "score", "one"
+
+    def compute(self, df):
+        return IndicatorOutput(score=0.5, features={})
+
+
+class Long(SignalModel):
+    def requires(self):
+        return {"score"}
+
+    def decide(self, indicators):
+        return ModelDecision(side="BUY", weight=0.5, confidence=1.0)
+
+
+class ShortHistory:
+    """Few bars for `THIN*` symbols, plenty for the rest."""
+
+    def get_bars(self, symbol, timeframe, start, end):
+        n = 3 if symbol.startswith("THIN") else 48
+        times = pd.date_range(end=pd.Timestamp(end).floor("h"), periods=n, freq="h")
+        close = np.linspace(100.0, 101.0, n)
+        return pd.DataFrame({"time": times, "close": close, "tick_volume": np.full(n, 10.0), "spread": np.ones(n)})
+
+
+def test_screen_keeps_held_failures_and_drops_the_rest():
+    svc = ModelPipelineService(
+        market_data=ShortHistory(),
+        model_registry={"long": Long()},
+        indicator_picker=lambda key, playbook: Score(),
+        timeframe="H1",
+        lookback_days=3,
+    )
+    config = PipelineConfig(stages=[PipelineStageConfig("long")], sanity=SanityConfig(min_bars=24))
+
+    result = svc.run(
+        ["OK", "THIN", "THIN_HELD"],
+        PortfolioSnapshot(equity=1000.0, positions={"THIN_HELD": Position(symbol="THIN_HELD", quantity=1.0, price=1.0)}),
+        config,
+        observability=NoopObservability(),
+        as_of=datetime(2024, 1, 10, tzinfo=timezone.utc),
+    )
+
+    states = result.states_by_symbol
+    assert result.stage_stats["sanity"] == 1
+    assert not states["THIN"].alive and states["THIN"].notes.get("dropped_by_sanity") == 1.0
+    assert states["THIN_HELD"].alive and states["THIN_HELD"].notes.get("sanity_failed") == 1.0
+    assert states["THIN_HELD"].sanity_score == pytest.approx(3 / 24)
+    assert states["OK"].sanity_score == 1.0
+    assert set(result.signals_by_symbol) >= {"OK", "THIN_HELD"}
+    assert "THIN" not in result.signals_by_symbol
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from tycherion.application.pipeline.schedule import TIER_HELD, TIER_RECENT, TIER_REST, SymbolScheduler
+from tycherion.domain.portfolio.entities import Signal
+
+SYMBOLS = ["A", "B", "C", "D", "E"]
+
+
+def signals(**signed):
+    return {s: Signal(symbol=s, signed=v, confidence=1.0) for s, v in signed.items()}
+
+
+def ordered(scheduler, held=()):
+    return [SYMBOLS[i] for i in scheduler.order(SYMBOLS, [s in held for s in SYMBOLS])]
+
+
+def test_held_then_recent_then_rest_in_input_order():
+    sched = SymbolScheduler(recent_cycles=3)
+    sched.observe(signals(E=0.5, C=-0.2, B=0.0))
+
+    assert ordered(sched, held={"D"}) == ["D", "C", "E", "A", "B"]
+    assert sched.tier("D", True) == TIER_HELD
+    assert sched.tier("C", False) == TIER_RECENT
+    assert sched.tier("B", False) == TIER_REST
+
+
+def test_held_wins_over_recent():
+    sched = SymbolScheduler(recent_cycles=3)
+    sched.observe(signals(A=1.0))
+
+    assert ordered(sched, held={"A", "E"}) == ["A", "E", "B", "C", "D"]
+
+
+def test_recent_tier_expires_after_recent_cycles():
+    sched = SymbolScheduler(recent_cycles=2)
+    sched.observe(signals(C=1.0))
+    sched.observe({})
+    assert ordered(sched) == ["C", "A", "B", "D", "E"]
+
+    sched.observe({})
+    assert ordered(sched) == SYMBOLS
+    assert sched.recent() == []
+
+
+def test_zero_recent_cycles_orders_held_only():
+    sched = SymbolScheduler(recent_cycles=0)
+    sched.observe(signals(C=1.0))
+
+    assert ordered(sched, held={"E"}) == ["E", "A", "B", "C", "D"]
+
+
+def test_forget_drops_recent_state():
+    sched = SymbolScheduler(recent_cycles=3)
+    sched.observe(signals(C=1.0, D=-1.0))
+
+    sched.forget(["C", "Z"])
+
+    assert sched.recent() == ["D"]
+    assert ordered(sched) == ["D", "A", "B", "C", "E"]
+
+
+def test_prime_restores_recorded_order():
+    live = SymbolScheduler(recent_cycles=3)
+    live.observe(signals(E=1.0, B=-1.0))
+
+    replay = SymbolScheduler(recent_cycles=1)
+    replay.prime(live.recent())
+
+    assert ordered(replay, held={"C"}) == ordered(live, held={"C"}) == ["C", "B", "E", "A", "D"]
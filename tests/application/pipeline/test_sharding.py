@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from multiprocessing import Pipe
+
+import pytest
+
+from tycherion.adapters.observability.noop.noop_observability import NoopObservability
+from tycherion.application.pipeline.config import PipelineConfig, PipelineStageConfig
+from tycherion.application.pipeline.result import PipelineRunResult
+from tycherion.application.pipeline.sharding import HashRing, ShardedPipelineService, serve_pipeline
+from tycherion.domain.portfolio.entities import PortfolioSnapshot, Position, Signal
+
+OBS = NoopObservability()
+CONFIG = PipelineConfig(stages=[PipelineStageConfig("trend_following")])
+T0 = datetime(2024, 1, 10, tzinfo=timezone.utc)
+SYMBOLS = [f"SYM{i:03d}" for i in range(40)]
+
+
+class StampService:
+    """Signals stamped with the cycle's `as_of` (in hours since T0)."""
+
+    def run(self, universe_symbols, portfolio_snapshot, pipeline_config, *, observability, as_of, deadline):
+        stamp = (as_of - T0) / timedelta(hours=1)
+        return PipelineRunResult(
+            pipeline_config=pipeline_config,
+            states_by_symbol={},
+            signals_by_symbol={s: Signal(symbol=s, signed=stamp, confidence=1.0) for s in universe_symbols},
+            stage_stats={"trend_following": len(universe_symbols)},
+        )
+
+    def apply_universe_diff(self, added, removed):
+        pass
+
+
+def start_worker(service=None):
+    parent, child = Pipe()
+    threading.Thread(target=serve_pipeline, args=(child, service or StampService(), OBS), daemon=True).start()
+    return parent, child
+
+
+def dead_worker():
+    parent, child = Pipe()
+    child.close()
+    return parent
+
+
+def sharded(n, **kwargs):
+    workers = [start_worker() for _ in range(n)]
+    svc = ShardedPipelineService(None, "H1", 15, [parent for parent, _ in workers], **kwargs)
+    return svc, workers
+
+
+def run(svc, hours=0):
+    return svc.run(SYMBOLS, PortfolioSnapshot(equity=1000.0, positions={}), CONFIG, observability=OBS, as_of=T0 + timedelta(hours=hours))
+
+
+def test_hash_ring_is_stable_and_keeps_input_order():
+    ring = HashRing(4)
+    parts = ring.partition(SYMBOLS)
+    assert sorted(s for part in parts for s in part) == SYMBOLS
+    for shard, part in enumerate(parts):
+        assert part == [s for s in SYMBOLS if ring.shard_of(s) == shard]
+    assert HashRing(4).partition(SYMBOLS) == parts
+
+
+def test_hash_ring_moves_few_symbols_when_a_shard_is_added():
+    symbols = [f"S{i}" for i in range(2000)]
+    before, after = HashRing(4), HashRing(5)
+    moved = sum(before.shard_of(s) != after.shard_of(s) for s in symbols) / len(symbols)
+    assert moved < 0.35
+
+
+def test_run_merges_every_shard():
+    svc, _ = sharded(3)
+    result = run(svc, hours=2)
+    assert sorted(result.signals_by_symbol) == SYMBOLS
+    assert {sig.signed for sig in result.signals_by_symbol.values()} == {2.0}
+    assert result.stage_stats["trend_following"] == len(SYMBOLS)
+    svc.close()
+
+
+def test_run_sends_held_positions_to_their_shard_only():
+    seen = {}
+
+    class Recording(StampService):
+        def run(self, universe_symbols, portfolio_snapshot, *args, **kwargs):
+            seen.update({s: set(portfolio_snapshot.positions) for s in universe_symbols})
+            return super().run(universe_symbols, portfolio_snapshot, *args, **kwargs)
+
+    workers = [start_worker(Recording()) for _ in range(2)]
+    svc = ShardedPipelineService(None, "H1", 15, [p for p, _ in workers])
+    held = {"SYM001": Position("SYM001", 1.0, 10.0)}
+    svc.run(SYMBOLS, PortfolioSnapshot(equity=1000.0, positions=held), CONFIG, observability=OBS, as_of=T0)
+    for sym, positions in seen.items():
+        assert positions <= {"SYM001"}
+        assert ("SYM001" in positions) == (svc.ring.shard_of(sym) == svc.ring.shard_of("SYM001"))
+    svc.close()
+
+
+def test_dead_worker_fails_the_cycle_and_is_replaced():
+    spawned = []
+
+    def spawn(shard):
+        parent, child = start_worker()
+        spawned.append(shard)
+        return parent, None
+
+    svc = ShardedPipelineService(None, "H1", 15, [start_worker()[0], dead_worker()], spawn_worker=spawn)
+    with pytest.raises(RuntimeError, match="shard 1"):
+        run(svc, hours=1)
+    # Shard 0 was drained: the next cycle reads its own replies, not cycle 1's.
+    result = run(svc, hours=2)
+    assert spawned == [1]
+    assert sorted(result.signals_by_symbol) == SYMBOLS
+    assert {sig.signed for sig in result.signals_by_symbol.values()} == {2.0}
+    svc.close()
+
+
+def test_dead_worker_without_spawn_keeps_failing():
+    svc = ShardedPipelineService(None, "H1", 15, [dead_worker(), start_worker()[0]])
+    for hours in (1, 2):
+        with pytest.raises(RuntimeError, match="shard 0"):
+            run(svc, hours=hours)
+    svc.close()
+
+
+def test_replies_to_other_cycles_are_dropped():
+    svc, workers = sharded(1)
+    stale = {"signals": {"SYM000": (-1.0, 1.0)}, "stage_stats": {}, "degraded": False, "skipped": []}
+    workers[0][1].send(("ok", 0, stale))
+    result = run(svc, hours=3)
+    assert {sig.signed for sig in result.signals_by_symbol.values()} == {3.0}
+    svc.close()
+
+
+def test_hung_worker_is_bounded_by_reply_timeout():
+    hung_parent, hung_child = Pipe()  # nobody serves this end
+    ok_parent, _ = start_worker()
+    svc = ShardedPipelineService(None, "H1", 15, [ok_parent, hung_parent], reply_timeout=0.2)
+    t = time.monotonic()
+    with pytest.raises(RuntimeError, match="no reply in time"):
+        run(svc, hours=1)
+    assert time.monotonic() - t < 2.0
+    # Late reply after the cycle gave up: never read as a later cycle's answer.
+    hung_child.send(("ok", 1, {"signals": {}, "stage_stats": {}, "degraded": False, "skipped": []}))
+    with pytest.raises(RuntimeError, match="worker unavailable"):
+        run(svc, hours=2)
+    svc.close()
+
+
+def test_hung_worker_is_bounded_by_cycle_deadline():
+    hung_parent, _ = Pipe()
+    svc = ShardedPipelineService(None, "H1", 15, [hung_parent], reply_timeout=None, grace_seconds=0.1)
+    t = time.monotonic()
+    with pytest.raises(RuntimeError, match="no reply in time"):
+        svc.run(SYMBOLS, PortfolioSnapshot(equity=1.0, positions={}), CONFIG, observability=OBS, as_of=T0, deadline=time.monotonic() + 0.1)
+    assert time.monotonic() - t < 2.0
+    svc.close()
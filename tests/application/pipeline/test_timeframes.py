@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from tycherion.adapters.observability.noop.noop_observability import NoopObservability
+from tycherion.application.pipeline.config import PipelineConfig, PipelineStageConfig
+from tycherion.application.pipeline.indicator_store import IndicatorResultStore
+from tycherion.application.pipeline.service import ModelPipelineService
+from tycherion.domain.portfolio.entities import PortfolioSnapshot
+from tycherion.domain.signals.entities import IndicatorOutput, ModelDecision
+from tycherion.domain.signals.indicators.base import BaseIndicator
+from tycherion.domain.signals.models.base import SignalModel
+
+OBS = NoopObservability()
+AS_OF = datetime(2024, 1, 10, tzinfo=timezone.utc)
+
+
+class M15Bars:
+    """400 M15 bars (100 hours) per symbol, whatever timeframe is asked."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def get_bars(self, symbol, timeframe, start, end):
+        self.calls.append(timeframe)
+        n = 400
+        close = 100.0 + np.arange(n, dtype=np.float64)
+        return pd.DataFrame(
+            {
+                "time": pd.date_range(end=pd.Timestamp(end) - pd.Timedelta(minutes=15), periods=n, freq="15min"),
+                "open": close,
+                "high": close + 1.0,
+                "low": close - 1.0,
+                "close": close,
+                "tick_volume": np.full(n, 10),
+                "spread": np.full(n, 1),
+                "real_volume": np.zeros(n),
+            }
+        )
+
+
+class RowCount(BaseIndicator):
+    """Reports how many bars it was given as `features["rows"]`."""
+
+    def __init__(self, key: str, timeframe: str | None) -> None:
+        self.key = key
+        self.method = "rows"
+        self.timeframe = timeframe
+
+    def compute(self, df: pd.DataFrame) -> IndicatorOutput:
+        return IndicatorOutput(score=0.0, features={"rows": float(len(df))})
+
+
+class Recorder(SignalModel):
+    name = "recorder"
+
+    def __init__(self) -> None:
+        self.bundles: list[Dict[str, IndicatorOutput]] = []
+
+    def requires(self) -> set[str]:
+        return {"default_tf", "fine_tf"}
+
+    def decide(self, indicators: Dict[str, IndicatorOutput]) -> ModelDecision:
+        self.bundles.append(dict(indicators))
+        return ModelDecision(side="HOLD", weight=0.0, confidence=0.0)
+
+
+def run(store: IndicatorResultStore | None = None):
+    indicators = {"default_tf": RowCount("default_tf", None), "fine_tf": RowCount("fine_tf", "M15")}
+    model = Recorder()
+    data = M15Bars()
+    svc = ModelPipelineService(
+        market_data=data,
+        model_registry={"recorder": model},
+        indicator_picker=lambda key, playbook: indicators[key],
+        timeframe="H1",
+        lookback_days=5,
+        indicator_store=store,
+    )
+    svc.run(
+        ["AAA", "BBB"],
+        PortfolioSnapshot(equity=1000.0, positions={}),
+        PipelineConfig(stages=[PipelineStageConfig("recorder")]),
+        observability=OBS,
+        as_of=AS_OF,
+    )
+    return model, data
+
+
+def test_default_timeframe_is_the_pipeline_timeframe_not_the_fetched_one():
+    model, data = run()
+    # One M15 fetch per symbol; H1 is resampled from it.
+    assert data.calls == ["M15", "M15"]
+    for bundle in model.bundles:
+        assert bundle["fine_tf"].features["rows"] == 400
+        assert bundle["default_tf"].features["rows"] == 100
+
+
+def test_indicator_store_keys_results_by_resolved_timeframe():
+    store = IndicatorResultStore()
+    run(store)
+    model, _ = run(store)
+    assert store.hits == 4
+    for bundle in model.bundles:
+        assert bundle["default_tf"].features["rows"] == 100
+    assert {key[1] for key in store._current} == {"H1", "M15"}
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import pytest
+
+from tycherion.application.plugins import registry
+
+
+def per_call_lookup(key, playbook):
+    """Resolution as done on every call before the table: playbook tag, then
+    the "default" tag, then DEFAULT_METHOD, else the first registered."""
+    candidates = list(registry.INDICATORS.get(key, []))
+    if not candidates:
+        raise KeyError(key)
+    if playbook:
+        tagged = [ind for ind in candidates if playbook in getattr(ind, "tags", set())]
+        if tagged:
+            candidates = tagged
+    defaults = [ind for ind in candidates if "default" in getattr(ind, "tags", set())]
+    if defaults:
+        candidates = defaults
+    method = registry.DEFAULT_METHOD.get(key)
+    if method:
+        for ind in candidates:
+            if getattr(ind, "method", None) == method:
+                return ind
+    return candidates[0]
+
+
+@pytest.fixture
+def empty_registry(monkeypatch):
+    monkeypatch.setattr(registry, "INDICATORS", {})
+    monkeypatch.setattr(registry, "DEFAULT_METHOD", {})
+    monkeypatch.setattr(registry, "_RESOLUTION", None)
+
+
+def register(key, method, tags):
+    cls = type(f"{key}_{method}", (), {})
+    registry.register_indicator(key=key, method=method, tags=set(tags))(cls)
+    return registry.INDICATORS[key][-1]
+
+
+def assert_parity(playbooks):
+    for key in registry.INDICATORS:
+        for playbook in playbooks:
+            assert registry.pick_indicator_for(key, playbook) is per_call_lookup(key, playbook), (key, playbook)
+
+
+@pytest.mark.usefixtures("empty_registry")
+def test_table_matches_per_call_lookup_for_playbook_default_and_fallback():
+    register("trend", "first", {"slow"})
+    register("trend", "dflt", {"default"})
+    register("trend", "fast_a", {"fast"})
+    register("trend", "fast_b", {"fast", "default"})
+    register("trend", "both", {"fast", "slow"})
+    register("vol", "atr", set())
+    register("vol", "std", {"calm"})
+    registry.set_default_indicator_method("vol", "std")
+    registry.set_default_indicator_method("trend", "both")
+
+    assert_parity([None, "", "slow", "fast", "calm", "default", "unknown"])
+    # Spot checks: playbook tag wins, then "default", then DEFAULT_METHOD.
+    assert registry.pick_indicator_for("trend", "fast").method == "fast_b"
+    assert registry.pick_indicator_for("trend", "slow").method == "both"
+    assert registry.pick_indicator_for("trend", None).method == "dflt"
+    assert registry.pick_indicator_for("vol", "unknown").method == "std"
+
+
+@pytest.mark.usefixtures("empty_registry")
+def test_unknown_key_raises():
+    register("trend", "only", set())
+
+    with pytest.raises(KeyError):
+        registry.pick_indicator_for("missing", "fast")
+
+
+@pytest.mark.usefixtures("empty_registry")
+def test_register_after_compile_invalidates_table():
+    register("trend", "first", set())
+    registry.compile_indicator_resolution()
+    assert registry.pick_indicator_for("trend", "fast").method == "first"
+
+    register("trend", "fast", {"fast"})
+
+    assert registry._RESOLUTION is None
+    assert registry.pick_indicator_for("trend", "fast").method == "fast"
+    assert registry.pick_indicator_for("trend").method == "first"
+
+
+@pytest.mark.usefixtures("empty_registry")
+def test_set_default_after_compile_invalidates_table():
+    register("trend", "first", set())
+    register("trend", "second", set())
+    assert registry.pick_indicator_for("trend").method == "first"
+
+    registry.set_default_indicator_method("trend", "second")
+
+    assert registry._RESOLUTION is None
+    assert registry.pick_indicator_for("trend").method == "second"
+    assert_parity([None, "x"])
+
+
+def test_discovered_plugins_match_per_call_lookup():
+    registry.auto_discover(observability=None)
+    tags = {tag for impls in registry.INDICATORS.values() for ind in impls for tag in ind.tags}
+
+    assert registry.INDICATORS
+    assert_parity([None, "unknown", *sorted(tags)])
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from tycherion.application.market_data.cache import CachingMarketData
+from tycherion.application.replay.snapshot import CycleSnapshot, RecordingMarketData, SnapshotMarketData
+from tycherion.domain.market.columns import RATES_DTYPE, BarColumns
+
+AS_OF = datetime(2024, 1, 10, tzinfo=timezone.utc)
+
+
+class Rates:
+    """Hourly MT5-style rates; counts calls per method."""
+
+    def __init__(self):
+        self.calls = {"get_bars": 0, "get_bar_columns": 0}
+
+    def _rates(self, start, end):
+        lo = int(pd.Timestamp(start).ceil("h").timestamp())
+        hi = int(pd.Timestamp(end).timestamp())
+        rates = np.zeros((hi - lo) // 3600 + 1, dtype=RATES_DTYPE)
+        rates["time"] = np.arange(lo, hi + 1, 3600)
+        rates["close"] = np.linspace(100.0, 110.0, len(rates))
+        rates["tick_volume"] = 10
+        return rates
+
+    def get_bar_columns(self, symbol, timeframe, start, end):
+        self.calls["get_bar_columns"] += 1
+        if symbol == "BAD":
+            raise RuntimeError("no rates")
+        return BarColumns(self._rates(start, end))
+
+    def get_bars(self, symbol, timeframe, start, end):
+        self.calls["get_bars"] += 1
+        return BarColumns(self._rates(start, end)).to_frame()
+
+
+def test_recorded_columns_save_and_replay_as_frames(tmp_path):
+    snapshot = CycleSnapshot(as_of=AS_OF, timeframe="H1", lookback_days=2)
+    recording = RecordingMarketData(Rates(), snapshot)
+
+    bars = recording.get_bar_columns("A", "h1", AS_OF - timedelta(days=2), AS_OF)
+    try:
+        recording.get_bar_columns("BAD", "H1", AS_OF - timedelta(days=2), AS_OF)
+    except RuntimeError:
+        pass
+
+    assert isinstance(bars, BarColumns) and snapshot.bars[("A", "H1")] is bars
+    assert ("BAD", "H1") in snapshot.bar_errors
+
+    loaded = CycleSnapshot.load(snapshot.save(tmp_path / "cycle.npz"))
+    replayed = SnapshotMarketData(loaded).get_bars("A", "H1", AS_OF - timedelta(days=2), AS_OF)
+    pd.testing.assert_frame_equal(replayed, bars.to_frame(), check_dtype=False)
+    # Served from memory too, still as a frame.
+    assert isinstance(SnapshotMarketData(snapshot).get_bars("A", "H1", AS_OF, AS_OF), pd.DataFrame)
+
+
+def test_pipeline_fetches_columns_through_recording_and_cache():
+    from tycherion.adapters.observability.noop.noop_observability import NoopObservability
+    from tycherion.application.pipeline.config import PipelineConfig, PipelineStageConfig
+    from tycherion.application.pipeline.service import ModelPipelineService
+    from tycherion.domain.portfolio.entities import PortfolioSnapshot
+    from tycherion.domain.signals.entities import IndicatorOutput, ModelDecision
+    from tycherion.domain.signals.indicators.base import BaseIndicator
+    from tycherion.domain.signals.models.base import SignalModel
+
+    class Last(BaseIndicator):
+        key, method = "last", "close"
+
+        def compute(self, df):
+            return IndicatorOutput(score=float(np.asarray(df["close"])[-1]) / 1000.0, features={})
+
+    class Follow(SignalModel):
+        def requires(self):
+            return {"last"}
+
+        def decide(self, indicators):
+            return ModelDecision(side="BUY", weight=indicators["last"].score, confidence=1.0)
+
+    rates = Rates()
+    snapshot = CycleSnapshot(as_of=AS_OF, timeframe="H1", lookback_days=2)
+    service = ModelPipelineService(
+        market_data=RecordingMarketData(CachingMarketData(rates), snapshot),
+        model_registry={"follow": Follow()},
+        indicator_picker=lambda key, playbook: Last(),
+        timeframe="H1",
+        lookback_days=2,
+    )
+
+    result = service.run(
+        ["A", "B"],
+        PortfolioSnapshot(equity=1000.0, positions={}),
+        PipelineConfig(stages=[PipelineStageConfig("follow")]),
+        observability=NoopObservability(),
+        as_of=AS_OF,
+    )
+
+    assert set(result.signals_by_symbol) == {"A", "B"}
+    assert rates.calls["get_bars"] == 0 and rates.calls["get_bar_columns"] >= 2
+    assert all(isinstance(bars, BarColumns) for bars in snapshot.bars.values())
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from tycherion.application.replay.snapshot import prune_snapshots
+
+
+def make(tmp_path, count, size=100):
+    paths = []
+    for k in range(count):
+        p = tmp_path / f"cycle-20240110T{k:02d}0000000000Z.npz"
+        p.write_bytes(b"x" * size)
+        paths.append(p)
+    return paths
+
+
+def test_keep_last_deletes_oldest(tmp_path):
+    paths = make(tmp_path, 5)
+    (tmp_path / "notes.txt").write_text("kept")
+
+    removed = prune_snapshots(tmp_path, keep_last=2)
+
+    assert removed == paths[:3]
+    assert sorted(tmp_path.glob("cycle-*.npz")) == paths[3:]
+    assert (tmp_path / "notes.txt").exists()
+
+
+def test_max_bytes_deletes_oldest_until_under_cap(tmp_path):
+    paths = make(tmp_path, 5, size=100)
+
+    removed = prune_snapshots(tmp_path, max_bytes=250)
+
+    assert removed == paths[:3]
+
+
+def test_newest_is_always_kept(tmp_path):
+    paths = make(tmp_path, 3, size=100)
+
+    prune_snapshots(tmp_path, keep_last=0, max_bytes=10)
+
+    assert sorted(tmp_path.glob("cycle-*.npz")) == paths[-1:]
+
+
+def test_no_limits_keep_everything(tmp_path):
+    make(tmp_path, 4)
+
+    assert prune_snapshots(tmp_path) == []
+    assert len(list(tmp_path.glob("cycle-*.npz"))) == 4
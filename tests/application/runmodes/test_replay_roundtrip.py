@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import _fakes
+
+from tycherion.adapters.observability.noop.noop_observability import NoopObservability
+from tycherion.application.plugins import registry
+from tycherion.application.pipeline.service import ModelPipelineService
+from tycherion.application.replay.snapshot import CycleSnapshot, SnapshotMarketData
+from tycherion.application.runmodes import live_multimodel
+from tycherion.application.runmodes.replay import run_replay
+from tycherion.shared.config import AppConfig
+
+OBS = NoopObservability()
+
+
+class Capturing(ModelPipelineService):
+    """Pipeline service that keeps every run's signals."""
+
+    runs: list = []
+
+    def run(self, **kwargs):
+        result = ModelPipelineService.run(self, **kwargs)
+        Capturing.runs.append(result.signals_by_symbol)
+        return result
+
+
+class Trader:
+    def __init__(self):
+        self.sent = []
+
+    def market_buy(self, symbol, volume):
+        self.sent.append((symbol, "BUY", volume))
+        return "ok"
+
+    def market_sell(self, symbol, volume):
+        self.sent.append((symbol, "SELL", volume))
+        return "ok"
+
+
+class Account:
+    def equity(self):
+        return 100_000.0
+
+    def positions(self):
+        return list(_fakes.portfolio(_fakes.symbols(3)).positions.values())
+
+
+def service(market_data):
+    return Capturing(
+        market_data=market_data,
+        model_registry=registry.MODELS,
+        indicator_picker=registry.pick_indicator_for,
+        timeframe="H1",
+        lookback_days=15,
+        playbook="default",
+    )
+
+
+def test_recorded_cycle_replays_to_same_signals_and_orders(tmp_path, monkeypatch):
+    registry.auto_discover(observability=OBS)
+    monkeypatch.setattr(live_multimodel, "symbol_min_volume", lambda symbol: 0.01)
+    Capturing.runs = []
+    cfg = AppConfig.model_validate(
+        {
+            "timeframe": "H1",
+            "lookback_days": 15,
+            "application": {
+                "coverage": {"source": "static", "symbols": _fakes.symbols(30)},
+                "models": {"pipeline": ["trend_following", "mean_reversion"]},
+                "portfolio": {"threshold_weight": 0.01},
+                "snapshot": {"enabled": True, "dir": str(tmp_path)},
+            },
+        }
+    )
+    trader = Trader()
+
+    live_multimodel.run_live_multimodel(
+        cfg, trader, Account(), None, service(_fakes.FakeMarketData()), observability=OBS
+    )
+    files = sorted(tmp_path.glob("cycle-*.npz"))
+    assert len(files) == 1 and trader.sent
+
+    snapshot = CycleSnapshot.load(files[0])
+    orders = run_replay(cfg, snapshot, service(SnapshotMarketData(snapshot)), observability=OBS)
+
+    live_signals, replay_signals = Capturing.runs
+    assert replay_signals == live_signals
+    assert [(o.symbol, o.side.upper(), o.volume) for o in orders] == trader.sent
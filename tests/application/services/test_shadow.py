@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+from tycherion.application.services.order_planner import SuggestedOrder
+from tycherion.application.services.shadow import CycleOutcome, compare_outcomes
+from tycherion.domain.portfolio.entities import RebalanceInstruction, Signal, TargetAllocation
+
+
+def outcome(signed, weights=None, plan=(), orders=()):
+    return CycleOutcome(
+        signals={s: Signal(symbol=s, signed=v, confidence=1.0) for s, v in signed.items()},
+        allocation=TargetAllocation(weights=dict(weights or {})),
+        plan=list(plan),
+        orders=list(orders),
+    )
+
+
+def test_identical_outcomes_agree_fully():
+    a = outcome({"A": 0.5, "B": -0.2, "C": 0.0}, {"A": 0.6, "B": -0.4}, orders=[SuggestedOrder("A", "BUY", 1.0)])
+
+    m = compare_outcomes(a, a)
+
+    assert m["sign_agreement"] == 1.0
+    assert m["signal_mean_abs_diff"] == 0.0
+    assert m["weight_l1"] == 0.0
+    assert m["order_overlap"] == 1.0
+    assert m["signals_count"] == 3.0 and m["nonzero_signals"] == 2.0
+
+
+def test_signal_metrics_cover_symbols_active_in_either_run():
+    primary = outcome({"A": 0.5, "B": -0.2, "C": 0.0})
+    # A flips, B agrees, C becomes active, D exists only in the shadow.
+    shadow = outcome({"A": -0.5, "B": -0.4, "C": 0.3, "D": 0.1})
+
+    m = compare_outcomes(primary, shadow)
+
+    assert m["sign_agreement"] == pytest.approx(1 / 4)
+    assert m["signal_mean_abs_diff"] == pytest.approx((1.0 + 0.2 + 0.3 + 0.1) / 4)
+
+
+def test_no_active_signals_counts_as_agreement():
+    m = compare_outcomes(outcome({"A": 0.0}), outcome({"A": 0.0}))
+
+    assert m["sign_agreement"] == 1.0 and m["signal_mean_abs_diff"] == 0.0
+
+
+def test_weights_turnover_and_orders():
+    primary = outcome(
+        {},
+        {"A": 0.5, "B": 0.5},
+        orders=[SuggestedOrder("A", "BUY", 1.0), SuggestedOrder("B", "SELL", 1.0)],
+    )
+    shadow = outcome(
+        {},
+        {"A": 0.25, "C": -0.25},
+        plan=[RebalanceInstruction("A", 0.0, 0.25, 0.25, "BUY"), RebalanceInstruction("C", 0.0, -0.25, -0.25, "SELL")],
+        orders=[SuggestedOrder("A", "buy", 1.0), SuggestedOrder("C", "SELL", 1.0)],
+    )
+
+    m = compare_outcomes(primary, shadow)
+
+    assert m["weight_l1"] == pytest.approx(0.25 + 0.5 + 0.25)
+    assert m["turnover"] == pytest.approx(0.5)
+    assert m["orders_count"] == 2.0
+    # A matches on side (case-insensitive); B and C are ordered by one run only.
+    assert m["order_overlap"] == pytest.approx(1 / 3)
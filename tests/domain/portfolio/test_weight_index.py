@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from tycherion.domain.portfolio.entities import PortfolioSnapshot, Position
+
+
+def per_position_weight(equity, positions, symbol):
+    """Weight as computed before the index: one position at a time."""
+    pos = positions.get(symbol)
+    if not pos or equity <= 0:
+        return 0.0
+    return float(pos.quantity * pos.price) / float(equity)
+
+
+POSITIONS = {
+    "LONG": Position(symbol="LONG", quantity=10.0, price=12.5),
+    "SHORT": Position(symbol="SHORT", quantity=-3.0, price=40.0),
+    "FLAT": Position(symbol="FLAT", quantity=0.0, price=99.0),
+}
+QUERY = ["SHORT", "MISSING", "LONG", "FLAT", "LONG"]
+
+
+@pytest.mark.parametrize("equity", [1000.0, 250.0, 0.0, -50.0])
+def test_weights_match_per_position_formula(equity):
+    snap = PortfolioSnapshot(equity=equity, positions=dict(POSITIONS))
+    expected = [per_position_weight(equity, POSITIONS, s) for s in QUERY]
+
+    assert snap.weights_for(QUERY).tolist() == pytest.approx(expected)
+    assert [snap.weight_of(s) for s in QUERY] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("equity", [1000.0, 0.0, -50.0])
+def test_gross_and_net_match_per_position_sums(equity):
+    index = PortfolioSnapshot(equity=equity, positions=dict(POSITIONS)).weight_index
+    exposure = [p.quantity * p.price for p in POSITIONS.values()]
+
+    assert index.gross_exposure == pytest.approx(sum(abs(x) for x in exposure))
+    assert index.net_exposure == pytest.approx(sum(exposure))
+    if equity > 0:
+        assert index.gross_weight == pytest.approx(sum(abs(x) for x in exposure) / equity)
+        assert index.net_weight == pytest.approx(sum(exposure) / equity)
+    else:
+        assert index.gross_weight == 0.0 and index.net_weight == 0.0
+
+
+def test_empty_portfolio():
+    snap = PortfolioSnapshot(equity=1000.0, positions={})
+
+    assert len(snap.weight_index) == 0
+    assert snap.weights_for(["A", "B"]).tolist() == [0.0, 0.0]
+    assert snap.weights_for([]).dtype == np.float64
+
+
+def test_snapshot_is_read_only_and_not_tied_to_the_caller_dict():
+    positions = dict(POSITIONS)
+    snap = PortfolioSnapshot(equity=1000.0, positions=positions)
+
+    positions["NEW"] = Position(symbol="NEW", quantity=1.0, price=1.0)
+    with pytest.raises(TypeError):
+        snap.positions["NEW"] = positions["NEW"]
+    with pytest.raises(AttributeError):
+        snap.equity = 1.0
+
+    assert "NEW" not in snap.positions and snap.weight_of("NEW") == 0.0
+
+
+def test_pickle_round_trip_rebuilds_the_index():
+    snap = PortfolioSnapshot(equity=1000.0, positions=dict(POSITIONS))
+
+    back = pickle.loads(pickle.dumps(snap))
+
+    assert back == snap
+    assert back.weights_for(QUERY).tolist() == snap.weights_for(QUERY).tolist()